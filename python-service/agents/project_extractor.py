@@ -11,14 +11,17 @@ The extracted data is structured for insertion into the shark_* tables.
 
 import os
 import json
+import asyncio
+import hashlib
 import logging
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from openai import AsyncOpenAI
 from pydantic import BaseModel, Field, ValidationError
 
 from utils.prompt_loader import load_prompt
+from utils.normalization import url_canonicalize
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -26,6 +29,15 @@ logger = logging.getLogger(__name__)
 # Initialize OpenAI client
 openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
+# Lifetime of a cached LLM response (see ExtractionCache)
+EXTRACTION_CACHE_TTL = timedelta(days=7)
+
+# Version of the extraction contract (prompt + output models). Bump it when
+# ExtractedProject / ExtractedOrganization / ExtractedNews or the way the
+# response is parsed changes: cached responses of other versions are then
+# ignored, and can be purged with ExtractionCache.invalidate.
+PROMPT_VERSION = "v1"
+
 
 # ============================================================
 # Output Models (Pydantic for validation)
@@ -77,6 +89,122 @@ class ExtractionResult(BaseModel):
     raw_response: Optional[str] = None
 
 
+# ============================================================
+# Extraction Cache
+# ============================================================
+
+def extraction_cache_key(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    prompts: Dict[str, str],
+    prompt_version: str = PROMPT_VERSION
+) -> str:
+    """
+    Content address of an LLM extraction call.
+
+    SHA-256 over the prompt version, the call parameters and the rendered
+    prompts: the same article sent with the same prompt template and
+    variables gives the same key, and any change to the template, the
+    article or PROMPT_VERSION gives a new one. Each field is prefixed
+    with its length (8 bytes), so no two field lists hash the same input.
+    """
+    digest = hashlib.sha256()
+    for field in (prompt_version, model, str(temperature), str(max_tokens),
+                  prompts["system"], prompts["user"]):
+        data = field.encode()
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Cached extractions, stored in shark_extraction_cache.
+
+    The table holds two kinds of entries, told apart by prompt_version:
+    - raw LLM responses of ProjectExtractor (PROMPT_VERSION, e.g. "v1"),
+      parsed again on a hit so parser fixes apply to them too
+    - parsed ProjectExtractionResult JSON of
+      services.shark_ingestion_service (EXTRACTION_CACHE_VERSION,
+      "ingestion-..."), validated again on a hit
+    The version is hashed into the key, so the two never share an entry.
+
+    Entries are kept for EXTRACTION_CACHE_TTL; one that no longer parses is
+    evicted. Cache errors are logged and treated as misses: they never fail
+    an extraction.
+    """
+
+    def __init__(self, supabase_client: Any, ttl: timedelta = EXTRACTION_CACHE_TTL):
+        self.supabase = supabase_client
+        self.ttl = ttl
+
+    async def get(self, cache_key: str) -> Optional[str]:
+        """Cached raw response for the key, or None."""
+        try:
+            result = await asyncio.to_thread(
+                self.supabase.table("shark_extraction_cache").select("response").eq(
+                    "cache_key", cache_key
+                ).gt("expires_at", datetime.now(timezone.utc).isoformat()).limit(1).execute
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache read failed: {e}")
+            return None
+        return result.data[0]["response"] if result.data else None
+
+    async def put(
+        self,
+        cache_key: str,
+        model: str,
+        response: str,
+        prompt_version: str = PROMPT_VERSION
+    ) -> None:
+        """Store a raw response under the key (replacing an expired one)."""
+        now = datetime.now(timezone.utc)
+        try:
+            await asyncio.to_thread(
+                self.supabase.table("shark_extraction_cache").upsert({
+                    "cache_key": cache_key,
+                    "model": model,
+                    "prompt_version": prompt_version,
+                    "response": response,
+                    "created_at": now.isoformat(),
+                    "expires_at": (now + self.ttl).isoformat()
+                }, on_conflict="cache_key").execute
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+
+    async def evict(self, cache_key: str) -> None:
+        """Remove the response stored under the key."""
+        try:
+            await asyncio.to_thread(
+                self.supabase.table("shark_extraction_cache").delete().eq(
+                    "cache_key", cache_key
+                ).execute
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache eviction failed: {e}")
+
+    async def invalidate(self, prompt_version: str) -> int:
+        """
+        Remove every response produced under a prompt version.
+
+        Args:
+            prompt_version: Version to purge (e.g. the previous PROMPT_VERSION)
+
+        Returns:
+            Number of entries removed
+        """
+        result = await asyncio.to_thread(
+            self.supabase.table("shark_extraction_cache").delete().eq(
+                "prompt_version", prompt_version
+            ).execute
+        )
+        logger.info(f"Invalidated {len(result.data)} cached extractions ({prompt_version})")
+        return len(result.data)
+
+
 # ============================================================
 # Project Extractor Agent
 # ============================================================
@@ -98,11 +226,13 @@ class ProjectExtractor:
         self,
         model: str = "gpt-4o",
         temperature: float = 0.1,
-        max_tokens: int = 2000
+        max_tokens: int = 2000,
+        cache: Optional[ExtractionCache] = None
     ):
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache
 
     async def extract(
         self,
@@ -126,18 +256,36 @@ class ProjectExtractor:
             ExtractionResult with project, organizations, and news data
         """
         try:
-            # Load and render the prompt
+            # Load and render the prompt. The URL is canonicalized, so that
+            # the same article under other tracking parameters gets the same
+            # prompt (and cache key)
             prompts = load_prompt(
                 "project_extractor",
                 variables={
                     "article_text": article_text[:15000],  # Limit text length
-                    "source_url": source_url,
+                    "source_url": url_canonicalize(source_url),
                     "source_name": source_name or "Source inconnue",
                     "region_hint": region_hint,
                     "published_at": published_at
                 }
             )
 
+            # Same article and prompt already extracted: reuse the response
+            cache_key = None
+            if self.cache is not None:
+                cache_key = extraction_cache_key(
+                    self.model, self.temperature, self.max_tokens, prompts
+                )
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    result = self._parse_response(cached, source_url, source_name)
+                    if result.extraction_success:
+                        logger.debug(f"Extraction cache hit: {source_url}")
+                        return result
+                    # No longer matches the output models: extract again
+                    logger.warning(f"Evicting unparsable cached extraction: {source_url}")
+                    await self.cache.evict(cache_key)
+
             # Call the LLM
             response = await openai_client.chat.completions.create(
                 model=self.model,
@@ -154,7 +302,10 @@ class ProjectExtractor:
             logger.debug(f"Raw LLM response: {raw_response}")
 
             # Parse the JSON response
-            return self._parse_response(raw_response, source_url, source_name)
+            result = self._parse_response(raw_response, source_url, source_name)
+            if cache_key is not None and result.extraction_success:
+                await self.cache.put(cache_key, self.model, raw_response)
+            return result
 
         except Exception as e:
             logger.error(f"Extraction failed for {source_url}: {e}")
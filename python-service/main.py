@@ -7,7 +7,7 @@ if sys.platform == 'win32':
     sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 from typing import Optional
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from supabase import create_client, Client
@@ -15,6 +15,7 @@ from supabase.lib.client_options import ClientOptions
 from dotenv import load_dotenv
 import base64
 import json
+import hashlib
 from agent_graph import app_graph
 from privacy_guard import airlock
 from api.shark_api import router as shark_router
@@ -46,6 +47,13 @@ app.add_middleware(
 # Include Shark Hunter API router
 app.include_router(shark_router)
 
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close shared HTTP clients kept alive between requests."""
+    from services.shark_boamp_service import close_http_client
+    await close_http_client()
+
 # Supabase client
 url: str = os.environ.get("SUPABASE_URL")
 key: str = os.environ.get("SUPABASE_SERVICE_KEY")
@@ -1306,6 +1314,8 @@ async def shark_ingest_article(request: SharkIngestArticleRequest):
             "project_id": result.project_id,
             "news_id": result.news_id,
             "organization_ids": result.organization_ids,
+            "is_duplicate": result.is_duplicate,
+            "already_ingested": result.already_ingested,
             "error_message": result.error_message,
             "extraction": {
                 "project": result.extraction_result.project.model_dump() if result.extraction_result and result.extraction_result.project else None,
@@ -1346,14 +1356,16 @@ async def shark_batch_ingest(request: SharkBatchIngestRequest):
         )
 
         # Build summary
-        success_count = sum(1 for r in results if r.success and r.project_id)
-        no_project_count = sum(1 for r in results if r.success and not r.project_id)
+        already_ingested_count = sum(1 for r in results if r.success and r.already_ingested)
+        success_count = sum(1 for r in results if r.success and r.project_id and not r.already_ingested)
+        no_project_count = sum(1 for r in results if r.success and not r.project_id and not r.already_ingested)
         error_count = sum(1 for r in results if not r.success)
 
         return {
             "summary": {
                 "total": len(results),
                 "projects_created": success_count,
+                "already_ingested": already_ingested_count,
                 "no_project_found": no_project_count,
                 "errors": error_count
             },
@@ -1362,6 +1374,8 @@ async def shark_batch_ingest(request: SharkBatchIngestRequest):
                     "source_url": request.articles[i].get("source_url", ""),
                     "success": r.success,
                     "project_id": r.project_id,
+                    "is_duplicate": r.is_duplicate,
+                    "already_ingested": r.already_ingested,
                     "error_message": r.error_message
                 }
                 for i, r in enumerate(results)
@@ -1465,8 +1479,24 @@ class SharkOrganizationFilters(BaseModel):
     page_size: int = 20
 
 
+# Project lists are per-tenant data: only the caller's own cache may keep
+# them. Once max-age has passed the client revalidates with If-None-Match
+# and gets a 304 without the body when the list has not changed.
+SHARK_LIST_CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=60"
+
+
+def _json_etag(body: dict) -> str:
+    """Strong ETag of a JSON response body."""
+    digest = hashlib.blake2b(
+        json.dumps(body, sort_keys=True, default=str).encode(), digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
 @app.get("/shark/projects/{tenant_id}")
 async def list_shark_projects(
+    request: Request,
+    response: Response,
     tenant_id: str,
     phase: Optional[str] = None,
     type: Optional[str] = None,
@@ -1478,12 +1508,15 @@ async def list_shark_projects(
     order_by: str = "created_at",
     order_desc: bool = True,
     page: int = 1,
-    page_size: int = 20
+    page_size: int = 20,
+    cursor: Optional[str] = None
 ):
     """
     List Shark projects for a tenant with optional filters.
 
-    Returns paginated list from shark_project_full view.
+    Returns paginated list from shark_projects. Pass the
+    response's next_cursor as `cursor` to fetch the following page
+    without OFFSET (page is then ignored).
     """
     try:
         from services.shark_graph_service import SharkGraphService, ProjectFilters
@@ -1500,12 +1533,13 @@ async def list_shark_projects(
             order_by=order_by,
             order_desc=order_desc,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor
         )
 
         result = await service.list_projects(tenant_id, filters)
 
-        return {
+        body = {
             "items": [
                 {
                     "id": p.id,
@@ -1527,9 +1561,20 @@ async def list_shark_projects(
             "total_count": result.total_count,
             "page": result.page,
             "page_size": result.page_size,
-            "has_more": result.has_more
+            "has_more": result.has_more,
+            "next_cursor": result.next_cursor
         }
 
+        etag = _json_etag(body)
+        cache_headers = {"ETag": etag, "Cache-Control": SHARK_LIST_CACHE_CONTROL}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=cache_headers)
+        response.headers.update(cache_headers)
+        return body
+
+    except ValueError as e:
+        # Unsupported order_by or invalid cursor
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -1541,7 +1586,7 @@ async def get_shark_project(tenant_id: str, project_id: str):
     """
     Get a full Shark project with organizations and news.
 
-    Uses shark_project_full view for optimal performance.
+    Reads the shark_project_full view (shark_get_project_full function).
     """
     try:
         from services.shark_graph_service import SharkGraphService
@@ -129,7 +129,12 @@ async def process_leads_dry_run(leads: list) -> None:
             print(f"  ✗ Error: {e}")
 
 
-async def process_leads_full(leads: list, tenant_id: str) -> dict:
+async def process_leads_full(
+    leads: list,
+    tenant_id: str,
+    use_cache: bool = True,
+    force_refresh: bool = False
+) -> dict:
     """
     Process leads and ingest into shark_* tables.
 
@@ -140,11 +145,12 @@ async def process_leads_full(leads: list, tenant_id: str) -> dict:
     print(f"INGESTING {len(leads)} leads into shark_* tables")
     print(f"{'='*60}\n")
 
-    service = SharkIngestionService(tenant_id=tenant_id)
+    service = SharkIngestionService(tenant_id=tenant_id, use_cache=use_cache)
     results = {
         "total": len(leads),
         "success": 0,
         "no_project": 0,
+        "already_ingested": 0,
         "errors": 0,
         "details": []
     }
@@ -175,10 +181,21 @@ async def process_leads_full(leads: list, tenant_id: str) -> dict:
                 article_text=article_text,
                 source_url=url,
                 source_name=enrichment.get("source_name"),
-                article_title=enrichment.get("title") or company_name
+                article_title=enrichment.get("title") or company_name,
+                force_refresh=force_refresh
             )
 
-            if result.success and result.project_id:
+            if result.success and result.already_ingested:
+                print(f"  ○ Already ingested: {result.news_id}")
+                results["already_ingested"] += 1
+                results["details"].append({
+                    "lead_id": lead.get("id"),
+                    "url": url,
+                    "status": "already_ingested",
+                    "news_id": result.news_id,
+                    "project_id": result.project_id
+                })
+            elif result.success and result.project_id:
                 print(f"  ✓ Created project: {result.project_id}")
                 results["success"] += 1
                 results["details"].append({
@@ -225,6 +242,7 @@ def print_summary(results: dict) -> None:
     print(f"{'='*60}")
     print(f"Total processed: {results['total']}")
     print(f"Projects created: {results['success']}")
+    print(f"Already ingested: {results['already_ingested']}")
     print(f"No project found: {results['no_project']}")
     print(f"Errors: {results['errors']}")
     print(f"{'='*60}\n")
@@ -237,6 +255,7 @@ async def main():
     parser.add_argument("--limit", type=int, help="Maximum number of leads to process")
     parser.add_argument("--dry-run", action="store_true", help="Extract only, don't save to database")
     parser.add_argument("--include-unenriched", action="store_true", help="Include leads that haven't been enriched")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run the LLM even for articles already extracted")
 
     args = parser.parse_args()
 
@@ -266,7 +285,9 @@ async def main():
     if args.dry_run:
         await process_leads_dry_run(leads)
     else:
-        results = await process_leads_full(leads, args.tenant_id)
+        results = await process_leads_full(
+            leads, args.tenant_id, use_cache=not args.no_cache, force_refresh=args.no_cache
+        )
         print_summary(results)
 
 
@@ -9,10 +9,10 @@ using regex patterns. NO DATA IS SENT TO EXTERNAL APIs.
 - Contextual fields (payment terms): Sent to LLM only AFTER anonymization
 
 Usage:
-    from services.extraction_utils import LocalExtractor, AzureResultMerger
+    from services.extraction_utils import get_default_extractor, AzureResultMerger
 
     # Extract PII locally (no API calls)
-    extractor = LocalExtractor()
+    extractor = get_default_extractor()
     emails = extractor.extract_emails(document_text)
     siret = extractor.extract_siret_siren(document_text)
 
@@ -21,15 +21,38 @@ Usage:
     enhanced = merger.merge(azure_result, local_extractions)
 """
 
+import os
 import re
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def lower_preserving_offsets(text: str, text_lower: Optional[str] = None) -> str:
+    """
+    Return a lowercase copy of text whose offsets match the original.
+
+    Some characters change length when lowercased (e.g. 'İ'); in that
+    rare case fall back to lowercasing char by char so that match
+    positions from the original text still index the same window.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    if len(text_lower) != len(text):
+        text_lower = ''.join(c.lower()[:1] or c for c in text)
+    return text_lower
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -173,14 +196,35 @@ class LocalExtractor:
         ],
     }
 
+    # End markers for an address block
+    ADDRESS_END_MARKERS = [
+        r'\n\s*\n',  # Double newline
+        r'\n[A-Z][^a-z]+:',  # Next section header
+        r'(?:factur|livr|ship|bill|total|montant|tva)',  # Invoice keywords
+    ]
+
     def __init__(self):
-        """Initialize the local extractor."""
+        """
+        Initialize the local extractor.
+
+        All attributes are immutable (tuples of compiled patterns) and the
+        extraction methods keep no per-call state on the instance, so a
+        single extractor can be shared across threads and requests.
+        """
         # Compile regex patterns for performance
-        self._compiled_emails = [re.compile(p, re.IGNORECASE) for p in self.EMAIL_PATTERNS]
-        self._compiled_phones = [re.compile(p) for p in self.PHONE_PATTERNS]
-        self._compiled_siret = [re.compile(p) for p in self.SIRET_SIREN_PATTERNS]
-        self._compiled_vat = [re.compile(p, re.IGNORECASE) for p in self.VAT_PATTERNS]
-        self._compiled_iban = [re.compile(p, re.IGNORECASE) for p in self.IBAN_PATTERNS]
+        self._compiled_emails = tuple(re.compile(p, re.IGNORECASE) for p in self.EMAIL_PATTERNS)
+        self._compiled_phones = tuple(re.compile(p) for p in self.PHONE_PATTERNS)
+        self._compiled_siret = tuple(re.compile(p) for p in self.SIRET_SIREN_PATTERNS)
+        self._compiled_vat = tuple(re.compile(p, re.IGNORECASE) for p in self.VAT_PATTERNS)
+        self._compiled_iban = tuple(re.compile(p, re.IGNORECASE) for p in self.IBAN_PATTERNS)
+        self._compiled_dates = tuple((re.compile(p, re.IGNORECASE), fmt) for p, fmt in self.DATE_PATTERNS)
+        self._compiled_address_keywords = tuple(
+            (addr_type, tuple(re.compile(kw, re.IGNORECASE | re.MULTILINE) for kw in keywords))
+            for addr_type, keywords in self.ADDRESS_KEYWORDS.items()
+        )
+        self._compiled_address_end_markers = tuple(
+            re.compile(p, re.IGNORECASE) for p in self.ADDRESS_END_MARKERS
+        )
 
     # =========================================================================
     # EMAIL EXTRACTION
@@ -244,13 +288,14 @@ class LocalExtractor:
     # SIRET/SIREN EXTRACTION
     # =========================================================================
 
-    def extract_siret_siren(self, text: str) -> List[ExtractedField]:
+    def extract_siret_siren(self, text: str, text_lower: Optional[str] = None) -> List[ExtractedField]:
         """
         Extract SIRET (14 digits) and SIREN (9 digits) numbers.
         Validates using Luhn algorithm for higher confidence.
 
         Args:
             text: Document text to search
+            text_lower: Optional precomputed lowercase text for context checks
 
         Returns:
             List of ExtractedField with SIRET/SIREN numbers
@@ -258,6 +303,7 @@ class LocalExtractor:
         if not text:
             return []
 
+        text_lower = lower_preserving_offsets(text, text_lower)
         results = []
         seen = set()
 
@@ -283,7 +329,8 @@ class LocalExtractor:
                 is_valid_luhn = self._validate_luhn(clean_value)
 
                 # Check context for SIRET/SIREN keywords
-                context = text[max(0, match.start() - 50):min(len(text), match.end() + 20)].lower()
+                s, e = match.span()
+                context = text_lower[s - 50 if s >= 50 else 0:e + 20]
                 has_keyword = any(kw in context for kw in ['siret', 'siren', 'n°', 'numéro', 'numero', 'rcs'])
 
                 # Calculate confidence
@@ -333,12 +380,13 @@ class LocalExtractor:
     # PHONE EXTRACTION
     # =========================================================================
 
-    def extract_phones(self, text: str) -> List[ExtractedField]:
+    def extract_phones(self, text: str, text_lower: Optional[str] = None) -> List[ExtractedField]:
         """
         Extract phone numbers from text (French/International formats).
 
         Args:
             text: Document text to search
+            text_lower: Optional precomputed lowercase text for context checks
 
         Returns:
             List of ExtractedField with phone numbers
@@ -346,6 +394,7 @@ class LocalExtractor:
         if not text:
             return []
 
+        text_lower = lower_preserving_offsets(text, text_lower)
         phones = []
         seen = set()
 
@@ -365,7 +414,8 @@ class LocalExtractor:
                 seen.add(clean_value)
 
                 # Check context for phone-related keywords
-                context = text[max(0, match.start() - 30):min(len(text), match.end() + 20)].lower()
+                s, e = match.span()
+                context = text_lower[s - 30 if s >= 30 else 0:e + 20]
                 has_keyword = any(kw in context for kw in ['tél', 'tel', 'phone', 'mobile', 'portable', 'fax', 'appel'])
 
                 # Calculate confidence
@@ -400,12 +450,13 @@ class LocalExtractor:
     # DATE EXTRACTION
     # =========================================================================
 
-    def extract_dates(self, text: str) -> List[ExtractedField]:
+    def extract_dates(self, text: str, text_lower: Optional[str] = None) -> List[ExtractedField]:
         """
         Extract dates from text in various French/European formats.
 
         Args:
             text: Document text to search
+            text_lower: Optional precomputed lowercase text for context checks
 
         Returns:
             List of ExtractedField with dates
@@ -413,6 +464,7 @@ class LocalExtractor:
         if not text:
             return []
 
+        text_lower = lower_preserving_offsets(text, text_lower)
         dates = []
         seen = set()
 
@@ -424,8 +476,7 @@ class LocalExtractor:
             'novembre': '11', 'décembre': '12', 'decembre': '12'
         }
 
-        for pattern_str, fmt in self.DATE_PATTERNS:
-            pattern = re.compile(pattern_str, re.IGNORECASE)
+        for pattern, fmt in self._compiled_dates:
             for match in pattern.finditer(text):
                 try:
                     if fmt == 'dmy':
@@ -458,7 +509,8 @@ class LocalExtractor:
                         continue
 
                     # Check context for date type
-                    context = text[max(0, match.start() - 50):match.start()].lower()
+                    s = match.start()
+                    context = text_lower[s - 50 if s >= 50 else 0:s]
                     date_type = 'unknown'
                     if any(kw in context for kw in ['facture', 'invoice', 'date', 'du', 'le']):
                         date_type = 'invoice_date'
@@ -499,24 +551,19 @@ class LocalExtractor:
         """
         results = {'billing': None, 'shipping': None, 'vendor': None}
 
-        for addr_type, keywords in self.ADDRESS_KEYWORDS.items():
-            for keyword in keywords:
-                pattern = re.compile(keyword, re.IGNORECASE | re.MULTILINE)
+        for addr_type, patterns in self._compiled_address_keywords:
+            for pattern in patterns:
                 match = pattern.search(text)
 
                 if match:
                     # Extract block after keyword (up to next section or 200 chars)
                     start = match.end()
-                    # Look for end markers
-                    end_markers = [
-                        r'\n\s*\n',  # Double newline
-                        r'\n[A-Z][^a-z]+:',  # Next section header
-                        r'(?:factur|livr|ship|bill|total|montant|tva)',  # Invoice keywords
-                    ]
 
+                    # Look for end markers
                     end = start + 200  # Default max length
-                    for marker in end_markers:
-                        marker_match = re.search(marker, text[start:start + 300], re.IGNORECASE)
+                    window = text[start:start + 300]
+                    for marker in self._compiled_address_end_markers:
+                        marker_match = marker.search(window)
                         if marker_match:
                             end = min(end, start + marker_match.start())
 
@@ -542,11 +589,12 @@ class LocalExtractor:
     # VAT AND IBAN EXTRACTION
     # =========================================================================
 
-    def extract_vat_numbers(self, text: str) -> List[ExtractedField]:
+    def extract_vat_numbers(self, text: str, text_lower: Optional[str] = None) -> List[ExtractedField]:
         """Extract VAT/TVA numbers."""
         if not text:
             return []
 
+        text_lower = lower_preserving_offsets(text, text_lower)
         results = []
         seen = set()
 
@@ -560,7 +608,8 @@ class LocalExtractor:
                 seen.add(clean)
 
                 # Check context
-                context = text[max(0, match.start() - 30):match.end() + 10].lower()
+                s, e = match.span()
+                context = text_lower[s - 30 if s >= 30 else 0:e + 10]
                 has_keyword = any(kw in context for kw in ['tva', 'vat', 'tax', 'intracommunautaire'])
 
                 results.append(ExtractedField(
@@ -639,12 +688,15 @@ class LocalExtractor:
         """
         result = LocalExtractionResult()
 
+        # Lowercase once; extractors slice keyword contexts from this copy
+        text_lower = lower_preserving_offsets(text) if text else None
+
         # Run all extractors
         result.emails = self.extract_emails(text, vendor_name)
-        result.phones = self.extract_phones(text)
-        result.siret_siren = self.extract_siret_siren(text)
-        result.dates = self.extract_dates(text)
-        result.vat_numbers = self.extract_vat_numbers(text)
+        result.phones = self.extract_phones(text, text_lower)
+        result.siret_siren = self.extract_siret_siren(text, text_lower)
+        result.dates = self.extract_dates(text, text_lower)
+        result.vat_numbers = self.extract_vat_numbers(text, text_lower)
         result.ibans = self.extract_ibans(text)
 
         # Extract addresses
@@ -675,6 +727,17 @@ class LocalExtractor:
         return SequenceMatcher(None, str1, str2).ratio()
 
 
+@lru_cache(maxsize=1)
+def get_default_extractor() -> LocalExtractor:
+    """
+    Return the shared LocalExtractor instance.
+
+    Patterns are compiled once per process instead of once per merger or
+    per convenience call. The instance is safe for concurrent use.
+    """
+    return LocalExtractor()
+
+
 # =============================================================================
 # AZURE RESULT MERGER
 # =============================================================================
@@ -697,7 +760,7 @@ class AzureResultMerger:
             confidence_threshold: Minimum Azure confidence to keep a field
         """
         self.confidence_threshold = confidence_threshold
-        self.local_extractor = LocalExtractor()
+        self.local_extractor = get_default_extractor()
 
     def merge(self, azure_result: Dict[str, Any],
               document_text: str,
@@ -792,83 +855,355 @@ class SafeLLMExtractor:
     def __init__(self):
         """Initialize the safe LLM extractor."""
         # Import here to avoid circular imports
-        from services.privacy import PrivacyAirlock, sanitize_for_llm
-        self.privacy_airlock = PrivacyAirlock()
+        from services.privacy import get_airlock, sanitize_for_llm
+        self.privacy_airlock = get_airlock()
         self.sanitize = sanitize_for_llm
 
+    SYSTEM_PROMPT = "You extract payment terms from invoices. Return only valid JSON."
+
+    PAYMENT_FIELDS = """- payment_days: number of days for payment (e.g., 30)
+- payment_method: method mentioned (e.g., "bank transfer", "check")
+- discount_early: early payment discount if mentioned (e.g., "2% if paid within 10 days")
+- late_penalty: late payment penalty if mentioned
+"""
+
     def extract_payment_terms(self, document_text: str) -> Optional[Dict[str, Any]]:
         """
         Extract payment terms using LLM (with anonymized text).
 
+        Standard phrasings ("30 jours", "net 45") are resolved locally first;
+        the LLM is only called when the regex fast path misses.
+
+        Args:
+            document_text: Raw document text
+
+        Returns:
+            Dict with payment_days, payment_method, etc.
+        """
+        fast = self._fast_payment_terms(document_text)
+        if fast:
+            return fast
+
+        payment_section = self._prepare_payment_section(document_text)
+        if not payment_section:
+            return None
+
+        chain = self._get_chain()
+        if chain is None:
+            return None
+
+        try:
+            return chain.invoke(self._build_messages(self._build_prompt(payment_section)))
+
+        except Exception as e:
+            logger.error(f"LLM extraction failed: {e}")
+            return None
+
+    async def extract_payment_terms_async(self, document_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of extract_payment_terms (non-blocking LLM call).
+
         Args:
             document_text: Raw document text
 
         Returns:
             Dict with payment_days, payment_method, etc.
         """
+        fast = self._fast_payment_terms(document_text)
+        if fast:
+            return fast
+
+        payment_section = self._prepare_payment_section(document_text)
+        if not payment_section:
+            return None
+
+        chain = self._get_chain()
+        if chain is None:
+            return None
+
+        try:
+            return await chain.ainvoke(self._build_messages(self._build_prompt(payment_section)))
+
+        except Exception as e:
+            logger.error(f"LLM extraction failed: {e}")
+            return None
+
+    async def extract_payment_terms_batch(
+        self,
+        document_texts: List[str],
+        max_concurrency: int = 16
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract payment terms for many documents with concurrent LLM calls.
+
+        Args:
+            document_texts: Raw document texts
+            max_concurrency: Max LLM requests in flight (rate limiting)
+
+        Returns:
+            One result (or None) per document, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_with_semaphore(text: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.extract_payment_terms_async(text)
+
+        return await asyncio.gather(*[extract_with_semaphore(text) for text in document_texts])
+
+    async def extract_payment_terms_grouped(
+        self,
+        document_texts: List[str],
+        group_size: int = 10,
+        max_concurrency: int = 4
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract payment terms for many documents, several per LLM request.
+
+        Payment sections are numbered and sent together; the LLM returns a
+        JSON array with one object per section, matched back by index.
+
+        Args:
+            document_texts: Raw document texts
+            group_size: Documents per LLM request
+            max_concurrency: Max grouped requests in flight
+
+        Returns:
+            One result (or None) per document, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(document_texts)
+
+        sections: List[Tuple[int, str]] = []
+        for i, text in enumerate(document_texts):
+            fast = self._fast_payment_terms(text)
+            if fast:
+                results[i] = fast
+                continue
+
+            payment_section = self._prepare_payment_section(text)
+            if payment_section:
+                sections.append((i, payment_section))
+
+        if not sections:
+            return results
+
+        chain = self._get_chain()
+        if chain is None:
+            return results
+
+        groups = [sections[i:i + group_size] for i in range(0, len(sections), group_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_group(group: List[Tuple[int, str]]) -> None:
+            async with semaphore:
+                try:
+                    response = await chain.ainvoke(self._build_messages(self._build_grouped_prompt(group)))
+                except Exception as e:
+                    logger.error(f"Grouped LLM extraction failed: {e}")
+                    return
+
+            if not isinstance(response, list):
+                logger.warning("Grouped LLM extraction returned no array")
+                return
+
+            indices = {i for i, _ in group}
+            matched = set()
+            dropped = False
+            for item in response:
+                index = item.get("index") if isinstance(item, dict) else None
+                if isinstance(index, int) and index in indices:
+                    item.pop("index")
+                    results[index] = item
+                    matched.add(index)
+                else:
+                    logger.warning(f"Grouped LLM extraction returned an unmatched item: {item!r}")
+                    dropped = True
+
+            if not dropped:
+                return
+
+            # The dropped item belonged to one of the unmatched documents:
+            # retry those one by one
+            retry = [(i, section) for i, section in group if i not in matched]
+            await asyncio.gather(*[extract_single(i, section) for i, section in retry])
+
+        async def extract_single(index: int, payment_section: str) -> None:
+            async with semaphore:
+                try:
+                    results[index] = await chain.ainvoke(self._build_messages(self._build_prompt(payment_section)))
+                except Exception as e:
+                    logger.error(f"LLM extraction failed: {e}")
+
+        await asyncio.gather(*[extract_group(group) for group in groups])
+        return results
+
+    def _fast_payment_terms(self, document_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve payment terms locally when the wording is standard.
+
+        Only the payment section is inspected. Returns None (LLM fallback)
+        when no day count follows a payment keyword (or exceeds
+        MAX_PAYMENT_DAYS), when the section holds
+        several different day counts (e.g. a delivery delay next to the
+        payment term), or when it mentions an early payment discount or late
+        penalty, which need the LLM to summarize.
+        """
+        section = self._extract_payment_section(document_text[:2000])
+        if not section:
+            return None
+
+        if self.PAYMENT_CLAUSE_PATTERN.search(section):
+            return None
+
+        counts = {a or b for a, b in self.DAY_COUNT_PATTERN.findall(section)}
+        if len(counts) > 1:
+            return None
+
+        match = self.PAYMENT_DAYS_PATTERN.search(section)
+        if not match:
+            return None
+
+        payment_days = int(match.group(match.lastgroup))
+        if payment_days > self.MAX_PAYMENT_DAYS:
+            return None
+
+        method_match = self.PAYMENT_METHOD_PATTERN.search(section)
+        payment_method = None
+        if method_match:
+            payment_method = self.PAYMENT_METHODS[method_match.lastgroup]
+
+        return {
+            'payment_days': payment_days,
+            'payment_method': payment_method,
+            'discount_early': None,
+            'late_penalty': None,
+        }
+
+    def _get_chain(self):
+        """Build the LLM | JSON parser chain, or None if LLM utilities are missing."""
         try:
-            from utils.prompt_loader import load_prompt
             from utils.model_factory import get_model
-            from langchain_core.messages import SystemMessage, HumanMessage
             from langchain_core.output_parsers import JsonOutputParser
         except ImportError:
             logger.warning("LLM utilities not available")
             return None
 
+        try:
+            return get_model("fast") | JsonOutputParser()
+        except Exception as e:
+            logger.error(f"LLM extraction failed: {e}")
+            return None
+
+    def _prepare_payment_section(self, document_text: str) -> Optional[str]:
+        """Anonymize the document and keep only the payment terms section."""
         # 🛡️ ANONYMIZE BEFORE SENDING TO LLM
         clean_text, mappings = self.sanitize(document_text[:2000])
 
         # Extract only the relevant section for payment terms
-        payment_section = self._extract_payment_section(clean_text)
+        return self._extract_payment_section(clean_text)
 
-        if not payment_section:
-            return None
-
-        # Send anonymized text to LLM
-        prompt = f"""Extract payment terms from this invoice text. The text has been anonymized for privacy.
+    def _build_prompt(self, payment_section: str) -> str:
+        """Prompt for a single anonymized payment section."""
+        return f"""Extract payment terms from this invoice text. The text has been anonymized for privacy.
 
 TEXT:
 {payment_section}
 
 Return JSON with:
-- payment_days: number of days for payment (e.g., 30)
-- payment_method: method mentioned (e.g., "bank transfer", "check")
-- discount_early: early payment discount if mentioned (e.g., "2% if paid within 10 days")
-- late_penalty: late payment penalty if mentioned
-"""
+{self.PAYMENT_FIELDS}"""
 
-        try:
-            llm = get_model("fast")
-            parser = JsonOutputParser()
-            chain = llm | parser
+    def _build_grouped_prompt(self, group: List[Tuple[int, str]]) -> str:
+        """Prompt for several numbered anonymized payment sections."""
+        documents = "\n\n".join(f"### DOCUMENT {i}\n{section}" for i, section in group)
+        return f"""Extract payment terms from each invoice text below. The texts have been anonymized for privacy.
 
-            result = chain.invoke([
-                SystemMessage(content="You extract payment terms from invoices. Return only valid JSON."),
-                HumanMessage(content=prompt)
-            ])
+{documents}
 
-            return result
+Return a JSON array with one object per document, each with:
+- index: the DOCUMENT number
+{self.PAYMENT_FIELDS}"""
 
-        except Exception as e:
-            logger.error(f"LLM extraction failed: {e}")
-            return None
+    def _build_messages(self, prompt: str) -> List[Any]:
+        """Wrap a prompt with the system instruction."""
+        from langchain_core.messages import SystemMessage, HumanMessage
 
-    def _extract_payment_section(self, text: str) -> Optional[str]:
-        """Extract the section of text likely containing payment terms."""
-        keywords = [
-            r'paiement', r'payment', r'règlement', r'reglement',
-            r'échéance', r'echeance', r'conditions', r'modalités'
+        return [
+            SystemMessage(content=self.SYSTEM_PROMPT),
+            HumanMessage(content=prompt)
         ]
 
-        for kw in keywords:
-            match = re.search(kw, text, re.IGNORECASE)
-            if match:
-                # Extract 200 chars around the keyword
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 200)
-                return text[start:end]
+    # Keywords announcing a payment terms section (single pass over the text).
+    # Matched against a lowercased copy: cheaper than re.IGNORECASE on accents
+    PAYMENT_SECTION_PATTERN = re.compile(
+        r'paiement|payment|règlement|reglement|échéance|echeance|conditions|modalités'
+    )
+
+    # Keyword windows kept by _extract_payment_section
+    PAYMENT_SECTION_WINDOWS = 3
+    PAYMENT_SECTION_SEPARATOR = "\n---\n"
+
+    # Regex fast path for standard payment wording: the day count must follow
+    # a payment keyword ("paiement à 30 jours", "payment terms: net 45") or
+    # carry a days unit ("net 30 jours", "30 jours net"), so delivery delays
+    # and amounts ("montant net 250 EUR") are not read as terms. A count
+    # followed by decimals or a currency is an amount, never a term
+    _NOT_AMOUNT = r'(?!\s*(?:[.,]\d|€|eur\b|\$))'
+    PAYMENT_DAYS_PATTERN = re.compile(
+        r'\b(?:paiement|payment|r[èe]glement|[ée]ch[ée]ance|terms)\s*:?\s*'
+        r'(?:(?:à|a|at|sous|dans|de|under|within)\s+)?(?P<days>\d{1,3})\s*(?:jours?|days?)\b|'
+        r'\b(?:paiement|payment|r[èe]glement|[ée]ch[ée]ance|terms)\s*:?\s*'
+        r'net\s*(?P<keyword_net_days>\d{1,3})\b' + _NOT_AMOUNT + r'|'
+        r'\bnet\s*(?P<net_days>\d{1,3})\s*(?:jours?|days?)\b|'
+        r'\b(?P<days_net>\d{1,3})\s*(?:jours?|days?)\s+net\b',
+        re.IGNORECASE
+    )
+    # Any day count; several distinct ones make the fast path ambiguous
+    DAY_COUNT_PATTERN = re.compile(
+        r'\b(\d{1,3})\s*(?:jours?|days?)\b|\bnet\s*(\d{1,3})\b' + _NOT_AMOUNT,
+        re.IGNORECASE
+    )
+    # Longer terms are unusual enough to be left to the LLM
+    MAX_PAYMENT_DAYS = 120
+    PAYMENT_METHOD_PATTERN = re.compile(
+        r'(?P<transfer>virement|bank\s*transfer|wire)|(?P<check>ch[èe]que|check)|'
+        r'(?P<debit>pr[ée]l[èe]vement|direct\s*debit)|(?P<card>carte\s*bancaire|credit\s*card)|'
+        r'(?P<cash>esp[èe]ces|cash)',
+        re.IGNORECASE
+    )
+    PAYMENT_METHODS = {
+        'transfer': 'bank transfer',
+        'check': 'check',
+        'debit': 'direct debit',
+        'card': 'card',
+        'cash': 'cash',
+    }
+    # Clauses the fast path does not summarize (left to the LLM)
+    PAYMENT_CLAUSE_PATTERN = re.compile(
+        r'escompte|discount|p[ée]nalit|penalt|indemnit|int[ée]r[êe]ts?\s*de\s*retard|\blate\b',
+        re.IGNORECASE
+    )
 
-        return None
+    def _extract_payment_section(self, text: str) -> Optional[str]:
+        """
+        Extract the sections of text likely containing payment terms.
+
+        Keeps up to PAYMENT_SECTION_WINDOWS non-overlapping windows around
+        keyword hits, joined with a separator, so clauses mentioned away from
+        the first keyword (e.g. late penalties) still reach the LLM.
+        """
+        windows = []
+        end = -1
+        for match in self.PAYMENT_SECTION_PATTERN.finditer(lower_preserving_offsets(text)):
+            if match.start() < end:
+                continue  # already inside the previous window
+            # 50 chars before the keyword, 200 after (slicing clamps the end)
+            start = max(0, match.start() - 50, end)
+            end = match.end() + 200
+            windows.append(text[start:end])
+            if len(windows) == self.PAYMENT_SECTION_WINDOWS:
+                break
+
+        return self.PAYMENT_SECTION_SEPARATOR.join(windows) if windows else None
 
 
 # =============================================================================
@@ -888,7 +1223,7 @@ def extract_invoice_pii(text: str, vendor_name: Optional[str] = None) -> LocalEx
     Returns:
         LocalExtractionResult with all extracted fields
     """
-    extractor = LocalExtractor()
+    extractor = get_default_extractor()
     return extractor.extract_all(text, vendor_name)
 
 
@@ -910,3 +1245,71 @@ def enhance_azure_result(azure_result: Dict, document_text: str) -> Dict:
 
     merger = AzureResultMerger()
     return merger.merge(azure_result, document_text, vendor_name)
+
+
+# =============================================================================
+# BATCH FUNCTIONS (ingestion loops)
+# =============================================================================
+
+# Below this many documents, process startup costs more than it saves
+PROCESS_POOL_MIN_DOCUMENTS = 32
+
+
+def _warm_extractor() -> None:
+    """Process pool initializer: compile the regex patterns once per worker."""
+    get_default_extractor()
+
+
+def _run_batch(func, *iterables, workers: Optional[int], chunksize: int) -> List[Any]:
+    """Map func over documents, in worker processes when the batch is large enough."""
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(iterables[0]) < PROCESS_POOL_MIN_DOCUMENTS:
+        return list(map(func, *iterables))
+
+    # Regex extraction holds the GIL, so threads would not help here
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_extractor) as executor:
+        return list(executor.map(func, *iterables, chunksize=chunksize))
+
+
+def extract_invoice_pii_batch(
+    texts: List[str],
+    vendor_names: Optional[List[Optional[str]]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 8
+) -> List[LocalExtractionResult]:
+    """
+    Extract PII from many invoice texts across CPU cores.
+
+    Args:
+        texts: Invoice text contents
+        vendor_names: Optional vendor name per text, for email matching
+        workers: Worker processes (default: os.cpu_count())
+        chunksize: Documents sent to a worker at a time
+
+    Returns:
+        One LocalExtractionResult per text, in input order
+    """
+    if vendor_names is None:
+        vendor_names = [None] * len(texts)
+    return _run_batch(extract_invoice_pii, texts, vendor_names, workers=workers, chunksize=chunksize)
+
+
+def enhance_azure_results_batch(
+    azure_results: List[Dict],
+    document_texts: List[str],
+    workers: Optional[int] = None,
+    chunksize: int = 8
+) -> List[Dict]:
+    """
+    Enhance many Azure results with local extractions across CPU cores.
+
+    Args:
+        azure_results: Raw Azure Document Intelligence results
+        document_texts: Full document text per result
+        workers: Worker processes (default: os.cpu_count())
+        chunksize: Documents sent to a worker at a time
+
+    Returns:
+        One enhanced result dictionary per input, in input order
+    """
+    return _run_batch(enhance_azure_result, azure_results, document_texts, workers=workers, chunksize=chunksize)
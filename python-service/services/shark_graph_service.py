@@ -19,13 +19,20 @@ Usage:
 """
 
 import os
+import json
+import time
+import base64
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+import importlib.util
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, astuple
 from datetime import datetime
 from uuid import UUID
 
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -35,6 +42,16 @@ supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
 _supabase: Optional[Client] = None
 
+# Connection pool shared by every request of the client. Queries run in
+# worker threads (see _execute), so the pool is sized for concurrent calls
+# and idle connections are kept to skip TCP/TLS setup on the next request.
+SUPABASE_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=60
+)
+# Read timeout kept at the PostgREST default (bulk upserts can be slow)
+SUPABASE_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+SUPABASE_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
 
 def get_supabase() -> Client:
     """Get or create Supabase client."""
@@ -45,15 +62,159 @@ def get_supabase() -> Client:
                 "Supabase client not initialized. "
                 "Set SUPABASE_URL and SUPABASE_SERVICE_KEY environment variables."
             )
-        _supabase = create_client(supabase_url, supabase_key)
+        http_client = httpx.Client(
+            limits=SUPABASE_HTTP_LIMITS,
+            timeout=SUPABASE_HTTP_TIMEOUT,
+            http2=SUPABASE_HTTP2_ENABLED,
+            follow_redirects=True,
+        )
+        _supabase = create_client(
+            supabase_url, supabase_key, options=ClientOptions(httpx_client=http_client)
+        )
     return _supabase
 
 
+# ============================================================
+# Pagination
+# ============================================================
+
+# Sort columns accepted by list_projects, each backed by a
+# (tenant_id, column) index so pages are read in order without a sort
+PROJECT_ORDER_COLUMNS = frozenset({"created_at", "shark_score", "budget_amount", "name"})
+
+# Row count of list pages: "estimated" is an exact COUNT(*) up to
+# PostgREST's max-rows and the planner's estimate beyond, so large
+# tenants do not pay a second full scan per page
+LIST_COUNT_METHOD = "estimated"
+
+
+def _page_counts(count: Optional[int], offset: int, page_len: int, page_size: int) -> Tuple[int, bool]:
+    """
+    (total_count, has_more) of a list page.
+
+    has_more comes from the page being full rather than from the count.
+    A partial page is the last one, so the total is known exactly there;
+    for a full page an estimated count is raised to at least the rows seen.
+    """
+    if page_len == page_size:
+        return max(count or 0, offset + page_len), True
+    if page_len or not offset:
+        return offset + page_len, False
+    # Empty page past the end: only the count is known
+    return count or 0, False
+
+
+def _encode_cursor(value: Any, row_id: str) -> str:
+    """Opaque keyset cursor for the row (sort value, id)."""
+    return base64.urlsafe_b64encode(json.dumps([value, row_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """(sort value, id) of a cursor made by _encode_cursor."""
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    return value, str(row_id)
+
+
+def _filter_value(value: Any) -> str:
+    """A value as a PostgREST logic-tree operand (strings double-quoted)."""
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    return json.dumps(value)
+
+
+def _keyset_filter(order_col: str, desc: bool, value: Any, row_id: str) -> str:
+    """
+    PostgREST or=() body selecting the rows after (value, id).
+
+    Rows are ordered by (order_col, id), both ascending or both
+    descending. Postgres puts NULLs first in DESC order and last in ASC
+    order, so nullable sort columns need their own branch.
+    """
+    op = "lt" if desc else "gt"
+    same_value_after = f"id.{op}.{_filter_value(row_id)}"
+
+    if value is None:
+        branches = [f"and({order_col}.is.null,{same_value_after})"]
+        if desc:
+            branches.append(f"{order_col}.not.is.null")
+        return ",".join(branches)
+
+    operand = _filter_value(value)
+    branches = [
+        f"{order_col}.{op}.{operand}",
+        f"and({order_col}.eq.{operand},{same_value_after})",
+    ]
+    if not desc:
+        branches.append(f"{order_col}.is.null")
+    return ",".join(branches)
+
+
+# ============================================================
+# Read Cache
+# ============================================================
+
+# Short-lived cache of read results (dashboard auto-refresh, pagination
+# back and forth). Entries are keyed by (method, tenant_id, args) and
+# expire after READ_CACHE_TTL seconds. Writers of projects, organizations
+# and news in this process (article, BOAMP and permit ingestion, scoring)
+# drop a tenant's entries right away through invalidate_tenant_cache();
+# writes from other processes are seen after at most READ_CACHE_TTL
+READ_CACHE_TTL = 30.0
+READ_CACHE_SIZE = 512
+
+_read_cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+
+
+def _cache_get(key: Tuple) -> Optional[Any]:
+    """Cached value for key, or None when missing or expired."""
+    entry = _read_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del _read_cache[key]
+        return None
+    _read_cache.move_to_end(key)
+    return value
+
+
+def _cache_put(key: Tuple, value: Any) -> None:
+    """Store a value, evicting the least recently used entry when full."""
+    _read_cache[key] = (time.monotonic() + READ_CACHE_TTL, value)
+    _read_cache.move_to_end(key)
+    if len(_read_cache) > READ_CACHE_SIZE:
+        _read_cache.popitem(last=False)
+
+
+def invalidate_tenant_cache(tenant_id: Any) -> None:
+    """Drop every cached read of a tenant (call after writing its Shark data)."""
+    tenant_id = str(tenant_id)
+    for key in [key for key in _read_cache if key[1] == tenant_id]:
+        del _read_cache[key]
+
+
+async def _execute(query: Any) -> Any:
+    """
+    Run a Supabase query builder in a worker thread.
+
+    The Supabase client is synchronous; calling .execute() directly from
+    the async service methods would block the event loop for the whole
+    HTTP round-trip, so concurrent requests could not overlap.
+    """
+    return await asyncio.to_thread(query.execute)
+
+
 # ============================================================
 # Data Classes for Results
 # ============================================================
 
-@dataclass
+# slots=True: one instance per returned row, so no per-instance __dict__
+
+@dataclass(slots=True)
 class ProjectSummary:
     """Summary of a Shark project (list view)."""
     id: str
@@ -72,7 +233,36 @@ class ProjectSummary:
     news_count: int = 0
 
 
-@dataclass
+# Columns of shark_projects behind a ProjectSummary (org_count / news_count
+# are stored columns): no JSON relations are read or sent
+PROJECT_SUMMARY_COLUMNS = (
+    "id, tenant_id, name, type, phase, location_city, location_region, "
+    "budget_amount, shark_score, shark_priority, estimated_scale, "
+    "created_at, org_count, news_count"
+)
+
+
+def _project_summary(row: Dict[str, Any]) -> ProjectSummary:
+    """ProjectSummary of a shark_projects row selected with PROJECT_SUMMARY_COLUMNS."""
+    return ProjectSummary(
+        id=row["id"],
+        tenant_id=row["tenant_id"],
+        name=row["name"],
+        type=row.get("type"),
+        phase=row.get("phase", "detection"),
+        location_city=row.get("location_city"),
+        location_region=row.get("location_region"),
+        budget_amount=row.get("budget_amount"),
+        shark_score=row.get("shark_score"),
+        shark_priority=row.get("shark_priority", "medium"),
+        estimated_scale=row.get("estimated_scale"),
+        created_at=row["created_at"],
+        org_count=row.get("org_count", 0),
+        news_count=row.get("news_count", 0)
+    )
+
+
+@dataclass(slots=True)
 class ProjectFull:
     """Full project with organizations and news."""
     id: str
@@ -102,7 +292,7 @@ class ProjectFull:
     news_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganizationSummary:
     """Summary of a Shark organization."""
     id: str
@@ -116,7 +306,7 @@ class OrganizationSummary:
     people_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonSummary:
     """Summary of a Shark person."""
     id: str
@@ -127,14 +317,21 @@ class PersonSummary:
     linkedin_url: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ListResult:
-    """Paginated list result."""
+    """
+    Paginated list result.
+
+    total_count is exact for small result sets and the planner's estimate
+    beyond PostgREST's max-rows (count="estimated"); has_more does not
+    depend on it.
+    """
     items: List[Any]
     total_count: int
     page: int
     page_size: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 # ============================================================
@@ -152,10 +349,11 @@ class ProjectFilters:
     shark_priority: Optional[str] = None
     min_shark_score: Optional[int] = None
     search: Optional[str] = None  # Full-text search on name
-    order_by: str = "created_at"
+    order_by: str = "created_at"  # One of PROJECT_ORDER_COLUMNS
     order_desc: bool = True
     page: int = 1
     page_size: int = 20
+    cursor: Optional[str] = None  # next_cursor of the previous page (replaces page)
 
 
 @dataclass
@@ -172,6 +370,38 @@ class OrganizationFilters:
     page_size: int = 20
 
 
+# (filter field, PostgREST operator, column, value format) of each filter;
+# a filter is applied when its value is neither None nor ""
+PROJECT_FILTERS: Tuple[Tuple[str, str, str, Optional[str]], ...] = (
+    ("phase", "eq", "phase", None),
+    ("type", "eq", "type", None),
+    ("location_city", "eq", "location_city", None),
+    ("location_region", "eq", "location_region", None),
+    ("estimated_scale", "eq", "estimated_scale", None),
+    ("shark_priority", "eq", "shark_priority", None),
+    ("min_shark_score", "gte", "shark_score", None),
+    ("search", "ilike", "name", "%{}%"),
+)
+
+ORGANIZATION_FILTERS: Tuple[Tuple[str, str, str, Optional[str]], ...] = (
+    ("org_type", "eq", "org_type", None),
+    ("city", "eq", "city", None),
+    ("region", "eq", "region", None),
+    ("size_bucket", "eq", "size_bucket", None),
+    ("search", "ilike", "name", "%{}%"),
+)
+
+
+def _apply_filters(query: Any, filters: Any, table: Tuple[Tuple[str, str, str, Optional[str]], ...]) -> Any:
+    """Add the set fields of a filters dataclass to a query, per a filter table."""
+    for field, op, column, fmt in table:
+        value = getattr(filters, field)
+        if value is None or value == "":
+            continue
+        query = getattr(query, op)(column, fmt.format(value) if fmt else value)
+    return query
+
+
 # ============================================================
 # Shark Graph Service
 # ============================================================
@@ -220,7 +450,8 @@ class SharkGraphService:
         """
         Get a full project with organizations and news.
 
-        Uses the shark_project_full view for optimal performance.
+        Reads the shark_project_full view through the
+        shark_get_project_full function, whose query plan Postgres caches.
 
         Args:
             tenant_id: UUID of the tenant
@@ -229,15 +460,21 @@ class SharkGraphService:
         Returns:
             ProjectFull or None if not found
         """
-        result = self.supabase.table("shark_project_full").select("*").eq(
-            "tenant_id", tenant_id
-        ).eq("id", project_id).execute()
-
-        if not result.data:
+        cache_key = ("project_full", str(tenant_id), str(project_id))
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await _execute(self.supabase.rpc("shark_get_project_full", {
+            "p_tenant_id": tenant_id,
+            "p_project_id": project_id
+        }))
+
+        row = result.data
+        if not row:
             return None
 
-        row = result.data[0]
-        return ProjectFull(
+        project = ProjectFull(
             id=row["id"],
             tenant_id=row["tenant_id"],
             name=row["name"],
@@ -264,6 +501,43 @@ class SharkGraphService:
             org_count=row.get("org_count", 0),
             news_count=row.get("news_count", 0)
         )
+        _cache_put(cache_key, project)
+        return project
+
+    async def get_project_header(
+        self,
+        tenant_id: str,
+        project_id: str
+    ) -> Optional[ProjectSummary]:
+        """
+        Get the header fields of a project, without its relations.
+
+        Reads the PROJECT_SUMMARY_COLUMNS of shark_projects only: use it
+        when the organizations and news of get_project_full are not shown
+        (hover cards, list hydration).
+
+        Args:
+            tenant_id: UUID of the tenant
+            project_id: UUID of the project
+
+        Returns:
+            ProjectSummary or None if not found
+        """
+        cache_key = ("project_header", str(tenant_id), str(project_id))
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await _execute(self.supabase.table("shark_projects").select(
+            PROJECT_SUMMARY_COLUMNS
+        ).eq("tenant_id", tenant_id).eq("id", project_id))
+
+        if not result.data:
+            return None
+
+        project = _project_summary(result.data[0])
+        _cache_put(cache_key, project)
+        return project
 
     async def list_projects(
         self,
@@ -279,78 +553,80 @@ class SharkGraphService:
 
         Returns:
             ListResult with ProjectSummary items
+
+        Pages are either numbered (filters.page, OFFSET) or, when
+        filters.cursor is set, keyset-based: the page starts right after
+        the previous page's last row, so deep pages cost as much as the
+        first one. Each result carries next_cursor for the following page.
+
+        Raises:
+            ValueError: If filters.order_by is not in PROJECT_ORDER_COLUMNS
+                or filters.cursor is malformed
         """
         filters = filters or ProjectFilters()
 
-        # Base query
-        query = self.supabase.table("shark_project_full").select(
-            "id, tenant_id, name, type, phase, location_city, location_region, "
-            "budget_amount, shark_score, shark_priority, estimated_scale, "
-            "created_at, org_count, news_count",
-            count="exact"
+        if filters.order_by not in PROJECT_ORDER_COLUMNS:
+            raise ValueError(
+                f"Unsupported order_by '{filters.order_by}', "
+                f"expected one of {sorted(PROJECT_ORDER_COLUMNS)}"
+            )
+
+        cache_key = ("projects", str(tenant_id), astuple(filters))
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Base query: org_count / news_count are stored on shark_projects
+        # (kept up to date by triggers), so the view's aggregates are not needed
+        query = self.supabase.table("shark_projects").select(
+            PROJECT_SUMMARY_COLUMNS, count=LIST_COUNT_METHOD
         ).eq("tenant_id", tenant_id)
 
         # Apply filters
-        if filters.phase:
-            query = query.eq("phase", filters.phase)
-        if filters.type:
-            query = query.eq("type", filters.type)
-        if filters.location_city:
-            query = query.eq("location_city", filters.location_city)
-        if filters.location_region:
-            query = query.eq("location_region", filters.location_region)
-        if filters.estimated_scale:
-            query = query.eq("estimated_scale", filters.estimated_scale)
-        if filters.shark_priority:
-            query = query.eq("shark_priority", filters.shark_priority)
-        if filters.min_shark_score is not None:
-            query = query.gte("shark_score", filters.min_shark_score)
-        if filters.search:
-            query = query.ilike("name", f"%{filters.search}%")
+        query = _apply_filters(query, filters, PROJECT_FILTERS)
 
-        # Ordering
+        # Ordering (id breaks ties so pages and cursors are stable)
         order_col = filters.order_by
-        if filters.order_desc:
-            query = query.order(order_col, desc=True)
-        else:
-            query = query.order(order_col)
+        query = query.order(order_col, desc=filters.order_desc).order(
+            "id", desc=filters.order_desc
+        )
 
         # Pagination
-        offset = (filters.page - 1) * filters.page_size
-        query = query.range(offset, offset + filters.page_size - 1)
+        if filters.cursor:
+            cursor_value, cursor_id = _decode_cursor(filters.cursor)
+            query = query.or_(
+                _keyset_filter(order_col, filters.order_desc, cursor_value, cursor_id)
+            ).limit(filters.page_size)
+        else:
+            offset = (filters.page - 1) * filters.page_size
+            query = query.range(offset, offset + filters.page_size - 1)
 
-        result = query.execute()
+        result = await _execute(query)
 
-        items = [
-            ProjectSummary(
-                id=row["id"],
-                tenant_id=row["tenant_id"],
-                name=row["name"],
-                type=row.get("type"),
-                phase=row.get("phase", "detection"),
-                location_city=row.get("location_city"),
-                location_region=row.get("location_region"),
-                budget_amount=row.get("budget_amount"),
-                shark_score=row.get("shark_score"),
-                shark_priority=row.get("shark_priority", "medium"),
-                estimated_scale=row.get("estimated_scale"),
-                created_at=row["created_at"],
-                org_count=row.get("org_count", 0),
-                news_count=row.get("news_count", 0)
-            )
-            for row in result.data
-        ]
+        items = [_project_summary(row) for row in result.data]
 
-        total_count = result.count or len(items)
-        has_more = offset + len(items) < total_count
+        if filters.cursor:
+            # Rows before the cursor are unknown here: keep the count as is
+            total_count = result.count or len(items)
+            has_more = len(items) == filters.page_size
+        else:
+            total_count, has_more = _page_counts(result.count, offset, len(items), filters.page_size)
 
-        return ListResult(
+        next_cursor = None
+        if has_more:
+            last_row = result.data[-1]
+            next_cursor = _encode_cursor(last_row.get(order_col), last_row["id"])
+
+        list_result = ListResult(
             items=items,
             total_count=total_count,
             page=filters.page,
             page_size=filters.page_size,
-            has_more=has_more
+            has_more=has_more,
+            next_cursor=next_cursor
         )
+        _cache_put(cache_key, list_result)
+        return list_result
 
     async def get_project_organizations(
         self,
@@ -367,37 +643,40 @@ class SharkGraphService:
         Returns:
             List of organization dicts with role info
         """
-        # First verify the project belongs to the tenant
-        project = self.supabase.table("shark_projects").select("id").eq(
-            "tenant_id", tenant_id
-        ).eq("id", project_id).execute()
+        batch = await self.get_projects_organizations_batch(tenant_id, [project_id])
+        return batch.get(project_id, [])
 
-        if not project.data:
-            return []
+    async def get_projects_organizations_batch(
+        self,
+        tenant_id: str,
+        project_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get organizations linked to several projects in one round-trip.
 
-        # Get organizations
-        result = self.supabase.table("shark_project_organizations").select(
-            "role_in_project, raw_role_label, lot_name, "
-            "shark_organizations(id, name, org_type, city, region, website, size_bucket)"
-        ).eq("project_id", project_id).execute()
-
-        organizations = []
-        for row in result.data:
-            org = row.get("shark_organizations", {})
-            organizations.append({
-                "organization_id": org.get("id"),
-                "organization_name": org.get("name"),
-                "org_type": org.get("org_type"),
-                "role_in_project": row.get("role_in_project"),
-                "raw_role_label": row.get("raw_role_label"),
-                "lot_name": row.get("lot_name"),
-                "city": org.get("city"),
-                "region": org.get("region"),
-                "website": org.get("website"),
-                "size_bucket": org.get("size_bucket")
-            })
+        The shark_project_orgs_batch function builds each project's list in
+        the database, already shaped like get_project_organizations rows.
+
+        Args:
+            tenant_id: UUID of the tenant
+            project_ids: UUIDs of the projects
+
+        Returns:
+            Dict project_id -> list of organization dicts. Projects not found
+            for this tenant are absent.
+        """
+        if not project_ids:
+            return {}
 
-        return organizations
+        result = await _execute(self.supabase.rpc("shark_project_orgs_batch", {
+            "p_tenant_id": tenant_id,
+            "p_project_ids": list(project_ids)
+        }))
+
+        return {
+            row["project_id"]: row.get("organizations") or []
+            for row in result.data or []
+        }
 
     async def get_project_news(
         self,
@@ -414,22 +693,19 @@ class SharkGraphService:
         Returns:
             List of news dicts
         """
-        # Verify project belongs to tenant
-        project = self.supabase.table("shark_projects").select("id").eq(
-            "tenant_id", tenant_id
-        ).eq("id", project_id).execute()
+        # News embedded under the project (tenant check and join in one query)
+        result = await _execute(self.supabase.table("shark_projects").select(
+            "id, shark_project_news(role_of_news, relevant_excerpt, "
+            "shark_news_items(id, title, source_name, source_url, published_at, summary))"
+        ).eq("tenant_id", tenant_id).eq("id", project_id).order(
+            "created_at", desc=True, foreign_table="shark_project_news"
+        ))
 
-        if not project.data:
+        if not result.data:
             return []
 
-        # Get news
-        result = self.supabase.table("shark_project_news").select(
-            "role_of_news, relevant_excerpt, "
-            "shark_news_items(id, title, source_name, source_url, published_at, summary)"
-        ).eq("project_id", project_id).order("created_at", desc=True).execute()
-
         news_items = []
-        for row in result.data:
+        for row in result.data[0].get("shark_project_news") or []:
             news = row.get("shark_news_items", {})
             news_items.append({
                 "news_id": news.get("id"),
@@ -458,9 +734,9 @@ class SharkGraphService:
 
         Uses the shark_organization_full view.
         """
-        result = self.supabase.table("shark_organization_full").select("*").eq(
+        result = await _execute(self.supabase.table("shark_organization_full").select("*").eq(
             "tenant_id", tenant_id
-        ).eq("id", organization_id).execute()
+        ).eq("id", organization_id))
 
         if not result.data:
             return None
@@ -480,19 +756,10 @@ class SharkGraphService:
         query = self.supabase.table("shark_organization_full").select(
             "id, tenant_id, name, org_type, city, region, size_bucket, "
             "project_count, people_count",
-            count="exact"
+            count=LIST_COUNT_METHOD
         ).eq("tenant_id", tenant_id)
 
-        if filters.org_type:
-            query = query.eq("org_type", filters.org_type)
-        if filters.city:
-            query = query.eq("city", filters.city)
-        if filters.region:
-            query = query.eq("region", filters.region)
-        if filters.size_bucket:
-            query = query.eq("size_bucket", filters.size_bucket)
-        if filters.search:
-            query = query.ilike("name", f"%{filters.search}%")
+        query = _apply_filters(query, filters, ORGANIZATION_FILTERS)
 
         # Ordering
         if filters.order_desc:
@@ -504,7 +771,7 @@ class SharkGraphService:
         offset = (filters.page - 1) * filters.page_size
         query = query.range(offset, offset + filters.page_size - 1)
 
-        result = query.execute()
+        result = await _execute(query)
 
         items = [
             OrganizationSummary(
@@ -521,14 +788,14 @@ class SharkGraphService:
             for row in result.data
         ]
 
-        total_count = result.count or len(items)
+        total_count, has_more = _page_counts(result.count, offset, len(items), filters.page_size)
 
         return ListResult(
             items=items,
             total_count=total_count,
             page=filters.page,
             page_size=filters.page_size,
-            has_more=offset + len(items) < total_count
+            has_more=has_more
         )
 
     async def get_organization_people(
@@ -539,23 +806,19 @@ class SharkGraphService:
         """
         Get people linked to an organization.
         """
-        # Verify org belongs to tenant
-        org = self.supabase.table("shark_organizations").select("id").eq(
-            "tenant_id", tenant_id
-        ).eq("id", organization_id).execute()
+        # People embedded under the organization (tenant check and join in one query)
+        result = await _execute(self.supabase.table("shark_organizations").select(
+            "id, shark_organization_people(role_in_org, is_current, start_date, end_date, "
+            "shark_people(id, full_name, title, city, linkedin_url))"
+        ).eq("tenant_id", tenant_id).eq("id", organization_id).order(
+            "is_current", desc=True, foreign_table="shark_organization_people"
+        ))
 
-        if not org.data:
+        if not result.data:
             return []
 
-        result = self.supabase.table("shark_organization_people").select(
-            "role_in_org, is_current, start_date, end_date, "
-            "shark_people(id, full_name, title, city, linkedin_url)"
-        ).eq("organization_id", organization_id).order(
-            "is_current", desc=True
-        ).execute()
-
         people = []
-        for row in result.data:
+        for row in result.data[0].get("shark_organization_people") or []:
             person = row.get("shark_people", {})
             people.append({
                 "person_id": person.get("id"),
@@ -581,55 +844,50 @@ class SharkGraphService:
 
         Useful for dashboards.
         """
-        # Projects by phase
-        projects_result = self.supabase.table("shark_projects").select(
-            "phase", count="exact"
-        ).eq("tenant_id", tenant_id).execute()
-
-        # Count by phase
-        phase_counts = {}
-        for row in projects_result.data:
-            phase = row.get("phase", "detection")
-            phase_counts[phase] = phase_counts.get(phase, 0) + 1
-
-        # Total counts
-        total_projects = len(projects_result.data)
-
-        orgs_result = self.supabase.table("shark_organizations").select(
-            "id", count="exact"
-        ).eq("tenant_id", tenant_id).execute()
-        total_orgs = orgs_result.count or len(orgs_result.data)
-
-        people_result = self.supabase.table("shark_people").select(
-            "id", count="exact"
-        ).eq("tenant_id", tenant_id).execute()
-        total_people = people_result.count or len(people_result.data)
-
-        news_result = self.supabase.table("shark_news_items").select(
-            "id", count="exact"
-        ).eq("tenant_id", tenant_id).execute()
-        total_news = news_result.count or len(news_result.data)
-
-        return {
-            "total_projects": total_projects,
-            "total_organizations": total_orgs,
-            "total_people": total_people,
-            "total_news_items": total_news,
-            "projects_by_phase": phase_counts,
+        cache_key = ("tenant_stats", str(tenant_id))
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        # All counts in one call (shark_tenant_stats SQL function)
+        result = await _execute(self.supabase.rpc(
+            "shark_tenant_stats", {"p_tenant_id": tenant_id}
+        ))
+        stats = result.data or {}
+
+        tenant_stats = {
+            "total_projects": stats.get("total_projects", 0),
+            "total_organizations": stats.get("total_organizations", 0),
+            "total_people": stats.get("total_people", 0),
+            "total_news_items": stats.get("total_news_items", 0),
+            "projects_by_phase": stats.get("projects_by_phase") or {},
             "generated_at": datetime.utcnow().isoformat()
         }
+        _cache_put(cache_key, tenant_stats)
+        return dict(tenant_stats)
 
 
 # ============================================================
 # Convenience Functions
 # ============================================================
 
+_default_service: Optional[SharkGraphService] = None
+
+
+def _get_default_service() -> SharkGraphService:
+    """Service bound to the global client, shared by the functions below."""
+    global _default_service
+    if _default_service is None:
+        _default_service = SharkGraphService()
+    return _default_service
+
+
 async def get_shark_project(
     tenant_id: str,
     project_id: str
 ) -> Optional[ProjectFull]:
     """Convenience function to get a project."""
-    service = SharkGraphService()
+    service = _get_default_service()
     return await service.get_project_full(tenant_id, project_id)
 
 
@@ -641,7 +899,7 @@ async def list_shark_projects(
     page_size: int = 20
 ) -> ListResult:
     """Convenience function to list projects."""
-    service = SharkGraphService()
+    service = _get_default_service()
     filters = ProjectFilters(
         phase=phase,
         search=search,
@@ -653,5 +911,5 @@ async def list_shark_projects(
 
 async def get_tenant_shark_stats(tenant_id: str) -> Dict[str, Any]:
     """Convenience function to get tenant stats."""
-    service = SharkGraphService()
+    service = _get_default_service()
     return await service.get_tenant_stats(tenant_id)
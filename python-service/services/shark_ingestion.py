@@ -2,6 +2,7 @@
 Shark Ingestion Service v2.0 - Ingests extracted project data into the shark_* tables
 
 This service handles:
+- Skipping articles already ingested (canonical URL / SimHash) before extraction
 - Upserting news items (deduplication on source_url)
 - Deduplicating projects using fuzzy matching (pg_trgm similarity)
 - Upserting organizations with strict role taxonomy
@@ -16,40 +17,85 @@ Key features:
 
 import os
 import re
+import asyncio
+import hashlib
 import logging
-import unicodedata
-from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from itertools import islice
+from typing import Optional, Dict, Any, List, Set, Tuple, AsyncIterator, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from supabase import create_client, Client
+from postgrest.types import ReturnMethod
+from supabase import Client
 
+from services.shark_graph_service import get_supabase, invalidate_tenant_cache
+from utils.normalization import strip_accents, url_canonicalize
 from agents.project_extractor import (
     ProjectExtractor,
     ExtractionResult,
     ExtractedProject,
     ExtractedOrganization,
     ExtractedNews,
+    ExtractionCache,
+    PROMPT_VERSION,
     extract_project_from_article
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Initialize Supabase client
+# Initialize Supabase client: the graph service's client, so ingestion
+# and graph reads share one pooled (keep-alive, HTTP/2) connection pool
 supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
-supabase: Client = create_client(supabase_url, supabase_key) if supabase_url and supabase_key else None
+supabase: Client = get_supabase() if supabase_url and supabase_key else None
 
 # Similarity threshold for project deduplication
 DEFAULT_SIMILARITY_THRESHOLD = 0.6
 
+# LLM extractions run in parallel by batch ingestion
+EXTRACTION_CONCURRENCY = 8
+
+# Articles ingested together by iter_ingest_articles (batched writes, and
+# the results held in memory at a time)
+INGESTION_CHUNK_SIZE = 100
+
+# Link rows sent per upsert request by _PendingLinks (bounds the JSON body;
+# the chunks of a table are sent concurrently)
+LINK_UPSERT_CHUNK_SIZE = 1000
+
+# Article text kept per article (stored full_text, fingerprints, extraction)
+MAX_ARTICLE_CHARS = 50000
+
+# Projects resolved by a SharkIngestionService, remembered by normalized
+# name, city and type (least recently used dropped first)
+PROJECT_CACHE_SIZE = 2048
+
+# Articles whose SimHashes differ by at most this many bits are duplicates
+SIMHASH_MAX_DISTANCE = 5
+
+# Projects of one batch whose normalized names share at least this fraction
+# of character 4-grams (Jaccard) are treated as the same project
+PROJECT_CLUSTER_THRESHOLD = 0.7
+
+# An article already ingested is extracted again once its news item is older
+NEWS_REFRESH_AFTER = timedelta(days=7)
+
+# Words per shingle hashed by simhash64
+SIMHASH_SHINGLE_SIZE = 3
+
 
 # ============================================================
 # Helper Functions
 # ============================================================
 
+# French articles removed by normalize_name
+_ARTICLES_RE = re.compile(r"\b(le|la|les|l'|un|une|des|du|de|d'|au|aux)\b", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+")
+
 def normalize_name(name: str) -> str:
     """
     Normalize a project name for deduplication.
@@ -62,21 +108,147 @@ def normalize_name(name: str) -> str:
     if not name:
         return ""
 
-    # Lowercase
-    result = name.lower()
-
-    # Remove accents
-    result = unicodedata.normalize('NFD', result)
-    result = ''.join(c for c in result if unicodedata.category(c) != 'Mn')
+    # Lowercase, remove accents
+    result = strip_accents(name.lower())
 
     # Remove common French articles
-    articles = r"\b(le|la|les|l'|un|une|des|du|de|d'|au|aux)\b"
-    result = re.sub(articles, ' ', result, flags=re.IGNORECASE)
+    result = _ARTICLES_RE.sub(' ', result)
 
     # Collapse whitespace
-    result = re.sub(r'\s+', ' ', result).strip()
+    return _WS_RE.sub(' ', result).strip()
 
-    return result
+
+async def _execute(query: Any) -> Any:
+    """
+    Run a Supabase query builder in a worker thread.
+
+    The Supabase client is synchronous; calling .execute() directly would
+    block the event loop for the whole HTTP round-trip, so the concurrent
+    extractions of a batch could not overlap with the writes.
+    """
+    return await asyncio.to_thread(query.execute)
+
+
+# Error codes of an RPC to a function the database does not have
+# (PostgREST schema cache miss, PostgreSQL undefined_function)
+MISSING_FUNCTION_CODES = ("PGRST202", "42883")
+
+
+def _is_missing_function(error: Exception) -> bool:
+    """True if a failed RPC named a function the database does not have."""
+    return getattr(error, "code", None) in MISSING_FUNCTION_CODES
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string (timestamp columns)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _org_key(org: ExtractedOrganization) -> Tuple[str, Optional[str], Optional[str]]:
+    """Lookup key of an extracted organization (name, city, org_type)."""
+    return org.name, org.city, org.org_type
+
+
+def _org_matches(row: Dict[str, Any], org: ExtractedOrganization) -> bool:
+    """Whether an organization row is the one _upsert_organization would reuse for org."""
+    return (
+        row["name"] == org.name
+        and (not org.city or row.get("city") == org.city)
+        and (not org.org_type or row.get("org_type") == org.org_type)
+    )
+
+
+def simhash64(text: str) -> Optional[int]:
+    """
+    64-bit SimHash of an article text, as a signed integer (BIGINT).
+
+    The text is normalized like project names (normalize_name), split into
+    words, and every shingle of SIMHASH_SHINGLE_SIZE words is weighted by
+    its number of occurrences. Near-duplicate texts get hashes a few bits
+    apart.
+
+    Returns:
+        The hash, or None if the text has no words
+    """
+    words = _WORD_RE.findall(normalize_name(text))
+    if not words:
+        return None
+
+    size = min(SIMHASH_SHINGLE_SIZE, len(words))
+    weights: Dict[str, int] = {}
+    for i in range(len(words) - size + 1):
+        shingle = " ".join(words[i:i + size])
+        weights[shingle] = weights.get(shingle, 0) + 1
+
+    totals = [0] * 64
+    for shingle, weight in weights.items():
+        digest = int.from_bytes(
+            hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big"
+        )
+        for bit in range(64):
+            totals[bit] += weight if digest >> bit & 1 else -weight
+
+    value = sum(1 << bit for bit in range(64) if totals[bit] > 0)
+    # Two's complement, to fit a signed BIGINT
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _name_shingles(name: str, size: int = 4) -> Set[str]:
+    """Character n-grams of a normalized name (the name itself if shorter)."""
+    text = normalize_name(name)
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def cluster_projects(
+    projects: List[ExtractedProject],
+    threshold: float = PROJECT_CLUSTER_THRESHOLD
+) -> List[List[int]]:
+    """
+    Group the projects of a batch that describe the same project.
+
+    Two projects are linked when their normalized names have a Jaccard
+    similarity of character 4-grams of at least threshold, in the same
+    city, with compatible types (equal, or one unknown) - the filters of
+    find_similar_project. Linked projects are merged transitively, as long
+    as the merged cluster does not mix two known types.
+
+    Batches are small (INGESTION_CHUNK_SIZE), so every pair is compared
+    exactly.
+
+    Returns:
+        Clusters of indices into projects, each in input order, ordered by
+        their first index
+    """
+    shingles = [_name_shingles(p.name) for p in projects]
+    cities = [normalize_name(p.location_city or "") for p in projects]
+    parent = list(range(len(projects)))
+    # Known type of each cluster, by root
+    types = [p.type for p in projects]
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(projects)):
+        for j in range(i + 1, len(projects)):
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j or cities[i] != cities[j]:
+                continue
+            if types[root_i] and types[root_j] and types[root_i] != types[root_j]:
+                continue
+            union = len(shingles[i] | shingles[j])
+            if union and len(shingles[i] & shingles[j]) / union >= threshold:
+                parent[root_j] = root_i
+                types[root_i] = types[root_i] or types[root_j]
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(projects)):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda cluster: cluster[0])
 
 
 # ============================================================
@@ -93,6 +265,7 @@ class IngestionResult:
     error_message: Optional[str] = None
     extraction_result: Optional[ExtractionResult] = None
     is_duplicate: bool = False  # True if project was matched to existing
+    already_ingested: bool = False  # True if extraction was skipped (article ingested recently)
 
     def __post_init__(self):
         if self.organization_ids is None:
@@ -134,7 +307,8 @@ class SharkIngestionService:
     def __init__(
         self,
         tenant_id: str,
-        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        use_cache: bool = True
     ):
         """
         Initialize the ingestion service.
@@ -142,10 +316,20 @@ class SharkIngestionService:
         Args:
             tenant_id: UUID of the tenant (CoreMatch customer organization)
             similarity_threshold: Threshold for project name similarity (0.0-1.0)
+            use_cache: Reuse the LLM response of an article already extracted
+                with the same prompt (shark_extraction_cache)
         """
         self.tenant_id = tenant_id
         self.similarity_threshold = similarity_threshold
-        self.extractor = ProjectExtractor()
+        # Project IDs already resolved by this instance (see find_or_create_project)
+        self._project_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        # Set once ingest_article_bundle turned out to be missing (migration
+        # not applied): later articles are stored step by step without
+        # trying it again. Other errors only affect their own article
+        self._bundle_missing = False
+        self.extractor = ProjectExtractor(
+            cache=ExtractionCache(supabase) if use_cache and supabase else None
+        )
 
         if not supabase:
             raise RuntimeError("Supabase client not initialized. Check SUPABASE_URL and SUPABASE_SERVICE_KEY.")
@@ -157,11 +341,16 @@ class SharkIngestionService:
         source_name: Optional[str] = None,
         region_hint: Optional[str] = None,
         published_at: Optional[str] = None,
-        article_title: Optional[str] = None
+        article_title: Optional[str] = None,
+        force_refresh: bool = False
     ) -> IngestionResult:
         """
         Ingest an article: extract project data and store in shark_* tables.
 
+        An article whose news item was updated less than NEWS_REFRESH_AFTER
+        ago (same URL or near-identical text) is not extracted again: the
+        stored news item and project are returned with is_duplicate=True.
+
         Args:
             article_text: Full text of the article
             source_url: URL of the article (used for deduplication)
@@ -169,58 +358,419 @@ class SharkIngestionService:
             region_hint: Optional region hint for extraction
             published_at: Optional publication date (YYYY-MM-DD) - used as DATE ANCHOR
             article_title: Optional article title
+            force_refresh: Extract the article even if it was ingested recently
 
         Returns:
             IngestionResult with IDs of created/updated records
         """
+        # Truncated once, the same text is hashed, extracted and stored
+        article_text = article_text[:MAX_ARTICLE_CHARS]
         try:
-            # Step 1: Extract project data using LLM
-            logger.info(f"Extracting project from article: {source_url}")
-            extraction = await self.extractor.extract(
-                article_text=article_text,
-                source_url=source_url,
-                source_name=source_name,
-                region_hint=region_hint,
-                published_at=published_at
+            extraction, skipped = await self._extract_article(
+                article_text, source_url, source_name, region_hint, published_at,
+                force_refresh
+            )
+            if skipped:
+                return skipped
+
+            # One timestamp for every row written for this article
+            now_iso = _now_iso()
+            news_fields = self._news_fields(
+                extraction, article_text, source_url, source_name,
+                region_hint, published_at, article_title
             )
 
-            if not extraction.extraction_success:
-                logger.error(f"Extraction failed: {extraction.error_message}")
-                return IngestionResult(
-                    success=False,
-                    error_message=extraction.error_message,
-                    extraction_result=extraction
+            # Step 3-6 in one call (ingest_article_bundle)
+            if not self._bundle_missing:
+                try:
+                    return await self._ingest_bundle(extraction, news_fields, now_iso)
+                except Exception as e:
+                    self._bundle_missing = _is_missing_function(e)
+                    logger.warning(f"ingest_article_bundle failed, storing step by step: {e}")
+
+            # Step 3: Upsert news item
+            news_id = await self._upsert_news_item(**news_fields, now_iso=now_iso)
+
+            # Step 4-6: Organizations resolved at once, links written together
+            org_ids = await self._resolve_organizations(extraction.organizations, now_iso)
+            links = _PendingLinks()
+            result = await self._store_extraction(extraction, news_id, links, org_ids, now_iso)
+            await links.flush(supabase)
+            return result
+
+        except Exception as e:
+            logger.exception(f"Ingestion failed for {source_url}: {e}")
+            return IngestionResult(
+                success=False,
+                error_message=str(e)
+            )
+
+    async def ingest_articles(
+        self,
+        articles: List[Dict[str, Any]],
+        max_concurrency: int = EXTRACTION_CONCURRENCY,
+        force_refresh: bool = False
+    ) -> List[IngestionResult]:
+        """
+        Ingest several articles, batching the writes that do not depend on
+        each other.
+
+        The LLM extractions run concurrently (at most max_concurrency at a
+        time). Articles describing the same project are clustered first
+        (cluster_projects) and each cluster is deduplicated once; clusters
+        stay sequential (a project created for one must be visible to the
+        next). The news items are written with one upsert and the project
+        links with one upsert per link table.
+
+        Args:
+            articles: List of article dicts (same keys as ingest_article)
+            max_concurrency: Maximum number of extractions in flight
+            force_refresh: Extract the articles even if ingested recently
+
+        Returns:
+            List of IngestionResult, in the order of articles
+        """
+        results: List[Optional[IngestionResult]] = [None] * len(articles)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        texts = [article.get("article_text", "")[:MAX_ARTICLE_CHARS] for article in articles]
+
+        async def _extract(i: int, article: Dict[str, Any]):
+            source_url = article.get("source_url", "")
+            async with semaphore:
+                logger.info(f"Processing article {i+1}/{len(articles)}: {source_url or 'unknown'}")
+                try:
+                    return await self._extract_article(
+                        texts[i],
+                        source_url,
+                        article.get("source_name"),
+                        article.get("region_hint"),
+                        article.get("published_at"),
+                        force_refresh
+                    )
+                except Exception as e:
+                    logger.exception(f"Ingestion failed for {source_url}: {e}")
+                    return None, IngestionResult(success=False, error_message=str(e))
+
+        # Step 1-2: Extract every article
+        extractions = await asyncio.gather(
+            *(_extract(i, article) for i, article in enumerate(articles))
+        )
+        extracted = []
+        for i, (article, (extraction, skipped)) in enumerate(zip(articles, extractions)):
+            if skipped:
+                results[i] = skipped
+            else:
+                extracted.append((i, article, extraction))
+
+        # One timestamp for every row written for this batch
+        now_iso = _now_iso()
+
+        # Step 3: Upsert all news items at once
+        news_ids: Dict[str, str] = {}
+        if extracted:
+            try:
+                news_ids = await self._upsert_news_items_bulk([
+                    self._news_fields(
+                        extraction,
+                        texts[i],
+                        article.get("source_url", ""),
+                        article.get("source_name"),
+                        article.get("region_hint"),
+                        article.get("published_at"),
+                        article.get("article_title")
+                    )
+                    for i, article, extraction in extracted
+                ], now_iso)
+            except Exception as e:
+                logger.exception(f"News upsert failed for {len(extracted)} articles: {e}")
+                for i, _, extraction in extracted:
+                    results[i] = IngestionResult(
+                        success=False, error_message=str(e), extraction_result=extraction
+                    )
+                return results
+
+        # Step 5 (organizations): all of the batch resolved at once
+        org_ids = await self._resolve_organizations([
+            org for _, _, extraction in extracted for org in extraction.organizations
+        ], now_iso)
+
+        # Step 4: Projects, one lookup per cluster of same-project articles
+        project_ids = await self._resolve_projects(
+            [extraction.project for _, _, extraction in extracted], now_iso
+        )
+
+        # Step 5-6: Organizations and links per article, links batched
+        links = _PendingLinks()
+        for k, (i, article, extraction) in enumerate(extracted):
+            source_url = article.get("source_url", "")
+            try:
+                if isinstance(project_ids[k], Exception):
+                    raise project_ids[k]
+                results[i] = await self._store_extraction(
+                    extraction, news_ids[source_url], links, org_ids, now_iso,
+                    project_ids[k]
                 )
+            except Exception as e:
+                logger.exception(f"Ingestion failed for {source_url}: {e}")
+                results[i] = IngestionResult(success=False, error_message=str(e))
+        await links.flush(supabase)
+
+        return results
+
+    async def _resolve_projects(
+        self,
+        projects: List[ExtractedProject],
+        now_iso: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Find or create the projects of a batch, once per cluster.
 
-            # Step 2: Check if a project was found
-            if extraction.project is None:
-                logger.info(f"No BTP project found in article: {source_url}")
-                return IngestionResult(
-                    success=True,
-                    error_message="No BTP project found in article",
-                    extraction_result=extraction
+        Projects describing the same project (cluster_projects) are
+        resolved together: the one with the longest name goes through
+        find_or_create_project, the others update the project it returns
+        (as their own pg_trgm lookup would have matched it) and count as
+        duplicates.
+
+        Returns:
+            For each project, (project_id, is_duplicate) - or the exception
+            that failed its cluster
+        """
+        resolved: List[Any] = [None] * len(projects)
+        for cluster in cluster_projects(projects):
+            canonical = max(cluster, key=lambda k: len(projects[k].name))
+            try:
+                project_id, is_duplicate = await self.find_or_create_project(
+                    projects[canonical], now_iso
+                )
+                resolved[canonical] = (project_id, is_duplicate)
+                for k in cluster:
+                    if k != canonical:
+                        await self._update_project(project_id, projects[k], now_iso)
+                        resolved[k] = (project_id, True)
+            except Exception as e:
+                for k in cluster:
+                    if resolved[k] is None:
+                        resolved[k] = e
+            if len(cluster) > 1:
+                logger.info(
+                    f"Merged {len(cluster)} articles into project: {projects[canonical].name}"
                 )
+        return resolved
 
-            # Step 3: Upsert news item
-            news_id = await self._upsert_news_item(
-                source_url=source_url,
-                source_name=source_name,
-                title=article_title or (extraction.news.title if extraction.news else None),
-                published_at=published_at or (extraction.news.published_at if extraction.news else None),
-                region_hint=region_hint,
-                full_text=article_text[:50000]  # Limit stored text
+    async def _extract_article(
+        self,
+        article_text: str,
+        source_url: str,
+        source_name: Optional[str],
+        region_hint: Optional[str],
+        published_at: Optional[str],
+        force_refresh: bool = False
+    ) -> Tuple[Optional[ExtractionResult], Optional[IngestionResult]]:
+        """
+        Run the extractor on an article.
+
+        Returns:
+            Tuple of (extraction, result). result is set when there is
+            nothing to store (duplicate article, failed extraction or no
+            project found); extraction is None for a duplicate article.
+        """
+        # Step 0: Skip articles ingested recently (same URL or near-identical text)
+        duplicate = None
+        if not force_refresh:
+            duplicate = await self._find_duplicate_news(article_text, source_url)
+        if duplicate:
+            logger.info(f"Duplicate article, extraction skipped: {source_url}")
+            return None, IngestionResult(
+                success=True,
+                project_id=duplicate["project_id"],
+                news_id=duplicate["news_id"],
+                error_message="Article already ingested",
+                is_duplicate=True,
+                already_ingested=True
             )
 
-            # Step 4: Find or create project with deduplication
-            project_id, is_duplicate = await self.find_or_create_project(extraction.project)
+        # Step 1: Extract project data using LLM
+        logger.info(f"Extracting project from article: {source_url}")
+        extraction = await self.extractor.extract(
+            article_text=article_text,
+            source_url=source_url,
+            source_name=source_name,
+            region_hint=region_hint,
+            published_at=published_at
+        )
+
+        if not extraction.extraction_success:
+            logger.error(f"Extraction failed: {extraction.error_message}")
+            return extraction, IngestionResult(
+                success=False,
+                error_message=extraction.error_message,
+                extraction_result=extraction
+            )
+
+        # Step 2: Check if a project was found
+        if extraction.project is None:
+            logger.info(f"No BTP project found in article: {source_url}")
+            return extraction, IngestionResult(
+                success=True,
+                error_message="No BTP project found in article",
+                extraction_result=extraction
+            )
+
+        return extraction, None
+
+    async def _find_duplicate_news(
+        self,
+        article_text: str,
+        source_url: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Find the news item of an article this tenant ingested recently.
+
+        Matches on the canonical URL, then on a SimHash of the text within
+        SIMHASH_MAX_DISTANCE bits, among the news items updated less than
+        NEWS_REFRESH_AFTER ago (shark_find_duplicate_news). A news item
+        without a project (its project or link write failed) is not a
+        duplicate: the article is extracted and stored again.
+
+        Returns:
+            Dict with news_id and project_id, or None (also when the lookup
+            fails)
+        """
+        try:
+            result = await _execute(supabase.rpc(
+                "shark_find_duplicate_news",
+                {
+                    "p_tenant_id": self.tenant_id,
+                    "p_source_url": source_url,
+                    "p_canonical_url": url_canonicalize(source_url),
+                    "p_simhash": simhash64(article_text),
+                    "p_max_distance": SIMHASH_MAX_DISTANCE,
+                    "p_fresh_since": (datetime.now(timezone.utc) - NEWS_REFRESH_AFTER).isoformat()
+                }
+            ))
+            duplicate = result.data[0] if result.data else None
+        except Exception as e:
+            logger.warning(f"Duplicate lookup failed for {source_url}: {e}")
+            return None
+        # Also checked here for databases without the linked-only RPC
+        return duplicate if duplicate and duplicate.get("project_id") else None
+
+    @staticmethod
+    def _news_fields(
+        extraction: ExtractionResult,
+        article_text: str,
+        source_url: str,
+        source_name: Optional[str],
+        region_hint: Optional[str],
+        published_at: Optional[str],
+        article_title: Optional[str]
+    ) -> Dict[str, Any]:
+        """News item fields of an article, completed by the extraction."""
+        news = extraction.news
+        if news is not None:
+            article_title = article_title or news.title
+            published_at = published_at or news.published_at
+        return {
+            "source_url": source_url,
+            "canonical_url": url_canonicalize(source_url),
+            "simhash": simhash64(article_text),
+            "source_name": source_name,
+            "title": article_title or None,
+            "published_at": published_at or None,
+            "region_hint": region_hint,
+            "full_text": article_text  # Truncated by the caller (MAX_ARTICLE_CHARS)
+        }
+
+    async def _ingest_bundle(
+        self,
+        extraction: ExtractionResult,
+        news_fields: Dict[str, Any],
+        now_iso: Optional[str] = None
+    ) -> IngestionResult:
+        """
+        Store an extraction with a single ingest_article_bundle call.
+
+        The SQL function performs steps 3-6 (news item, project
+        deduplication, organizations, links) in one transaction, so
+        nothing is written if it fails.
+        """
+        news = extraction.news
+        result = await _execute(supabase.rpc(
+            "ingest_article_bundle",
+            {
+                "p_tenant_id": self.tenant_id,
+                "p_news": news_fields,
+                "p_project": extraction.project.model_dump(),
+                "p_orgs": [org.model_dump() for org in extraction.organizations],
+                "p_role_of_news": news.role_of_news if news is not None else "annonce_projet",
+                "p_similarity_threshold": self.similarity_threshold,
+                "p_now": now_iso or _now_iso()
+            }
+        ))
+        bundle = result.data
+        self._remember_project(self._project_cache_key(extraction.project), bundle["project_id"])
+
+        action = "matched existing" if bundle["is_duplicate"] else "created new"
+        logger.info(f"Successfully ingested project ({action}): {extraction.project.name}")
+
+        return IngestionResult(
+            success=True,
+            project_id=bundle["project_id"],
+            news_id=bundle["news_id"],
+            organization_ids=bundle["organization_ids"],
+            extraction_result=extraction,
+            is_duplicate=bundle["is_duplicate"]
+        )
+
+    async def _store_extraction(
+        self,
+        extraction: ExtractionResult,
+        news_id: str,
+        links: Optional["_PendingLinks"] = None,
+        org_ids: Optional[Dict[Tuple, str]] = None,
+        now_iso: Optional[str] = None,
+        project: Optional[Tuple[str, bool]] = None
+    ) -> IngestionResult:
+        """
+        Store the project and organizations of an extraction and link them.
 
-            # Step 5: Upsert organizations and create relationships
-            organization_ids = []
-            for org in extraction.organizations:
-                org_id = await self._upsert_organization(org)
-                organization_ids.append(org_id)
+        Args:
+            extraction: Successful extraction with a project
+            news_id: ID of the article's news item
+            links: Collects the link rows for a later flush; when None they
+                are written right away
+            org_ids: Organization IDs by _org_key, already upserted; when
+                None each organization is upserted here
+            now_iso: Timestamp of the rows written (default: now)
+            project: (project_id, is_duplicate) already resolved; when None
+                the project is found or created here
+        """
+        # Step 4: Find or create project with deduplication
+        if project is not None:
+            project_id, is_duplicate = project
+        else:
+            project_id, is_duplicate = await self.find_or_create_project(
+                extraction.project, now_iso
+            )
 
-                # Create project-organization relationship with raw_role_label
+        # Step 5: Upsert organizations and create relationships
+        organization_ids = []
+        for org in extraction.organizations:
+            if org_ids is not None:
+                org_id = org_ids[_org_key(org)]
+            else:
+                org_id = await self._upsert_organization(org, now_iso)
+            organization_ids.append(org_id)
+
+            # Create project-organization relationship with raw_role_label
+            if links is not None:
+                links.add("shark_project_organizations", {
+                    "project_id": project_id,
+                    "organization_id": org_id,
+                    "role_in_project": org.role_in_project,
+                    "raw_role_label": org.raw_role_label
+                })
+            else:
                 await self._link_project_organization(
                     project_id=project_id,
                     organization_id=org_id,
@@ -228,48 +778,61 @@ class SharkIngestionService:
                     raw_role_label=org.raw_role_label
                 )
 
-            # Step 6: Link project to news
-            role_of_news = extraction.news.role_of_news if extraction.news else "annonce_projet"
+        # Step 6: Link project to news
+        news = extraction.news
+        role_of_news = news.role_of_news if news is not None else "annonce_projet"
+        if links is not None:
+            links.add("shark_project_news", {
+                "project_id": project_id,
+                "news_id": news_id,
+                "role_of_news": role_of_news
+            })
+        else:
             await self._link_project_news(
                 project_id=project_id,
                 news_id=news_id,
                 role_of_news=role_of_news
             )
 
-            action = "matched existing" if is_duplicate else "created new"
-            logger.info(f"Successfully ingested project ({action}): {extraction.project.name}")
-
-            return IngestionResult(
-                success=True,
-                project_id=project_id,
-                news_id=news_id,
-                organization_ids=organization_ids,
-                extraction_result=extraction,
-                is_duplicate=is_duplicate
-            )
+        action = "matched existing" if is_duplicate else "created new"
+        logger.info(f"Successfully ingested project ({action}): {extraction.project.name}")
 
-        except Exception as e:
-            logger.exception(f"Ingestion failed for {source_url}: {e}")
-            return IngestionResult(
-                success=False,
-                error_message=str(e)
-            )
+        return IngestionResult(
+            success=True,
+            project_id=project_id,
+            news_id=news_id,
+            organization_ids=organization_ids,
+            extraction_result=extraction,
+            is_duplicate=is_duplicate
+        )
 
     async def find_or_create_project(
         self,
-        project: ExtractedProject
+        project: ExtractedProject,
+        now_iso: Optional[str] = None
     ) -> Tuple[str, bool]:
         """
         Find an existing project or create a new one.
 
-        Uses fuzzy matching on normalized name to detect duplicates.
+        Uses fuzzy matching on normalized name to detect duplicates. A
+        project this instance already resolved (same normalized name, city
+        and type) is reused without a new lookup.
 
         Args:
             project: Extracted project data
+            now_iso: Timestamp of the write (default: now)
 
         Returns:
             Tuple of (project_id, is_duplicate)
         """
+        cache_key = self._project_cache_key(project)
+        project_id = self._project_cache.get(cache_key)
+        if project_id is not None:
+            self._project_cache.move_to_end(cache_key)
+            logger.debug(f"Project resolved from cache: {project_id}")
+            await self._update_project(project_id, project, now_iso)
+            return project_id, True
+
         # Try to find similar project using pg_trgm
         dedup_result = await self._find_similar_project(project)
 
@@ -279,22 +842,37 @@ class SharkIngestionService:
                 f"(similarity: {dedup_result.similarity_score:.2f})"
             )
             # Update the existing project with new info
-            await self._update_project(dedup_result.project_id, project)
-            return dedup_result.project_id, True
+            await self._update_project(dedup_result.project_id, project, now_iso)
+            project_id, is_duplicate = dedup_result.project_id, True
         else:
             # Create new project
-            project_id = await self._create_project(project)
-            return project_id, False
+            project_id, is_duplicate = await self._create_project(project, now_iso), False
+
+        self._remember_project(cache_key, project_id)
+        return project_id, is_duplicate
+
+    def _project_cache_key(self, project: ExtractedProject) -> Tuple:
+        return (self.tenant_id, normalize_name(project.name), project.location_city, project.type)
+
+    def _remember_project(self, cache_key: Tuple, project_id: str) -> None:
+        """Store a resolved project, evicting the least recently used one when full."""
+        self._project_cache[cache_key] = project_id
+        self._project_cache.move_to_end(cache_key)
+        if len(self._project_cache) > PROJECT_CACHE_SIZE:
+            self._project_cache.popitem(last=False)
 
     async def _find_similar_project(self, project: ExtractedProject) -> DedupResult:
         """
         Find a similar project using pg_trgm similarity.
 
-        Uses the find_similar_project SQL function.
+        Uses the find_similar_project SQL function, which compares the
+        normalized names (shark_normalize_name: no case, accents or
+        articles) of the tenant's projects in the same city / of the same
+        type, and returns the best match above similarity_threshold.
         """
         try:
             # Call the PostgreSQL function
-            result = supabase.rpc(
+            result = await _execute(supabase.rpc(
                 "find_similar_project",
                 {
                     "p_tenant_id": self.tenant_id,
@@ -303,7 +881,7 @@ class SharkIngestionService:
                     "p_type": project.type,
                     "p_similarity_threshold": self.similarity_threshold
                 }
-            ).execute()
+            ))
 
             if result.data and len(result.data) > 0:
                 best_match = result.data[0]
@@ -330,7 +908,7 @@ class SharkIngestionService:
         if project.location_city:
             query = query.eq("location_city", project.location_city)
 
-        result = query.execute()
+        result = await _execute(query)
 
         if result.data:
             return DedupResult(
@@ -342,7 +920,11 @@ class SharkIngestionService:
         else:
             return DedupResult(found_existing=False)
 
-    async def _create_project(self, project: ExtractedProject) -> str:
+    async def _create_project(
+        self,
+        project: ExtractedProject,
+        now_iso: Optional[str] = None
+    ) -> str:
         """Create a new project."""
         project_data = {
             "tenant_id": self.tenant_id,
@@ -359,18 +941,23 @@ class SharkIngestionService:
             "phase": project.phase or "detection",
             "sector_tags": project.sector_tags or [],
             "estimated_scale": project.estimated_scale or "Medium",
-            "ai_extracted_at": datetime.utcnow().isoformat()
+            "ai_extracted_at": now_iso or _now_iso()
         }
 
-        result = supabase.table("shark_projects").insert(project_data).execute()
+        result = await _execute(supabase.table("shark_projects").insert(project_data))
         project_id = result.data[0]["id"]
         logger.debug(f"Created project: {project_id}")
         return project_id
 
-    async def _update_project(self, project_id: str, project: ExtractedProject) -> None:
+    async def _update_project(
+        self,
+        project_id: str,
+        project: ExtractedProject,
+        now_iso: Optional[str] = None
+    ) -> None:
         """Update an existing project with new data."""
         update_data = {
-            "updated_at": datetime.utcnow().isoformat()
+            "updated_at": now_iso or _now_iso()
         }
 
         # Only update fields that have values
@@ -388,60 +975,123 @@ class SharkIngestionService:
             update_data["estimated_scale"] = project.estimated_scale
         if project.sector_tags:
             # Merge sector tags
-            existing = supabase.table("shark_projects").select("sector_tags").eq("id", project_id).execute()
-            existing_tags = existing.data[0].get("sector_tags", []) if existing.data else []
-            merged_tags = list(set(existing_tags + project.sector_tags))
-            update_data["sector_tags"] = merged_tags
+            existing = await _execute(
+                supabase.table("shark_projects").select("sector_tags").eq("id", project_id)
+            )
+            existing_tags = (existing.data[0].get("sector_tags") or []) if existing.data else []
+            update_data["sector_tags"] = sorted({*existing_tags, *project.sector_tags})
 
-        supabase.table("shark_projects").update(update_data).eq("id", project_id).execute()
+        await _execute(supabase.table("shark_projects").update(
+            update_data, returning=ReturnMethod.minimal
+        ).eq("id", project_id))
         logger.debug(f"Updated project: {project_id}")
 
     async def _upsert_news_item(
         self,
         source_url: str,
+        canonical_url: str,
+        simhash: Optional[int],
         source_name: Optional[str],
         title: Optional[str],
         published_at: Optional[str],
         region_hint: Optional[str],
-        full_text: Optional[str]
+        full_text: Optional[str],
+        now_iso: Optional[str] = None
     ) -> str:
-        """Upsert a news item, returning its ID."""
-        # Check if news already exists
-        existing = supabase.table("shark_news_items").select("id").eq(
-            "tenant_id", self.tenant_id
-        ).eq("source_url", source_url).execute()
+        """Upsert a news item (unique on tenant_id, source_url), returning its ID."""
+        # crawled_at is left to its column default, so it is only set on insert
+        result = await _execute(supabase.table("shark_news_items").upsert({
+            "tenant_id": self.tenant_id,
+            "source_url": source_url,
+            "canonical_url": canonical_url,
+            "simhash": simhash,
+            "source_name": source_name,
+            "title": title,
+            "published_at": published_at,
+            "region_hint": region_hint,
+            "full_text": full_text,
+            "updated_at": now_iso or _now_iso()
+        }, on_conflict="tenant_id,source_url"))
+        news_id = result.data[0]["id"]
+        logger.debug(f"Upserted news item: {news_id}")
+        return news_id
+
+    async def _upsert_news_items_bulk(
+        self,
+        items: List[Dict[str, Any]],
+        now_iso: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Upsert several news items in one request.
+
+        Args:
+            items: News item fields (as returned by _news_fields)
+            now_iso: Timestamp of the write (default: now)
+
+        Returns:
+            Dict source_url -> news item ID
+        """
+        now = now_iso or _now_iso()
+        # One row per URL: a row cannot be upserted twice in one statement
+        rows = {
+            item["source_url"]: {"tenant_id": self.tenant_id, **item, "updated_at": now}
+            for item in items
+        }
+        # crawled_at is left to its column default, so it is only set on insert
+        result = await _execute(supabase.table("shark_news_items").upsert(
+            list(rows.values()), on_conflict="tenant_id,source_url"
+        ))
+        logger.debug(f"Upserted {len(result.data)} news items")
+        return {row["source_url"]: row["id"] for row in result.data}
+
+    async def _resolve_organizations(
+        self,
+        orgs: List[ExtractedOrganization],
+        now_iso: Optional[str] = None
+    ) -> Optional[Dict[Tuple, str]]:
+        """
+        Upsert organizations in bulk (_upsert_organizations_bulk).
+
+        Returns:
+            Dict _org_key -> organization ID, or None if the bulk upsert
+            failed (the caller then upserts each organization itself)
+        """
+        try:
+            return await self._upsert_organizations_bulk(orgs, now_iso)
+        except Exception as e:
+            logger.warning(f"Bulk organization upsert failed, upserting per row: {e}")
+            return None
+
+    async def _upsert_organization(
+        self,
+        org: ExtractedOrganization,
+        now_iso: Optional[str] = None
+    ) -> str:
+        """
+        Upsert an organization, returning its ID.
+
+        The lookup (same name, and same city / org_type when given) and
+        the write run server-side in one shark_upsert_organization call;
+        if it fails, they are sent as separate requests.
+        """
+        try:
+            result = await _execute(supabase.rpc(
+                "shark_upsert_organization",
+                {
+                    "p_tenant_id": self.tenant_id,
+                    "p_name": org.name,
+                    "p_org_type": org.org_type or None,
+                    "p_city": org.city or None,
+                    "p_region": org.region,
+                    "p_country": org.country or None,
+                    "p_now": now_iso or _now_iso()
+                }
+            ))
+            logger.debug(f"Upserted organization: {result.data}")
+            return result.data
+        except Exception as e:
+            logger.warning(f"shark_upsert_organization failed, falling back to lookup: {e}")
 
-        if existing.data:
-            news_id = existing.data[0]["id"]
-            # Update existing record
-            supabase.table("shark_news_items").update({
-                "title": title,
-                "source_name": source_name,
-                "published_at": published_at,
-                "region_hint": region_hint,
-                "full_text": full_text,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", news_id).execute()
-            logger.debug(f"Updated news item: {news_id}")
-            return news_id
-        else:
-            # Insert new record
-            result = supabase.table("shark_news_items").insert({
-                "tenant_id": self.tenant_id,
-                "source_url": source_url,
-                "source_name": source_name,
-                "title": title,
-                "published_at": published_at,
-                "region_hint": region_hint,
-                "full_text": full_text,
-                "crawled_at": datetime.utcnow().isoformat()
-            }).execute()
-            news_id = result.data[0]["id"]
-            logger.debug(f"Created news item: {news_id}")
-            return news_id
-
-    async def _upsert_organization(self, org: ExtractedOrganization) -> str:
-        """Upsert an organization, returning its ID."""
         # Try to find existing org by name + city + org_type
         query = supabase.table("shark_organizations").select("id").eq(
             "tenant_id", self.tenant_id
@@ -452,7 +1102,7 @@ class SharkIngestionService:
         if org.org_type:
             query = query.eq("org_type", org.org_type)
 
-        existing = query.execute()
+        existing = await _execute(query)
 
         org_data = {
             "name": org.name,
@@ -465,22 +1115,94 @@ class SharkIngestionService:
         if existing.data:
             org_id = existing.data[0]["id"]
             # Update existing org
-            supabase.table("shark_organizations").update({
+            await _execute(supabase.table("shark_organizations").update({
                 **org_data,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", org_id).execute()
+                "updated_at": now_iso or _now_iso()
+            }, returning=ReturnMethod.minimal).eq("id", org_id))
             logger.debug(f"Updated organization: {org_id}")
             return org_id
         else:
             # Insert new org
-            result = supabase.table("shark_organizations").insert({
+            result = await _execute(supabase.table("shark_organizations").insert({
                 "tenant_id": self.tenant_id,
                 **org_data
-            }).execute()
+            }))
             org_id = result.data[0]["id"]
             logger.debug(f"Created organization: {org_id}")
             return org_id
 
+    async def _upsert_organizations_bulk(
+        self,
+        orgs: List[ExtractedOrganization],
+        now_iso: Optional[str] = None
+    ) -> Dict[Tuple, str]:
+        """
+        Upsert the organizations of a batch with three requests at most.
+
+        Matching follows _upsert_organization (same name, and same city /
+        org_type when the extraction has one), applied in order so an
+        organization created earlier in the batch is reused by the later
+        ones. Each organization ends up with the data of its last
+        occurrence, as with successive per-row upserts.
+
+        Returns:
+            Dict _org_key -> organization ID
+        """
+        if not orgs:
+            return {}
+
+        # Last occurrence of each key wins (it would be the last update)
+        by_key: Dict[Tuple, ExtractedOrganization] = {}
+        for org in orgs:
+            by_key[_org_key(org)] = org
+
+        existing = (await _execute(supabase.table("shark_organizations").select(
+            "id, name, city, org_type"
+        ).eq("tenant_id", self.tenant_id).in_(
+            "name", list({org.name for org in by_key.values()})
+        ))).data or []
+
+        now = now_iso or _now_iso()
+        candidates: List[Dict[str, Any]] = list(existing)
+        matched: Dict[Tuple, Dict[str, Any]] = {}
+        updates: Dict[str, Dict[str, Any]] = {}
+        new_rows: Dict[int, Dict[str, Any]] = {}
+
+        for key, org in by_key.items():
+            org_data = {
+                "name": org.name,
+                "org_type": org.org_type or "Other",
+                "city": org.city,
+                "region": org.region,
+                "country": org.country or "France"
+            }
+            row = next((c for c in candidates if _org_matches(c, org)), None)
+            if row is None:
+                # Created by this batch: later keys may match it
+                row = {"tenant_id": self.tenant_id, **org_data}
+                new_rows[id(row)] = row
+                candidates.append(row)
+            elif id(row) in new_rows:
+                row.update(org_data)
+            else:
+                updates[row["id"]] = {
+                    "id": row["id"], "tenant_id": self.tenant_id, **org_data, "updated_at": now
+                }
+            matched[key] = row
+
+        if updates:
+            await _execute(supabase.table("shark_organizations").upsert(
+                list(updates.values()), on_conflict="id", returning=ReturnMethod.minimal
+            ))
+        if new_rows:
+            rows = list(new_rows.values())
+            inserted = await _execute(supabase.table("shark_organizations").insert(rows))
+            for row, created in zip(rows, inserted.data):
+                row["id"] = created["id"]
+
+        logger.debug(f"Upserted {len(updates)} and created {len(new_rows)} organizations")
+        return {key: row["id"] for key, row in matched.items()}
+
     async def _link_project_organization(
         self,
         project_id: str,
@@ -488,22 +1210,15 @@ class SharkIngestionService:
         role_in_project: str,
         raw_role_label: Optional[str] = None
     ) -> None:
-        """Create or update a project-organization relationship."""
-        # Check if relationship exists
-        existing = supabase.table("shark_project_organizations").select("id").eq(
-            "project_id", project_id
-        ).eq("organization_id", organization_id).eq(
-            "role_in_project", role_in_project
-        ).execute()
-
-        if not existing.data:
-            supabase.table("shark_project_organizations").insert({
-                "project_id": project_id,
-                "organization_id": organization_id,
-                "role_in_project": role_in_project,
-                "raw_role_label": raw_role_label
-            }).execute()
-            logger.debug(f"Linked project {project_id} to org {organization_id} as {role_in_project}")
+        """Create a project-organization relationship (kept as is if it exists)."""
+        await _execute(supabase.table("shark_project_organizations").upsert({
+            "project_id": project_id,
+            "organization_id": organization_id,
+            "role_in_project": role_in_project,
+            "raw_role_label": raw_role_label
+        }, on_conflict="project_id,organization_id,role_in_project",
+            ignore_duplicates=True, returning=ReturnMethod.minimal))
+        logger.debug(f"Linked project {project_id} to org {organization_id} as {role_in_project}")
 
     async def _link_project_news(
         self,
@@ -511,19 +1226,61 @@ class SharkIngestionService:
         news_id: str,
         role_of_news: str = "annonce_projet"
     ) -> None:
-        """Create or update a project-news relationship."""
-        # Check if relationship exists
-        existing = supabase.table("shark_project_news").select("id").eq(
-            "project_id", project_id
-        ).eq("news_id", news_id).execute()
-
-        if not existing.data:
-            supabase.table("shark_project_news").insert({
-                "project_id": project_id,
-                "news_id": news_id,
-                "role_of_news": role_of_news
-            }).execute()
-            logger.debug(f"Linked project {project_id} to news {news_id}")
+        """Create a project-news relationship (kept as is if it exists)."""
+        await _execute(supabase.table("shark_project_news").upsert({
+            "project_id": project_id,
+            "news_id": news_id,
+            "role_of_news": role_of_news
+        }, on_conflict="project_id,news_id",
+            ignore_duplicates=True, returning=ReturnMethod.minimal))
+        logger.debug(f"Linked project {project_id} to news {news_id}")
+
+
+class _PendingLinks:
+    """
+    Link rows collected during a batch, written with one upsert per table
+    (per LINK_UPSERT_CHUNK_SIZE rows for large batches).
+
+    Rows are keyed on each table's unique constraint: the first row of a
+    key wins and rows already in the database are left untouched, as with
+    the _link_* methods.
+    """
+
+    CONFLICT_COLUMNS = {
+        "shark_project_organizations": ("project_id", "organization_id", "role_in_project"),
+        "shark_project_news": ("project_id", "news_id"),
+    }
+
+    def __init__(self):
+        self._rows: Dict[str, Dict[Tuple[str, ...], Dict[str, Any]]] = {
+            table: {} for table in self.CONFLICT_COLUMNS
+        }
+
+    def add(self, table: str, row: Dict[str, Any]) -> None:
+        key = tuple(row[column] for column in self.CONFLICT_COLUMNS[table])
+        self._rows[table].setdefault(key, row)
+
+    async def flush(self, db: Client) -> None:
+        """Write every pending row; a failing chunk is logged and does not stop the others."""
+        for table, rows in self._rows.items():
+            values = list(rows.values())
+            await asyncio.gather(*(
+                self._upsert(db, table, values[start:start + LINK_UPSERT_CHUNK_SIZE])
+                for start in range(0, len(values), LINK_UPSERT_CHUNK_SIZE)
+            ))
+            rows.clear()
+
+    async def _upsert(self, db: Client, table: str, rows: List[Dict[str, Any]]) -> None:
+        try:
+            await _execute(db.table(table).upsert(
+                rows,
+                on_conflict=",".join(self.CONFLICT_COLUMNS[table]),
+                ignore_duplicates=True,
+                returning=ReturnMethod.minimal,
+            ))
+            logger.debug(f"Linked {len(rows)} {table} rows")
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} {table} rows: {e}")
 
 
 # ============================================================
@@ -537,7 +1294,9 @@ async def ingest_article_as_project(
     source_name: Optional[str] = None,
     region_hint: Optional[str] = None,
     published_at: Optional[str] = None,
-    article_title: Optional[str] = None
+    article_title: Optional[str] = None,
+    use_cache: bool = True,
+    force_refresh: bool = False
 ) -> IngestionResult:
     """
     Convenience function to ingest an article as a project.
@@ -554,20 +1313,70 @@ async def ingest_article_as_project(
             print(f"Created project: {result.project_id}")
             print(f"Is duplicate: {result.is_duplicate}")
     """
-    service = SharkIngestionService(tenant_id=tenant_id)
-    return await service.ingest_article(
+    service = SharkIngestionService(tenant_id=tenant_id, use_cache=use_cache)
+    result = await service.ingest_article(
         article_text=article_text,
         source_url=source_url,
         source_name=source_name,
         region_hint=region_hint,
         published_at=published_at,
-        article_title=article_title
+        article_title=article_title,
+        force_refresh=force_refresh
     )
+    invalidate_tenant_cache(tenant_id)
+    return result
+
+
+async def iter_ingest_articles(
+    tenant_id: str,
+    articles: Iterable[Dict[str, Any]],
+    max_concurrency: int = EXTRACTION_CONCURRENCY,
+    use_cache: bool = True,
+    force_refresh: bool = False,
+    chunk_size: int = INGESTION_CHUNK_SIZE
+) -> AsyncIterator[IngestionResult]:
+    """
+    Ingest articles chunk by chunk, yielding each result in article order.
+
+    Each chunk of chunk_size articles goes through
+    SharkIngestionService.ingest_articles (concurrent extractions, batched
+    writes); its results are yielded before the next chunk is read, so
+    only one chunk of articles and results is held at a time. The
+    tenant's graph cache is invalidated once, when iteration ends.
+
+    Example:
+        async for result in iter_ingest_articles(tenant_id, articles):
+            if not result.success:
+                print(result.error_message)
+
+    Args:
+        tenant_id: UUID of the tenant
+        articles: Article dicts (same keys as batch_ingest_articles); may
+            be a lazy iterable
+        max_concurrency: Maximum number of LLM extractions in flight
+        use_cache: Reuse cached LLM responses (False forces re-extraction)
+        force_refresh: Extract articles even if they were ingested recently
+        chunk_size: Number of articles ingested together
+
+    Yields:
+        IngestionResult for each article
+    """
+    service = SharkIngestionService(tenant_id=tenant_id, use_cache=use_cache)
+    articles = iter(articles)
+    try:
+        while chunk := list(islice(articles, chunk_size)):
+            for result in await service.ingest_articles(chunk, max_concurrency, force_refresh):
+                yield result
+    finally:
+        invalidate_tenant_cache(tenant_id)
 
 
 async def batch_ingest_articles(
     tenant_id: str,
-    articles: List[Dict[str, Any]]
+    articles: List[Dict[str, Any]],
+    max_concurrency: int = EXTRACTION_CONCURRENCY,
+    use_cache: bool = True,
+    force_refresh: bool = False
 ) -> List[IngestionResult]:
     """
     Batch ingest multiple articles.
@@ -581,36 +1390,58 @@ async def batch_ingest_articles(
             - region_hint: Optional[str]
             - published_at: Optional[str]
             - article_title: Optional[str]
+        max_concurrency: Maximum number of LLM extractions in flight
+        use_cache: Reuse cached LLM responses (False forces re-extraction)
+        force_refresh: Extract articles even if they were ingested recently
 
     Returns:
         List of IngestionResult for each article
     """
-    service = SharkIngestionService(tenant_id=tenant_id)
-    results = []
-
-    for i, article in enumerate(articles):
-        logger.info(f"Processing article {i+1}/{len(articles)}: {article.get('source_url', 'unknown')}")
-        result = await service.ingest_article(
-            article_text=article.get("article_text", ""),
-            source_url=article.get("source_url", ""),
-            source_name=article.get("source_name"),
-            region_hint=article.get("region_hint"),
-            published_at=article.get("published_at"),
-            article_title=article.get("article_title")
+    results = [
+        result async for result in iter_ingest_articles(
+            tenant_id, articles, max_concurrency, use_cache, force_refresh
         )
-        results.append(result)
-
-    # Summary
-    success_count = sum(1 for r in results if r.success and r.project_id)
-    duplicate_count = sum(1 for r in results if r.success and r.is_duplicate)
-    no_project_count = sum(1 for r in results if r.success and not r.project_id)
-    error_count = sum(1 for r in results if not r.success)
+    ]
+
+    # Summary (one pass over the results)
+    success_count = duplicate_count = skipped_count = no_project_count = error_count = 0
+    for r in results:
+        if not r.success:
+            error_count += 1
+        elif r.already_ingested:
+            skipped_count += 1
+        elif r.project_id:
+            success_count += 1
+            duplicate_count += r.is_duplicate
+        else:
+            no_project_count += 1
 
     logger.info(
         f"Batch ingestion complete: "
         f"{success_count} projects ({duplicate_count} duplicates matched), "
+        f"{skipped_count} articles already ingested, "
         f"{no_project_count} no project found, "
         f"{error_count} errors"
     )
 
     return results
+
+
+async def invalidate_extraction_cache(version: str) -> int:
+    """
+    Purge the cached LLM extractions of a prompt version.
+
+    Run after bumping PROMPT_VERSION to free the entries of the previous
+    version (they are no longer read either way).
+
+    Args:
+        version: Prompt version to purge (e.g. "v1")
+
+    Returns:
+        Number of cache entries removed
+    """
+    if not supabase:
+        raise RuntimeError("Supabase client not initialized. Check SUPABASE_URL and SUPABASE_SERVICE_KEY.")
+    if version == PROMPT_VERSION:
+        logger.warning(f"Invalidating the current prompt version ({version})")
+    return await ExtractionCache(supabase).invalidate(version)
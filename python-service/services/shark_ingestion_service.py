@@ -29,12 +29,13 @@ Usage:
 import os
 import re
 import json
+import asyncio
 import logging
-import unicodedata
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from postgrest.types import ReturnMethod
 
 from supabase import create_client, Client
 
@@ -46,8 +47,16 @@ from services.shark_project_extractor import (
     ProjectPayload,
     OrganizationPayload,
     NewsPayload,
-    ProjectExtractionError
+    ProjectExtractionError,
+    SYSTEM_PROMPT,
+    EXTRACTION_MODEL,
+    EXTRACTION_TEMPERATURE,
+    EXTRACTION_MAX_TOKENS,
+    build_user_prompt
 )
+from agents.project_extractor import ExtractionCache, extraction_cache_key
+from services.shark_graph_service import invalidate_tenant_cache
+from utils.normalization import strip_accents
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -57,6 +66,16 @@ supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
 _supabase: Optional[Client] = None
 
+# Articles ingested concurrently by ingest_articles_batch
+BATCH_INGEST_CONCURRENCY = 8
+
+# Version of the extraction results cached by this pipeline. They are
+# stored in shark_extraction_cache as parsed ProjectExtractionResult JSON,
+# next to ProjectExtractor's raw responses; the "ingestion-" prefix keeps
+# them apart (see ExtractionCache). Bump it when ProjectExtractionResult
+# or _parse_llm_response changes.
+EXTRACTION_CACHE_VERSION = "ingestion-v1"
+
 
 def get_supabase() -> Client:
     """Get or create Supabase client."""
@@ -113,6 +132,13 @@ class SharkIngestionError(Exception):
 # HELPER FUNCTIONS
 # ============================================================
 
+# Uninformative words removed by normalize_name
+_STOPWORDS_RE = re.compile(
+    r"\b(le|la|les|l'|un|une|des|du|de|d'|au|aux|projet|chantier|travaux|construction|renovation)\b",
+    re.IGNORECASE
+)
+_WS_RE = re.compile(r'\s+')
+
 def normalize_name(name: str) -> str:
     """
     Normalize a name for deduplication matching.
@@ -125,21 +151,19 @@ def normalize_name(name: str) -> str:
     if not name:
         return ""
 
-    # Lowercase
-    result = name.lower()
-
-    # Remove accents
-    result = unicodedata.normalize('NFD', result)
-    result = ''.join(c for c in result if unicodedata.category(c) != 'Mn')
+    # Lowercase, remove accents
+    result = strip_accents(name.lower())
 
     # Remove common uninformative words
-    stopwords = r"\b(le|la|les|l'|un|une|des|du|de|d'|au|aux|projet|chantier|travaux|construction|renovation)\b"
-    result = re.sub(stopwords, ' ', result, flags=re.IGNORECASE)
+    result = _STOPWORDS_RE.sub(' ', result)
 
     # Collapse whitespace
-    result = re.sub(r'\s+', ' ', result).strip()
+    return _WS_RE.sub(' ', result).strip()
 
-    return result
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string (timestamp columns)."""
+    return datetime.now(timezone.utc).isoformat()
 
 
 def extract_title_from_text(text: str, max_length: int = 100) -> str:
@@ -160,7 +184,8 @@ def extract_title_from_text(text: str, max_length: int = 100) -> str:
 async def find_or_create_project(
     tenant_id: UUID,
     project: ProjectPayload,
-    db: Client
+    db: Client,
+    now_iso: Optional[str] = None
 ) -> Tuple[UUID, bool]:
     """
     Find an existing project or create a new one.
@@ -171,6 +196,7 @@ async def find_or_create_project(
         tenant_id: UUID of the tenant
         project: Extracted project payload
         db: Supabase client
+        now_iso: Timestamp of the write (default: now)
 
     Returns:
         Tuple of (project_id, was_created)
@@ -182,7 +208,7 @@ async def find_or_create_project(
 
     if not candidate_normalized:
         # Can't dedupe without a name, create new
-        project_id = await _create_project(tenant_id, project, candidate_normalized, db)
+        project_id = await _create_project(tenant_id, project, candidate_normalized, db, now_iso)
         return project_id, True
 
     # Try to find similar project using pg_trgm RPC function
@@ -209,7 +235,7 @@ async def find_or_create_project(
             )
 
             # Optionally enrich existing project
-            await _enrich_existing_project(existing_id, project, db)
+            await _enrich_existing_project(existing_id, project, db, now_iso)
 
             return existing_id, False
 
@@ -224,11 +250,11 @@ async def find_or_create_project(
     if existing.data:
         existing_id = UUID(existing.data[0]["id"])
         logger.info(f"Found exact match project: {existing_id}")
-        await _enrich_existing_project(existing_id, project, db)
+        await _enrich_existing_project(existing_id, project, db, now_iso)
         return existing_id, False
 
     # No match found, create new project
-    project_id = await _create_project(tenant_id, project, candidate_normalized, db)
+    project_id = await _create_project(tenant_id, project, candidate_normalized, db, now_iso)
     return project_id, True
 
 
@@ -236,7 +262,8 @@ async def _create_project(
     tenant_id: UUID,
     project: ProjectPayload,
     normalized_name: str,
-    db: Client
+    db: Client,
+    now_iso: Optional[str] = None
 ) -> UUID:
     """Create a new project in shark_projects."""
     project_data = {
@@ -255,7 +282,7 @@ async def _create_project(
         "phase": project.phase or "detection",
         "sector_tags": project.sector_tags or [],
         "estimated_scale": project.estimated_scale,
-        "ai_extracted_at": datetime.utcnow().isoformat(),
+        "ai_extracted_at": now_iso or _now_iso(),
         "raw_extraction": project.model_dump()
     }
 
@@ -269,9 +296,33 @@ async def _create_project(
 async def _enrich_existing_project(
     project_id: UUID,
     project: ProjectPayload,
-    db: Client
+    db: Client,
+    now_iso: Optional[str] = None
 ) -> None:
-    """Enrich an existing project with new data if fields are null."""
+    """
+    Enrich an existing project with new data if fields are null.
+
+    One enrich_project call (null fields filled and sector_tags merged in a
+    single UPDATE); if it fails, the project is read then updated. Both
+    set updated_at to now_iso.
+    """
+    now_iso = now_iso or _now_iso()
+    try:
+        result = db.rpc("enrich_project", {
+            "p_project_id": str(project_id),
+            "p_budget_amount": project.budget_amount or None,
+            "p_start_date_est": project.start_date_est or None,
+            "p_end_date_est": project.end_date_est or None,
+            "p_estimated_scale": project.estimated_scale or None,
+            "p_sector_tags": project.sector_tags or [],
+            "p_now": now_iso
+        }).execute()
+        if result.data:
+            logger.debug(f"Enriched existing project {project_id}")
+        return
+    except Exception as e:
+        logger.warning(f"enrich_project failed, reading the project first: {e}")
+
     # Get current project data
     current = db.table("shark_projects").select(
         "budget_amount, start_date_est, end_date_est, estimated_scale, sector_tags"
@@ -281,7 +332,7 @@ async def _enrich_existing_project(
         return
 
     current_data = current.data[0]
-    update_data = {"updated_at": datetime.utcnow().isoformat()}
+    update_data = {"updated_at": now_iso}
     enriched = False
 
     # Enrich null fields
@@ -304,9 +355,9 @@ async def _enrich_existing_project(
     # Merge sector_tags
     if project.sector_tags:
         existing_tags = current_data.get("sector_tags") or []
-        merged_tags = list(set(existing_tags + project.sector_tags))
-        if merged_tags != existing_tags:
-            update_data["sector_tags"] = merged_tags
+        merged_tags = {*existing_tags, *project.sector_tags}
+        if merged_tags != set(existing_tags):
+            update_data["sector_tags"] = sorted(merged_tags)
             enriched = True
 
     if enriched:
@@ -370,16 +421,6 @@ async def link_project_organization(
     db: Client
 ) -> None:
     """Link a project to an organization if not already linked."""
-    # Check if link exists
-    existing = db.table("shark_project_organizations").select("id").eq(
-        "project_id", str(project_id)
-    ).eq("organization_id", str(organization_id)).execute()
-
-    if existing.data:
-        logger.debug(f"Link already exists: project {project_id} <-> org {organization_id}")
-        return
-
-    # Create link
     link_data = {
         "project_id": str(project_id),
         "organization_id": str(organization_id),
@@ -388,10 +429,106 @@ async def link_project_organization(
         "metadata": {"raw_role_label": org.raw_role_label} if org.raw_role_label else {}
     }
 
-    db.table("shark_project_organizations").insert(link_data).execute()
+    # Existing link (same project, organization and role) is kept as is
+    db.table("shark_project_organizations").upsert(
+        link_data, on_conflict="project_id,organization_id,role_in_project",
+        ignore_duplicates=True, returning=ReturnMethod.minimal
+    ).execute()
     logger.debug(f"Linked project {project_id} to org {organization_id} as {org.role_in_project}")
 
 
+def _organization_matches(row: Dict[str, Any], org: OrganizationPayload) -> bool:
+    """Whether a shark_organizations row is the organization find_or_create_organization would reuse."""
+    if (row.get("name") or "").lower() != org.name.lower():
+        return False
+    return not org.city or row.get("city") is None or row.get("city") == org.city
+
+
+async def find_or_create_organizations(
+    tenant_id: UUID,
+    orgs: List[OrganizationPayload],
+    db: Client
+) -> List[Tuple[UUID, bool]]:
+    """
+    Find or create several organizations with two requests at most.
+
+    Matching follows find_or_create_organization (same name, case-insensitive,
+    and no city or the same city), applied in order so that an organization
+    created for an earlier payload is reused by a later one.
+
+    Returns:
+        List of (organization_id, was_created), in the order of orgs
+    """
+    if not orgs:
+        return []
+
+    # Names quoted as array elements: they may contain commas or quotes
+    names = ",".join(
+        '"' + name.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        for name in {org.name for org in orgs}
+    )
+    existing = db.table("shark_organizations").select("id, name, city").eq(
+        "tenant_id", str(tenant_id)
+    ).ilike_any_of("name", names).execute()
+
+    candidates: List[Dict[str, Any]] = list(existing.data or [])
+    matched: List[Tuple[Dict[str, Any], bool]] = []
+    new_rows: List[Dict[str, Any]] = []
+
+    for org in orgs:
+        row = next((c for c in candidates if _organization_matches(c, org)), None)
+        if row is None:
+            row = {
+                "tenant_id": str(tenant_id),
+                "name": org.name,
+                "org_type": org.org_type or "Other",
+                "city": org.city,
+                "region": org.region,
+                "country": org.country or "France",
+                "raw_extraction": org.model_dump()
+            }
+            new_rows.append(row)
+            candidates.append(row)
+            matched.append((row, True))
+        else:
+            matched.append((row, False))
+
+    if new_rows:
+        result = db.table("shark_organizations").insert(new_rows).execute()
+        for row, created in zip(new_rows, result.data):
+            row["id"] = created["id"]
+
+    logger.debug(f"Reused {len(orgs) - len(new_rows)} and created {len(new_rows)} organizations")
+    return [(UUID(str(row["id"])), created) for row, created in matched]
+
+
+async def link_project_organizations(
+    project_id: UUID,
+    links: List[Tuple[UUID, OrganizationPayload]],
+    db: Client
+) -> None:
+    """Link a project to several organizations in one request (existing links kept as is)."""
+    if not links:
+        return
+
+    rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for organization_id, org in links:
+        role = org.role_in_project or "Other"
+        rows.setdefault((str(organization_id), role), {
+            "project_id": str(project_id),
+            "organization_id": str(organization_id),
+            "role_in_project": role,
+            "raw_role_label": org.raw_role_label,
+            "metadata": {"raw_role_label": org.raw_role_label} if org.raw_role_label else {}
+        })
+
+    db.table("shark_project_organizations").upsert(
+        list(rows.values()), on_conflict="project_id,organization_id,role_in_project",
+        ignore_duplicates=True, returning=ReturnMethod.minimal
+    ).execute()
+    logger.debug(f"Linked project {project_id} to {len(rows)} organizations")
+
+
 # ============================================================
 # NEWS UPSERT
 # ============================================================
@@ -400,7 +537,8 @@ async def upsert_news(
     tenant_id: UUID,
     input_data: ArticleIngestionInput,
     extraction_result: Optional[ProjectExtractionResult],
-    db: Client
+    db: Client,
+    now_iso: Optional[str] = None
 ) -> Tuple[UUID, bool]:
     """
     Upsert a news item in shark_news_items.
@@ -443,7 +581,7 @@ async def upsert_news(
             "full_text": input_data.full_text,
             "published_at": news_published,
             "raw_data": raw_data,
-            "updated_at": datetime.utcnow().isoformat()
+            "updated_at": now_iso or _now_iso()
         }).eq("id", str(news_id)).execute()
 
         logger.info(f"Updated existing news: {news_id}")
@@ -458,7 +596,7 @@ async def upsert_news(
         "full_text": input_data.full_text,
         "published_at": news_published,
         "raw_data": raw_data,
-        "crawled_at": datetime.utcnow().isoformat()
+        "crawled_at": now_iso or _now_iso()
     }
 
     result = db.table("shark_news_items").insert(news_data).execute()
@@ -475,39 +613,88 @@ async def link_project_news(
     db: Client
 ) -> None:
     """Link a project to a news item if not already linked."""
-    # Check if link exists
-    existing = db.table("shark_project_news").select("id").eq(
-        "project_id", str(project_id)
-    ).eq("news_id", str(news_id)).execute()
-
-    if existing.data:
-        logger.debug(f"Link already exists: project {project_id} <-> news {news_id}")
-        return
-
-    # Create link
     link_data = {
         "project_id": str(project_id),
         "news_id": str(news_id),
         "role_of_news": role_of_news or "annonce_projet"
     }
 
-    db.table("shark_project_news").insert(link_data).execute()
+    # Existing link is kept as is
+    db.table("shark_project_news").upsert(
+        link_data, on_conflict="project_id,news_id",
+        ignore_duplicates=True, returning=ReturnMethod.minimal
+    ).execute()
     logger.debug(f"Linked project {project_id} to news {news_id}")
 
 
+# ============================================================
+# EXTRACTION CACHE
+# ============================================================
+
+def _extraction_cache_key(input: ArticleIngestionInput) -> str:
+    """Cache key of an article's extraction: the prompts sent to the LLM, model and version."""
+    user_prompt = build_user_prompt(
+        input.full_text, input.source_name, input.source_url,
+        input.published_at.strftime("%Y-%m-%d")
+    )
+    return extraction_cache_key(
+        EXTRACTION_MODEL, EXTRACTION_TEMPERATURE, EXTRACTION_MAX_TOKENS,
+        {"system": SYSTEM_PROMPT, "user": user_prompt},
+        prompt_version=EXTRACTION_CACHE_VERSION
+    )
+
+
+async def extract_with_cache(
+    input: ArticleIngestionInput,
+    cache: Optional[ExtractionCache] = None
+) -> ProjectExtractionResult:
+    """
+    Extract an article, reusing the result cached for the same prompts.
+
+    A cached result that no longer validates is evicted and extracted again.
+
+    Raises:
+        ProjectExtractionError: If extraction fails
+    """
+    cache_key = None
+    if cache is not None:
+        cache_key = _extraction_cache_key(input)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            try:
+                result = ProjectExtractionResult.model_validate_json(cached)
+                logger.info(f"Extraction cache hit: {input.source_url}")
+                return result
+            except ValidationError as e:
+                logger.warning(f"Cached extraction no longer valid, evicting: {e}")
+                await cache.evict(cache_key)
+
+    result = await extract_project_from_article(
+        article_text=input.full_text,
+        source_name=input.source_name,
+        source_url=input.source_url,
+        published_at_input=input.published_at
+    )
+
+    if cache is not None:
+        await cache.put(cache_key, EXTRACTION_MODEL, result.model_dump_json(), EXTRACTION_CACHE_VERSION)
+    return result
+
+
 # ============================================================
 # MAIN INGESTION PIPELINE
 # ============================================================
 
 async def ingest_article_as_project(
     input: ArticleIngestionInput,
+    use_cache: bool = True
 ) -> IngestionResult:
     """
     Main ingestion pipeline.
 
     Steps:
     0. Check if news exists
-    1. Call ProjectExtractor
+    1. Call ProjectExtractor (or reuse the cached extraction)
     2. Upsert news
     3. Dedupe & upsert project
     4. Upsert organizations + links
@@ -516,6 +703,8 @@ async def ingest_article_as_project(
 
     Args:
         input: ArticleIngestionInput with all required data
+        use_cache: Reuse the extraction of an article already extracted
+            with the same prompts (shark_extraction_cache)
 
     Returns:
         IngestionResult with IDs and statistics
@@ -549,11 +738,8 @@ async def ingest_article_as_project(
         logger.info(f"Extracting project from: {input.source_url}")
 
         try:
-            extraction_result = await extract_project_from_article(
-                article_text=input.full_text,
-                source_name=input.source_name,
-                source_url=input.source_url,
-                published_at_input=input.published_at
+            extraction_result = await extract_with_cache(
+                input, ExtractionCache(db) if use_cache else None
             )
         except ProjectExtractionError as e:
             logger.error(f"Extraction failed: {e}")
@@ -563,6 +749,9 @@ async def ingest_article_as_project(
                 tenant_id=tenant_id
             )
 
+        # One timestamp for every row written for this article
+        now_iso = _now_iso()
+
         # ─────────────────────────────────────────────────────
         # STEP 2: Upsert news
         # ─────────────────────────────────────────────────────
@@ -570,7 +759,8 @@ async def ingest_article_as_project(
             tenant_id=tenant_id,
             input_data=input,
             extraction_result=extraction_result,
-            db=db
+            db=db,
+            now_iso=now_iso
         )
 
         # ─────────────────────────────────────────────────────
@@ -597,36 +787,33 @@ async def ingest_article_as_project(
         project_id, project_created = await find_or_create_project(
             tenant_id=tenant_id,
             project=extraction_result.project,
-            db=db
+            db=db,
+            now_iso=now_iso
         )
 
         # ─────────────────────────────────────────────────────
         # STEP 4: Upsert organizations + links
         # ─────────────────────────────────────────────────────
-        for org in extraction_result.organizations:
-            if not org.name:
-                continue
-
-            org_id, org_created = await find_or_create_organization(
-                tenant_id=tenant_id,
-                org=org,
-                db=db
-            )
+        orgs = [org for org in extraction_result.organizations if org.name]
+        resolved = await find_or_create_organizations(
+            tenant_id=tenant_id,
+            orgs=orgs,
+            db=db
+        )
 
+        for org_id, org_created in resolved:
             organization_ids.append(org_id)
-
             if org_created:
                 created_orgs += 1
             else:
                 reused_orgs += 1
 
-            # Link project to organization
-            await link_project_organization(
-                project_id=project_id,
-                organization_id=org_id,
-                org=org,
-                db=db
-            )
+        # Link project to organizations
+        await link_project_organizations(
+            project_id=project_id,
+            links=[(org_id, org) for (org_id, _), org in zip(resolved, orgs)],
+            db=db
+        )
 
         # ─────────────────────────────────────────────────────
         # STEP 5: Link news to project
@@ -674,6 +861,9 @@ async def ingest_article_as_project(
             source_url=input.source_url,
             tenant_id=tenant_id
         )
+    finally:
+        # Rows may have been written even if a later step failed
+        invalidate_tenant_cache(tenant_id)
 
 
 # ============================================================
@@ -681,29 +871,46 @@ async def ingest_article_as_project(
 # ============================================================
 
 async def ingest_articles_batch(
-    articles: List[ArticleIngestionInput]
+    articles: List[ArticleIngestionInput],
+    concurrency: int = BATCH_INGEST_CONCURRENCY,
+    use_cache: bool = True
 ) -> List[IngestionResult]:
     """
-    Ingest multiple articles.
+    Ingest multiple articles, up to `concurrency` at a time.
+
+    The LLM extractions overlap; the database steps of each article do not
+    await real I/O (synchronous Supabase client), so they still run one
+    article at a time and project / organization deduplication sees the
+    rows written for the previous articles.
 
     Args:
         articles: List of ArticleIngestionInput
+        concurrency: Maximum number of articles in flight
+        use_cache: Reuse cached extractions (see ingest_article_as_project)
 
     Returns:
-        List of IngestionResult for each article
+        List of IngestionResult for each article, in input order
     """
-    results = []
+    semaphore = asyncio.Semaphore(concurrency)
 
-    for i, article in enumerate(articles):
-        logger.info(f"Processing article {i+1}/{len(articles)}: {article.source_url}")
+    async def _ingest(i: int, article: ArticleIngestionInput) -> IngestionResult:
+        async with semaphore:
+            logger.info(f"Processing article {i+1}/{len(articles)}: {article.source_url}")
+            return await ingest_article_as_project(article, use_cache=use_cache)
 
-        try:
-            result = await ingest_article_as_project(article)
-            results.append(result)
-        except SharkIngestionError as e:
-            logger.error(f"Failed to ingest {article.source_url}: {e}")
+    outcomes = await asyncio.gather(
+        *(_ingest(i, article) for i, article in enumerate(articles)),
+        return_exceptions=True
+    )
+
+    results = []
+    for article, outcome in zip(articles, outcomes):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            logger.error(f"Failed to ingest {article.source_url}: {outcome}")
             # Create error result
-            results.append(IngestionResult(
+            outcome = IngestionResult(
                 tenant_id=article.tenant_id,
                 project_id=None,
                 news_id=None,
@@ -712,8 +919,9 @@ async def ingest_articles_batch(
                 reused_existing_project=False,
                 created_organizations_count=0,
                 reused_organizations_count=0,
-                message=f"Error: {str(e)}"
-            ))
+                message=f"Error: {str(outcome)}"
+            )
+        results.append(outcome)
 
     # Summary
     success_count = sum(1 for r in results if r.project_id or r.news_id)
@@ -44,6 +44,8 @@ from loguru import logger
 from supabase import Client
 from difflib import SequenceMatcher
 
+from services.shark_graph_service import invalidate_tenant_cache
+
 
 # ============================================================
 # CONFIGURATION
@@ -994,6 +996,8 @@ async def ingest_permit_as_project(
         logger.error(f"[Permits] Ingestion error for {permit.external_id}: {e}")
         result.message = f"error: {str(e)}"
 
+    # Rows may have been written even if a later step failed
+    invalidate_tenant_cache(tenant_id)
     return result
 
 
@@ -33,6 +33,8 @@ from typing import Optional, List, Literal
 from pydantic import BaseModel, Field, field_validator
 from openai import AsyncOpenAI
 
+from utils.normalization import url_canonicalize
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -290,6 +292,41 @@ RAPPELS IMPORTANTS :
 Retourne UNIQUEMENT le JSON, sans aucun texte autour."""
 
 
+# ============================================================
+# LLM PARAMETERS
+# ============================================================
+
+# Also hashed into the extraction cache key of shark_ingestion_service:
+# changing one of them (or the prompts) makes cached results miss
+EXTRACTION_MODEL = "gpt-4o"
+EXTRACTION_TEMPERATURE = 0.1
+EXTRACTION_MAX_TOKENS = 2000
+
+# Article characters sent to the LLM
+EXTRACTION_MAX_ARTICLE_CHARS = 15000
+
+
+def build_user_prompt(
+    article_text: str,
+    source_name: Optional[str],
+    source_url: str,
+    published_at_str: str
+) -> str:
+    """
+    Render USER_PROMPT_TEMPLATE for an article.
+
+    The text is truncated to EXTRACTION_MAX_ARTICLE_CHARS and the URL
+    canonicalized, so the same article under other tracking parameters
+    gets the same prompt (and extraction cache key).
+    """
+    return USER_PROMPT_TEMPLATE.format(
+        source_name=source_name or "Source inconnue",
+        source_url=url_canonicalize(source_url),
+        published_at=published_at_str,
+        article_text=article_text[:EXTRACTION_MAX_ARTICLE_CHARS]
+    )
+
+
 # ============================================================
 # MAIN EXTRACTION FUNCTION
 # ============================================================
@@ -329,23 +366,18 @@ async def extract_project_from_article(
     published_at_str = published_at_input.strftime("%Y-%m-%d")
 
     # Build user prompt
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        source_name=source_name or "Source inconnue",
-        source_url=source_url,
-        published_at=published_at_str,
-        article_text=article_text[:15000]  # Limit text length
-    )
+    user_prompt = build_user_prompt(article_text, source_name, source_url, published_at_str)
 
     try:
         # Call OpenAI with JSON mode
         response = await openai_client.chat.completions.create(
-            model="gpt-4o",
+            model=EXTRACTION_MODEL,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            temperature=0.1,
-            max_tokens=2000,
+            temperature=EXTRACTION_TEMPERATURE,
+            max_tokens=EXTRACTION_MAX_TOKENS,
             response_format={"type": "json_object"}
         )
 
@@ -25,6 +25,8 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 from supabase import Client
 
+from services.shark_graph_service import invalidate_tenant_cache
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -803,6 +805,7 @@ async def compute_shark_score(
             "shark_priority": priority,
             "updated_at": datetime.utcnow().isoformat()
         }).eq("id", str(project_id)).execute()
+        invalidate_tenant_cache(tenant_id)
 
         logger.info(f"Updated shark_score for project {project_id}: {final_score} ({priority})")
     except Exception as e:
@@ -0,0 +1,299 @@
+"""
+Unit tests for local extraction utilities.
+
+Tests the privacy-compliant extraction layer including:
+- LocalExtractor regex extraction
+- Shared extractor instance
+- Multi-document batch extraction
+- SafeLLMExtractor regex fast path and batching (LLM mocked)
+
+Run with: pytest tests/test_extraction_utils.py -v
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services.extraction_utils import (
+    AzureResultMerger,
+    PROCESS_POOL_MIN_DOCUMENTS,
+    SafeLLMExtractor,
+    enhance_azure_result,
+    enhance_azure_results_batch,
+    extract_invoice_pii,
+    extract_invoice_pii_batch,
+    get_default_extractor,
+    lower_preserving_offsets,
+)
+
+
+# ============================================================
+# FIXTURES
+# ============================================================
+
+@pytest.fixture
+def invoice_text():
+    """Invoice snippet with contact, company and payment details."""
+    return (
+        "Facture du 12/03/2024\n"
+        "Fournisseur: ACME SARL, SIRET 732 829 320 00074\n"
+        "Tél: 06 12 34 56 78 - comptabilite@acme.fr\n"
+        "TVA FR12345678901\n"
+        "Conditions de paiement: 30 jours fin de mois"
+    )
+
+
+@pytest.fixture
+def llm_extractor():
+    """SafeLLMExtractor with anonymization bypassed."""
+    extractor = SafeLLMExtractor()
+    extractor.sanitize = lambda text: (text, {})
+    return extractor
+
+
+@pytest.fixture
+def mock_chain():
+    """LLM | parser chain stand-in."""
+    chain = MagicMock()
+    chain.ainvoke = AsyncMock(return_value={"payment_days": 30})
+    return chain
+
+
+# ============================================================
+# TEST: Local Extraction
+# ============================================================
+
+class TestLocalExtractor:
+    """Tests for LocalExtractor.extract_all."""
+
+    def test_extract_all(self, invoice_text):
+        """Should find the best email, phone and SIRET candidates."""
+        result = get_default_extractor().extract_all(invoice_text)
+
+        assert result.best_email == "comptabilite@acme.fr"
+        assert result.best_phone == "06 12 34 56 78"
+        assert result.best_siret == "732 829 320 00074"
+        assert result.dates[0].value == "12/03/2024"
+        assert result.dates[0].pattern_name == "invoice_date"
+
+    def test_context_keywords_boost_confidence(self):
+        """A SIRET preceded by its keyword should score higher."""
+        extractor = get_default_extractor()
+        with_keyword = extractor.extract_siret_siren("SIRET 732 829 320 00074")
+        without_keyword = extractor.extract_siret_siren("ref 732 829 320 00074")
+
+        assert with_keyword[0].confidence > without_keyword[0].confidence
+
+    def test_empty_text(self):
+        """Should return an empty result for empty text."""
+        result = get_default_extractor().extract_all("")
+        assert result.best_email is None
+        assert result.phones == []
+
+    def test_mergers_share_extractor(self):
+        """All mergers should reuse the module-level extractor."""
+        assert AzureResultMerger().local_extractor is AzureResultMerger().local_extractor
+        assert AzureResultMerger().local_extractor is get_default_extractor()
+
+    def test_lowercase_keeps_offsets(self):
+        """Lowercasing should keep offsets even for length-changing characters."""
+        text = "İstanbul SIRET"
+        lowered = lower_preserving_offsets(text)
+
+        assert len(lowered) == len(text)
+        assert lowered.index("siret") == text.index("SIRET")
+
+
+# ============================================================
+# TEST: LLM Payment Terms Extraction
+# ============================================================
+
+class TestExtractionBatch:
+    """Tests for extract_invoice_pii_batch / enhance_azure_results_batch."""
+
+    def test_serial_matches_single_calls(self, invoice_text):
+        """Small batches should give the same results as one call per text."""
+        texts = [invoice_text, "rien", invoice_text]
+
+        results = extract_invoice_pii_batch(texts, workers=1)
+
+        assert results == [extract_invoice_pii(text) for text in texts]
+
+    def test_process_pool_keeps_order(self, invoice_text):
+        """Large batches go through worker processes and keep input order."""
+        texts = [invoice_text, "rien"] * (PROCESS_POOL_MIN_DOCUMENTS // 2)
+
+        results = extract_invoice_pii_batch(texts, workers=2)
+
+        assert results == [extract_invoice_pii(text) for text in texts]
+
+    def test_enhance_batch(self, invoice_text):
+        """Should enhance each Azure result with its own document text."""
+        azure_results = [{}, {"VendorName": {"value": "Acme"}}]
+
+        results = enhance_azure_results_batch(azure_results, [invoice_text, "rien"], workers=1)
+
+        assert results == [
+            enhance_azure_result({}, invoice_text),
+            enhance_azure_result({"VendorName": {"value": "Acme"}}, "rien"),
+        ]
+
+
+class TestPaymentTermsBatch:
+    """Tests for SafeLLMExtractor batch entry points."""
+
+    def test_batch_keeps_input_order(self, llm_extractor, mock_chain):
+        """Should return one result per document, None when no section found."""
+        texts = ["Paiement a reception", "Rien a signaler", "Echeance fin de mois"]
+
+        with patch.object(SafeLLMExtractor, "_get_chain", return_value=mock_chain):
+            results = asyncio.run(llm_extractor.extract_payment_terms_batch(texts, max_concurrency=2))
+
+        assert results == [{"payment_days": 30}, None, {"payment_days": 30}]
+        assert mock_chain.ainvoke.await_count == 2
+
+    def test_grouped_maps_results_by_index(self, llm_extractor, mock_chain):
+        """Should send sections together and map the array back by index."""
+        texts = ["Paiement a reception", "Rien a signaler", "Echeance fin de mois"]
+        mock_chain.ainvoke.return_value = [
+            {"index": 2, "payment_days": 45},
+            {"index": 0, "payment_days": 30},
+        ]
+
+        with patch.object(SafeLLMExtractor, "_get_chain", return_value=mock_chain):
+            results = asyncio.run(llm_extractor.extract_payment_terms_grouped(texts, group_size=10))
+
+        assert results == [{"payment_days": 30}, None, {"payment_days": 45}]
+        assert mock_chain.ainvoke.await_count == 1
+
+    def test_grouped_retries_unmatched_documents(self, llm_extractor, mock_chain):
+        """Items without an int index should send their documents back one by one."""
+        texts = ["Paiement a reception", "Echeance fin de mois"]
+        mock_chain.ainvoke.side_effect = [
+            [{"index": "0", "payment_days": 0}, {"index": 1, "payment_days": 45}],
+            {"payment_days": 0},
+        ]
+
+        with patch.object(SafeLLMExtractor, "_get_chain", return_value=mock_chain):
+            results = asyncio.run(llm_extractor.extract_payment_terms_grouped(texts, group_size=10))
+
+        assert results == [{"payment_days": 0}, {"payment_days": 45}]
+        assert mock_chain.ainvoke.await_count == 2
+
+    def test_grouped_tolerates_llm_failure(self, llm_extractor, mock_chain):
+        """A failing group should leave its documents as None."""
+        mock_chain.ainvoke.side_effect = RuntimeError("rate limited")
+
+        with patch.object(SafeLLMExtractor, "_get_chain", return_value=mock_chain):
+            results = asyncio.run(llm_extractor.extract_payment_terms_grouped(["Paiement a reception"]))
+
+        assert results == [None]
+
+
+class TestPaymentTermsFastPath:
+    """Tests for the local regex fast path of extract_payment_terms."""
+
+    def test_standard_wording_skips_llm(self, llm_extractor):
+        """Day count and method should be resolved without calling the LLM."""
+        with patch.object(SafeLLMExtractor, "_get_chain") as get_chain:
+            result = llm_extractor.extract_payment_terms(
+                "Conditions de paiement: 30 jours fin de mois par virement"
+            )
+
+        get_chain.assert_not_called()
+        assert result == {
+            "payment_days": 30,
+            "payment_method": "bank transfer",
+            "discount_early": None,
+            "late_penalty": None,
+        }
+
+    def test_uppercase_wording(self, llm_extractor):
+        """Keyword search should stay case-insensitive."""
+        result = llm_extractor._fast_payment_terms("RÈGLEMENT : 45 JOURS PAR CHÈQUE")
+        assert result["payment_days"] == 45
+        assert result["payment_method"] == "check"
+
+    def test_net_days(self, llm_extractor):
+        """Should read 'net 45' as 45 payment days."""
+        assert llm_extractor._fast_payment_terms("Payment terms: net 45")["payment_days"] == 45
+
+    def test_discount_clause_falls_back_to_llm(self, llm_extractor):
+        """Discounts/penalties need the LLM, so the fast path should miss."""
+        assert llm_extractor._fast_payment_terms("Paiement a 30 jours, escompte 2% a 10 jours") is None
+
+    def test_days_outside_payment_section_ignored(self, llm_extractor):
+        """A day count with no payment keyword should not be picked up."""
+        assert llm_extractor._fast_payment_terms("Devis valable 90 jours") is None
+
+    def test_delivery_delay_not_read_as_terms(self, llm_extractor):
+        """A delivery or return delay next to the payment term should go to the LLM."""
+        assert llm_extractor._fast_payment_terms("Livraison sous 15 jours. Paiement à 60 jours") is None
+        assert llm_extractor._fast_payment_terms("Retour sous 8 jours. Règlement à 45 jours") is None
+
+    def test_days_must_follow_payment_keyword(self, llm_extractor):
+        """A lone day count away from the payment keyword should not be picked up."""
+        assert llm_extractor._fast_payment_terms("Conditions : livraison sous 15 jours") is None
+
+    @pytest.mark.parametrize("text", [
+        "Conditions de paiement : à réception. Montant net 250 EUR",
+        "Conditions de paiement : à réception. Total net 120,00 €",
+        "Échéance : Net 500",
+    ])
+    def test_net_amounts_not_read_as_days(self, llm_extractor, text):
+        """Net amounts (or implausible terms) should go to the LLM."""
+        assert llm_extractor._fast_payment_terms(text) is None
+
+    def test_net_with_days_unit(self, llm_extractor):
+        """Should read 'net 30 jours' as 30 payment days."""
+        assert llm_extractor._fast_payment_terms("Conditions : net 30 jours")["payment_days"] == 30
+
+    def test_days_net(self, llm_extractor):
+        """Should read '30 jours net' as 30 payment days."""
+        assert llm_extractor._fast_payment_terms("Conditions : 30 jours net")["payment_days"] == 30
+
+    def test_grouped_only_sends_fast_path_misses(self, llm_extractor, mock_chain):
+        """Documents resolved locally should not be sent to the LLM."""
+        mock_chain.ainvoke.return_value = [{"index": 1, "payment_days": 0}]
+
+        with patch.object(SafeLLMExtractor, "_get_chain", return_value=mock_chain):
+            results = asyncio.run(llm_extractor.extract_payment_terms_grouped(
+                ["Paiement a 30 jours", "Paiement a reception"]
+            ))
+
+        assert results[0]["payment_days"] == 30
+        assert results[1] == {"payment_days": 0}
+        prompt = mock_chain.ainvoke.await_args.args[0][1].content
+        assert "DOCUMENT 1" in prompt and "DOCUMENT 0" not in prompt
+
+
+class TestPaymentSection:
+    """Tests for _extract_payment_section."""
+
+    def test_no_keyword(self, llm_extractor):
+        """Should return None when no payment keyword is present."""
+        assert llm_extractor._extract_payment_section("Devis valable 90 jours") is None
+
+    def test_joins_distant_windows(self, llm_extractor):
+        """Keywords far apart should each get a window."""
+        text = "Paiement a 30 jours" + " x" * 300 + " Modalités: pénalités de retard de 3 fois le taux"
+
+        section = llm_extractor._extract_payment_section(text)
+
+        first, second = section.split(SafeLLMExtractor.PAYMENT_SECTION_SEPARATOR)
+        assert first.startswith("Paiement a 30 jours")
+        assert "pénalités de retard" in second
+
+    def test_nearby_keywords_share_window(self, llm_extractor):
+        """Hits inside an existing window should not be repeated."""
+        section = llm_extractor._extract_payment_section("Conditions de paiement: 30 jours")
+        assert section == "Conditions de paiement: 30 jours"
+
+    def test_caps_number_of_windows(self, llm_extractor):
+        """Should keep at most PAYMENT_SECTION_WINDOWS windows."""
+        text = (" x" * 200 + " paiement").join([""] * 6)
+
+        section = llm_extractor._extract_payment_section(text)
+
+        assert section.count(SafeLLMExtractor.PAYMENT_SECTION_SEPARATOR) == \
+            SafeLLMExtractor.PAYMENT_SECTION_WINDOWS - 1
@@ -0,0 +1,373 @@
+"""
+Unit tests for the Privacy Airlock service.
+
+Tests the pattern-based parts of PII anonymization that run without
+Presidio/spaCy models:
+- French-specific regex detection
+- Overlap deduplication
+- Batch analysis / anonymization (Presidio mocked)
+
+Run with: pytest tests/test_privacy.py -v
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+
+from services.privacy import (
+    PrivacyAirlock,
+    PIIEntity,
+    create_safe_messages,
+    create_safe_messages_async,
+    get_airlock,
+    _airlock_for,
+)
+
+
+# ============================================================
+# FIXTURES
+# ============================================================
+
+@pytest.fixture
+def airlock():
+    """PrivacyAirlock with French patterns enabled."""
+    return PrivacyAirlock()
+
+
+@pytest.fixture
+def french_invoice_text():
+    """Invoice snippet containing one of each French pattern."""
+    return (
+        "NIR 185057800608436, tel 06 12 34 56 78, "
+        "IBAN FR76 3000 6000 0112 3456 7890 189, "
+        "SIRET 732 829 320 00074, TVA FR 12 345678901"
+    )
+
+
+# ============================================================
+# TEST: French Pattern Detection
+# ============================================================
+
+class TestFrenchPatterns:
+    """Tests for _detect_french_patterns."""
+
+    def test_detects_each_pattern_type(self, airlock, french_invoice_text):
+        """Should tag each match with the name of the pattern that found it."""
+        entities = airlock._detect_french_patterns(french_invoice_text)
+        types = [e.entity_type for e in entities]
+
+        assert types == ["FR_SSN", "FR_PHONE", "FR_IBAN", "FR_SIRET", "FR_TVA"]
+
+    def test_positions_match_text(self, airlock, french_invoice_text):
+        """Entity offsets should slice back to the matched text."""
+        for entity in airlock._detect_french_patterns(french_invoice_text):
+            assert french_invoice_text[entity.start:entity.end] == entity.text
+
+    def test_case_insensitive(self, airlock):
+        """Should match lowercase IBAN prefixes."""
+        entities = airlock._detect_french_patterns("iban fr76 3000 6000 0112 3456 7890 189")
+        assert [e.entity_type for e in entities] == ["FR_IBAN"]
+
+    def test_matches_do_not_overlap(self, airlock):
+        """A span claimed by one pattern should not be reported by another."""
+        entities = airlock._detect_french_patterns("FR12345678901 0612345678")
+        spans = sorted((e.start, e.end) for e in entities)
+
+        for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+            assert next_start >= prev_end
+
+    def test_non_ascii_text_offsets(self, airlock):
+        """Offsets should stay correct when the text has accented characters."""
+        text = "Téléphone : 06 12 34 56 78, réf. FR76 3000 6000 0112 3456 7890 189"
+        entities = airlock._detect_french_patterns(text)
+
+        assert [e.entity_type for e in entities] == ["FR_PHONE", "FR_IBAN"]
+        for entity in entities:
+            assert text[entity.start:entity.end] == entity.text
+
+    def test_subclass_patterns_are_used(self):
+        """Overriding FRENCH_PATTERNS should change what gets detected."""
+        class IbanOnlyAirlock(PrivacyAirlock):
+            FRENCH_PATTERNS = {"FR_IBAN": PrivacyAirlock.FRENCH_PATTERNS["FR_IBAN"]}
+
+        entities = IbanOnlyAirlock()._detect_french_patterns(
+            "tel 06 12 34 56 78, IBAN FR76 3000 6000 0112 3456 7890 189"
+        )
+        assert [e.entity_type for e in entities] == ["FR_IBAN"]
+
+    def test_disabled(self):
+        """Should return nothing when French patterns are disabled."""
+        airlock = PrivacyAirlock(include_french_patterns=False)
+        assert airlock._detect_french_patterns("06 12 34 56 78") == []
+
+
+# ============================================================
+# TEST: Deduplication
+# ============================================================
+
+class TestDeduplication:
+    """Tests for _deduplicate_entities."""
+
+    def test_keeps_highest_score_on_same_start(self, airlock):
+        """Should keep the higher-scoring detection when two start together."""
+        low = PIIEntity(entity_type="PERSON", start=0, end=5, text="Alice", score=0.6)
+        high = PIIEntity(entity_type="FR_PHONE", start=0, end=5, text="Alice", score=0.95)
+
+        assert airlock._deduplicate_entities([low, high]) == [high]
+
+
+# ============================================================
+# TEST: Batch Analysis
+# ============================================================
+
+@pytest.fixture
+def mock_batch_analyzer():
+    """BatchAnalyzerEngine stand-in returning no Presidio entities."""
+    batch_analyzer = MagicMock()
+    batch_analyzer.analyze_iterator.side_effect = lambda texts, **kwargs: [[] for _ in texts]
+    with patch("services.privacy._get_batch_analyzer", return_value=batch_analyzer):
+        yield batch_analyzer
+
+
+class TestBatchAnalysis:
+    """Tests for analyze_batch / anonymize_batch / create_safe_messages."""
+
+    def test_analyze_batch_preserves_order(self, airlock, mock_batch_analyzer):
+        """Should return one entity list per input, skipping blank texts."""
+        batch = airlock.analyze_batch(["tel 06 12 34 56 78", "", "rien"])
+
+        assert [[e.entity_type for e in entities] for entities in batch] == [["FR_PHONE"], [], []]
+        sent = mock_batch_analyzer.analyze_iterator.call_args.kwargs["texts"]
+        assert sent == ["tel 06 12 34 56 78", "rien"]
+
+    def test_analyze_batch_falls_back_to_patterns(self, airlock):
+        """Should use pattern-only detection if Presidio is unavailable."""
+        with patch("services.privacy._get_batch_analyzer", side_effect=RuntimeError("no presidio")):
+            batch = airlock.analyze_batch(["tel 06 12 34 56 78"])
+
+        assert [e.entity_type for e in batch[0]] == ["FR_PHONE"]
+
+    def test_anonymize_batch_numbers_placeholders_per_text(self, airlock, mock_batch_analyzer):
+        """Each text should get its own placeholder numbering."""
+        results = airlock.anonymize_batch(["tel 06 12 34 56 78", "tel 07 98 76 54 32"])
+
+        assert [r["clean_text"] for r in results] == ["tel <FR_PHONE_1>", "tel <FR_PHONE_1>"]
+
+    def test_create_safe_messages_uses_one_batch(self, mock_batch_analyzer):
+        """Should sanitize string contents in a single batch call."""
+        messages = [
+            {"role": "system", "content": "Tu es comptable."},
+            {"role": "user", "content": [{"type": "image"}]},
+            {"role": "user", "content": "Appeler le 06 12 34 56 78"},
+        ]
+
+        safe_messages, mappings = create_safe_messages(messages)
+
+        assert mock_batch_analyzer.analyze_iterator.call_count == 1
+        assert safe_messages[1] is messages[1]
+        assert safe_messages[2]["content"] == "Appeler le <FR_PHONE_1>"
+        assert mappings == {"<FR_PHONE_1>": "06 12 34 56 78"}
+
+    def test_create_safe_messages_async(self, mock_batch_analyzer):
+        """Async variant should give the same result as the sync one."""
+        messages = [{"role": "user", "content": "Rappeler le 07 98 76 54 32"}]
+
+        safe_messages, mappings = asyncio.run(create_safe_messages_async(messages))
+
+        assert safe_messages == [{"role": "user", "content": "Rappeler le <FR_PHONE_1>"}]
+        assert mappings == {"<FR_PHONE_1>": "07 98 76 54 32"}
+
+
+# ============================================================
+# TEST: Presidio Prefilter
+# ============================================================
+
+class TestPresidioPrefilter:
+    """Tests for skipping Presidio on texts it cannot match."""
+
+    def test_skips_presidio_without_triggers(self, airlock, mock_batch_analyzer):
+        """Text without any trigger should not reach Presidio with default entities."""
+        batch = airlock.analyze_batch(["1 - 2", "Jean Dupont"])
+
+        assert batch[0] == []
+        sent = mock_batch_analyzer.analyze_iterator.call_args.kwargs["texts"]
+        assert sent == ["Jean Dupont"]
+
+    def test_phone_numbers_still_sent_to_presidio(self, airlock, mock_batch_analyzer):
+        """FR_PHONE misses +33612345678 and foreign numbers, so Presidio still sees them."""
+        airlock.analyze_batch(["tel +33612345678"])
+
+        kwargs = mock_batch_analyzer.analyze_iterator.call_args.kwargs
+        assert kwargs["texts"] == ["tel +33612345678"]
+        assert "PHONE_NUMBER" in kwargs["entities"]
+
+    def test_analyze_skips_presidio(self):
+        """analyze should not load Presidio when no trigger matches."""
+        airlock = PrivacyAirlock(entities=["EMAIL_ADDRESS", "IBAN_CODE"])
+        with patch("services.privacy._get_presidio_components") as components:
+            assert airlock.analyze("Total 1 234,56 EUR") == []
+
+        components.assert_not_called()
+
+    def test_short_text_uses_cheap_patterns(self):
+        """Short texts should be handled by regex when no NER entity is requested."""
+        airlock = PrivacyAirlock(entities=["EMAIL_ADDRESS", "CREDIT_CARD", "PHONE_NUMBER"])
+        text = "Mail jean@acme.fr, carte 4111 1111 1111 1111"
+        with patch("services.privacy._get_presidio_components") as components:
+            entities = airlock.analyze(text)
+
+        components.assert_not_called()
+        assert sorted(e.entity_type for e in entities) == ["CREDIT_CARD", "EMAIL_ADDRESS"]
+
+    def test_long_text_still_uses_presidio(self, mock_batch_analyzer):
+        """Texts above the threshold should go through Presidio."""
+        airlock = PrivacyAirlock(entities=["EMAIL_ADDRESS"])
+        text = "jean@acme.fr " * 30
+
+        airlock.analyze_batch([text])
+
+        assert mock_batch_analyzer.analyze_iterator.call_args.kwargs["texts"] == [text]
+
+    def test_person_disables_fast_path(self, airlock):
+        """Names have no regex stand-in, so the default airlock keeps NER."""
+        assert airlock._cheap_union is None
+
+    def test_unknown_entity_always_runs(self):
+        """Entities without a trigger should disable the prefilter."""
+        airlock = PrivacyAirlock(entities=["CUSTOM_ID"])
+        assert airlock._needs_presidio("...")
+
+
+# ============================================================
+# TEST: Airlock Instance Caching
+# ============================================================
+
+class TestAirlockCaching:
+    """Tests for shared PrivacyAirlock instances."""
+
+    def test_same_options_share_instance(self):
+        """Should reuse one airlock per distinct option set."""
+        assert _airlock_for() is get_airlock()
+        assert _airlock_for(extended_mode=True) is _airlock_for(extended_mode=True)
+        assert _airlock_for(entities=["PERSON"]) is _airlock_for(entities=["PERSON"])
+        assert _airlock_for(entities=["PERSON"]) is not _airlock_for(entities=["EMAIL_ADDRESS"])
+
+
+# ============================================================
+# TEST: Placeholder Replacement
+# ============================================================
+
+class TestPlaceholderReplacement:
+    """Tests for placeholder substitution in anonymize / hash_pii."""
+
+    def test_replaces_all_entities(self, airlock, french_invoice_text):
+        """Every detected span should be replaced, text in between kept."""
+        entities = airlock._detect_french_patterns(french_invoice_text)
+        result = airlock._build_anonymization(french_invoice_text, entities)
+
+        assert result["clean_text"] == (
+            "NIR <FR_SSN_1>, tel <FR_PHONE_1>, IBAN <FR_IBAN_1>, "
+            "SIRET <FR_SIRET_1>, TVA <FR_TVA_1>"
+        )
+        assert result["stats"] == {
+            "FR_SSN": 1, "FR_PHONE": 1, "FR_IBAN": 1, "FR_SIRET": 1, "FR_TVA": 1
+        }
+
+    def test_numbering_counts_from_end_of_text(self, airlock):
+        """Placeholders are numbered from the last entity backwards."""
+        text = "06 12 34 56 78 puis 07 98 76 54 32"
+        result = airlock._build_anonymization(text, airlock._detect_french_patterns(text))
+
+        assert result["clean_text"] == "<FR_PHONE_2> puis <FR_PHONE_1>"
+        assert result["mappings"] == {
+            "<FR_PHONE_1>": "07 98 76 54 32",
+            "<FR_PHONE_2>": "06 12 34 56 78",
+        }
+
+    def test_hash_pii_is_deterministic(self, airlock):
+        """Same input should give the same hashed placeholders."""
+        text = "Appeler 06 12 34 56 78 ou 07 98 76 54 32 demain"
+        with patch("services.privacy._get_presidio_components", side_effect=RuntimeError("no presidio")):
+            first = airlock.hash_pii(text)
+            second = airlock.hash_pii(text)
+
+        assert first == second
+        assert first["clean_text"].startswith("Appeler <FR_PHONE_")
+        assert first["clean_text"].endswith("> demain")
+        assert len(first["mappings"]) == 2
+
+
+# ============================================================
+# TEST: Rehydration
+# ============================================================
+
+class TestRehydrate:
+    """Tests for rehydrate."""
+
+    def test_round_trip(self, airlock, french_invoice_text):
+        """Rehydrating an anonymized text should restore the original."""
+        entities = airlock._detect_french_patterns(french_invoice_text)
+        result = airlock._build_anonymization(french_invoice_text, entities)
+
+        restored = airlock.rehydrate(result["clean_text"], result["mappings"])
+        assert restored == french_invoice_text
+
+    def test_restored_values_are_not_rescanned(self, airlock):
+        """An original value that looks like a placeholder must be kept as-is."""
+        mappings = {"<PERSON_1>": "<PERSON_2>", "<PERSON_2>": "Jean"}
+
+        assert airlock.rehydrate("<PERSON_1> et <PERSON_2>", mappings) == "<PERSON_2> et Jean"
+
+    def test_longest_placeholder_wins(self, airlock):
+        """<PERSON_10> should not be read as <PERSON_1> followed by '0>'."""
+        mappings = {"<PERSON_1": "A", "<PERSON_10>": "B"}
+
+        assert airlock.rehydrate("<PERSON_10>", mappings) == "B"
+
+    def test_empty_mappings(self, airlock):
+        """Should return the text unchanged when there is nothing to restore."""
+        assert airlock.rehydrate("rien", {}) == "rien"
+
+
+# ============================================================
+# TEST: Anonymization Cache
+# ============================================================
+
+class TestAnonymizationCache:
+    """Tests for the per-instance anonymize LRU cache."""
+
+    def test_repeat_text_skips_analysis(self, airlock):
+        """Anonymizing the same text twice should analyze it once."""
+        with patch.object(PrivacyAirlock, "analyze", wraps=airlock.analyze) as analyze, \
+                patch("services.privacy._get_presidio_components", side_effect=RuntimeError("no presidio")):
+            first = airlock.anonymize("tel 06 12 34 56 78")
+            second = airlock.anonymize("tel 06 12 34 56 78")
+
+        assert analyze.call_count == 1
+        assert first == second
+
+    def test_cached_result_is_a_copy(self, airlock):
+        """Mutating a returned result must not affect later calls."""
+        with patch("services.privacy._get_presidio_components", side_effect=RuntimeError("no presidio")):
+            airlock.anonymize("tel 06 12 34 56 78")["mappings"].clear()
+            result = airlock.anonymize("tel 06 12 34 56 78")
+
+        assert result["mappings"] == {"<FR_PHONE_1>": "06 12 34 56 78"}
+
+    def test_evicts_least_recently_used(self):
+        """Cache should stay bounded."""
+        airlock = PrivacyAirlock()
+        airlock.CACHE_MAX_ENTRIES = 2
+        with patch("services.privacy._get_presidio_components", side_effect=RuntimeError("no presidio")):
+            for text in ["a 06 12 34 56 78", "b 06 12 34 56 78", "c 06 12 34 56 78"]:
+                airlock.anonymize(text)
+
+        assert list(airlock._cache) == ["b 06 12 34 56 78", "c 06 12 34 56 78"]
+
+    def test_batch_only_analyzes_misses(self, airlock, mock_batch_analyzer):
+        """anonymize_batch should reuse cached results."""
+        airlock.anonymize_batch(["tel 06 12 34 56 78"])
+        airlock.anonymize_batch(["tel 06 12 34 56 78", "tel 07 98 76 54 32"])
+
+        sent = mock_batch_analyzer.analyze_iterator.call_args.kwargs["texts"]
+        assert sent == ["tel 07 98 76 54 32"]
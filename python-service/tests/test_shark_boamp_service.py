@@ -11,10 +11,13 @@ Tests the public tender functionality including:
 Run with: pytest tests/test_shark_boamp_service.py -v
 """
 
+import asyncio
+import json
 import pytest
 from datetime import datetime, timezone, timedelta
 from uuid import UUID, uuid4
 from unittest.mock import AsyncMock, MagicMock, patch
+from pydantic import ValidationError
 
 # Import test subjects
 from services.shark_boamp_service import (
@@ -23,10 +26,23 @@ from services.shark_boamp_service import (
     TenderFetchSummary,
     TenderIngestionSummary,
     _is_btp_relevant,
+    _contains_btp_keyword,
     _parse_tender_record,
+    _parse_date,
     _text_similarity,
     _cpv_overlap,
     _estimate_scale_from_cpv,
+    _group_tenders_by_region,
+    _find_matching_project,
+    _bigrams,
+    _TableCache,
+    _PendingLinks,
+    _parse_btp_records,
+    _upsert_tenders_bulk,
+    _update_project_score_for_tender,
+    _create_buyer_organization,
+    _link_tender_to_project,
+    ingest_tenders_bulk,
 )
 
 
@@ -122,6 +138,12 @@ class TestBtpRelevance:
         }
         assert _is_btp_relevant(data) is False
 
+    def test_keyword_helper_matches_accented_variants(self):
+        """Should match accented and plain spellings of a keyword."""
+        assert _contains_btp_keyword("lot 3 : maçonnerie")
+        assert _contains_btp_keyword("lot 3 : maconnerie")
+        assert not _contains_btp_keyword("prestations informatiques")
+
     def test_btp_relevant_multiple_keywords(self):
         """Should detect BTP with multiple keywords."""
         data = {"description": "Travaux de plomberie et electricite"}
@@ -186,6 +208,15 @@ class TestTenderParsing:
         tender2 = _parse_tender_record(record2)
         assert tender2.published_at is not None
 
+    def test_parse_date_variants(self):
+        """Should parse ISO dates, Z suffixes and date prefixes, else None."""
+        assert _parse_date("2024-11-15T10:00:00Z") == datetime(2024, 11, 15, 10, tzinfo=timezone.utc)
+        assert _parse_date("2024-11-15") == datetime(2024, 11, 15)
+        assert _parse_date("2024-11-15 vers midi") == datetime(2024, 11, 15, tzinfo=timezone.utc)
+        assert _parse_date("15/11/2024") is None
+        assert _parse_date("") is None
+        assert _parse_date(20241115) is None
+
     def test_parse_cpv_codes(self):
         """Should correctly parse CPV codes in various formats."""
         # As list
@@ -198,6 +229,16 @@ class TestTenderParsing:
         tender2 = _parse_tender_record(record2)
         assert len(tender2.cpv_codes) == 2
 
+    def test_parse_coerces_field_types(self):
+        """Numeric values become strings, unusable ones are dropped."""
+        record = {"fields": {"idannonce": 42, "siret": 21690123456789, "ville": ["Lyon"]}}
+
+        tender = _parse_tender_record(record)
+
+        assert tender.external_id == "42"
+        assert tender.buyer_siret == "21690123456789"
+        assert tender.location_city is None
+
     def test_parse_status_awarded(self):
         """Should detect awarded status."""
         record = {"fields": {"idannonce": "1", "etat": "attribue"}}
@@ -245,6 +286,54 @@ class TestTextSimilarity:
         assert _text_similarity("test", None) == 0.0
         assert _text_similarity(None, None) == 0.0
 
+    def test_symmetric_and_normalized(self):
+        """Order, case and surrounding spaces should not change the score."""
+        a, b = "Renovation Ecole Jean Moulin", "  ecole moulin "
+        assert _text_similarity(a, b) == _text_similarity(b, a)
+        assert _bigrams("Lyon ") == _bigrams("lyon")
+        assert _text_similarity("a", "A") == 1.0
+
+
+# ============================================================
+# TEST: Project Matching
+# ============================================================
+
+class TestProjectMatching:
+    """Tests for _find_matching_project scoring."""
+
+    @pytest.mark.asyncio
+    async def test_length_mismatch_skips_intersection(self, mock_db):
+        """Candidates ruled out by bigram set sizes should never be scored."""
+        tender = BoampTender(external_id="a", title="Renovation du groupe scolaire Jean Moulin")
+        candidates = [{"id": "1", "name": "Voirie"}]
+
+        with patch("services.shark_boamp_service._dice") as dice:
+            match = await _find_matching_project(tender, uuid4(), mock_db, candidates)
+
+        assert match is None
+        dice.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_picks_best_candidate_above_threshold(self, mock_db):
+        """Should return the highest-scoring project, skipping weak ones."""
+        tender = BoampTender(
+            external_id="a",
+            title="Renovation du groupe scolaire Jean Moulin",
+            cpv_codes=["45210000"],
+            location_city="Lyon",
+        )
+        candidates = [
+            {"id": "1", "name": "Construction d'un gymnase", "sector_tags": ["45"], "location_city": "Lyon"},
+            {"id": "2", "name": "Renovation groupe scolaire Jean Moulin", "sector_tags": ["45"], "location_city": "Lyon"},
+            {"id": "3", "name": "Renovation du groupe scolaire Jean Moulin", "sector_tags": ["45"], "location_city": "Lyon"},
+        ]
+        mock_db.table.return_value.select.return_value.eq.return_value.limit.return_value \
+            .execute.return_value = MagicMock(data=candidates)
+
+        match = await _find_matching_project(tender, uuid4(), mock_db)
+
+        assert match["id"] == "3"
+
 
 # ============================================================
 # TEST: CPV Overlap
@@ -328,6 +417,11 @@ class TestBoampTenderModel:
         assert tender.cpv_codes == []
         assert tender.raw_data == {}
 
+    def test_tender_is_frozen(self, sample_tender):
+        """Tenders should be immutable once parsed."""
+        with pytest.raises(ValidationError):
+            sample_tender.title = "Autre"
+
     def test_tender_with_dates(self, sample_tender):
         """Should handle datetime fields correctly."""
         assert sample_tender.published_at is not None
@@ -421,6 +515,18 @@ class TestEdgeCases:
         # Should return None or a minimal tender
         # The function should not raise an exception
 
+    def test_missing_id_is_deterministic(self):
+        """Records without an id should get the same content-derived id every time."""
+        record = {"fields": {"objet": "Travaux de voirie", "ville": "Lyon"}}
+
+        first = _parse_tender_record(record)
+        second = _parse_tender_record({"fields": {"ville": "Lyon", "objet": "Travaux de voirie"}})
+        other = _parse_tender_record({"fields": {"objet": "Travaux de voirie", "ville": "Nantes"}})
+
+        assert first.external_id.startswith("h_")
+        assert first.external_id == second.external_id
+        assert first.external_id != other.external_id
+
     def test_parse_record_with_unicode(self):
         """Should handle Unicode in tender data."""
         record = {
@@ -505,7 +611,7 @@ class TestMockApiResponses:
         with patch("services.shark_boamp_service.httpx.AsyncClient") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"records": []}
+            mock_response.content = b'{"records": []}'
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
@@ -542,6 +648,310 @@ class TestMockApiResponses:
             assert len(summary.errors) > 0
 
 
+# ============================================================
+# TEST: Response & Record Caches
+# ============================================================
+
+@pytest.fixture
+def clear_boamp_caches():
+    """Empty the module-level fetch caches around a test."""
+    from services import shark_boamp_service
+
+    shark_boamp_service._response_cache.clear()
+    shark_boamp_service._parsed_records.clear()
+    shark_boamp_service._http_client = None
+    yield
+    shark_boamp_service._response_cache.clear()
+    shark_boamp_service._parsed_records.clear()
+    shark_boamp_service._http_client = None
+
+
+class TestFetchCaches:
+    """Tests for conditional requests and parsed-record memoization."""
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag(self, sample_boamp_record, clear_boamp_caches):
+        """A 304 answer should reuse the records of the previous response."""
+        from services.shark_boamp_service import fetch_recent_tenders_for_region
+
+        fresh = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        fresh.content = json.dumps({"records": [sample_boamp_record]}).encode()
+        not_modified = MagicMock(status_code=304, headers={})
+
+        with patch("services.shark_boamp_service.httpx.AsyncClient") as mock_client:
+            client = AsyncMock()
+            client.get.side_effect = [fresh, not_modified]
+            client.__aenter__.return_value = client
+            mock_client.return_value = client
+
+            first, _ = await fetch_recent_tenders_for_region("Ile-de-France", 7)
+            second, summary = await fetch_recent_tenders_for_region("Ile-de-France", 7)
+
+        assert client.get.call_args_list[0].kwargs["headers"] == {}
+        assert client.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert [t.external_id for t in second] == [t.external_id for t in first] == ["24-789012"]
+        assert summary.total_fetched == 1
+
+    @pytest.mark.asyncio
+    async def test_query_values_are_quoted(self, clear_boamp_caches):
+        """Region and keywords should be quoted in the search query."""
+        from services.shark_boamp_service import fetch_recent_tenders_for_region, fetch_tenders_by_keywords
+
+        response = MagicMock(status_code=200, headers={})
+        response.content = b'{"records": []}'
+
+        with patch("services.shark_boamp_service.httpx.AsyncClient") as mock_client:
+            client = AsyncMock()
+            client.get.return_value = response
+            client.__aenter__.return_value = client
+            mock_client.return_value = client
+
+            await fetch_recent_tenders_for_region("Provence-Alpes-Cote d'Azur", 7)
+            await fetch_tenders_by_keywords(["genie civil", 'lot "A"'], 7)
+
+        region_q = client.get.call_args_list[0].kwargs["params"]["q"]
+        keywords_q = client.get.call_args_list[1].kwargs["params"]["q"]
+        assert region_q.startswith('region:"Provence-Alpes-Cote d\'Azur" AND ')
+        assert keywords_q.startswith('("genie civil" OR "lot \\"A\\"") AND ')
+
+    @pytest.mark.asyncio
+    async def test_http_client_shared_between_fetches(self, clear_boamp_caches):
+        """Fetches in the same event loop should reuse one pooled client."""
+        from services.shark_boamp_service import _get_http_client, close_http_client
+
+        client = _get_http_client()
+        assert _get_http_client() is client
+
+        await close_http_client()
+        assert client.is_closed
+        assert _get_http_client() is not client
+        await close_http_client()
+
+    def test_unchanged_records_parsed_once(self, sample_boamp_record, clear_boamp_caches):
+        """Identical records should only go through _parse_tender_record once."""
+        with patch(
+            "services.shark_boamp_service._parse_tender_record", wraps=_parse_tender_record
+        ) as parse:
+            first = _parse_btp_records([sample_boamp_record])
+            second = _parse_btp_records([dict(sample_boamp_record)])
+
+        assert parse.call_count == 1
+        assert second[0] is first[0]
+
+
+# ============================================================
+# TEST: Bulk Ingestion
+# ============================================================
+
+def _tender(external_id, region=None):
+    return BoampTender(external_id=external_id, location_region=region)
+
+
+class TestBulkIngestion:
+    """Tests for concurrent ingest_tenders_bulk."""
+
+    def test_group_by_region(self):
+        """Same-region tenders share a chain, regionless ones are kept apart."""
+        tenders = [_tender("a", "Bretagne"), _tender("b"), _tender("c", "bretagne "), _tender("d", "Corse")]
+
+        chains, without_region = _group_tenders_by_region(tenders)
+
+        assert chains == [[0, 2], [3]]
+        assert without_region == [1]
+
+    def test_table_cache_reuses_builders(self):
+        """Each table's request builder should be created once per batch."""
+        db = MagicMock()
+        tables = _TableCache(db)
+
+        assert tables.table("shark_projects") is tables.table("shark_projects")
+        tables.table("shark_organizations")
+
+        assert db.table.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_keeps_order_and_counts(self, mock_db):
+        """Results should follow input order, failures counted separately."""
+        tenders = [_tender("a", "Bretagne"), _tender("b"), _tender("c", "Corse"), _tender("d", "Bretagne")]
+        calls = []
+
+        async def fake_ingest(tender, tenant_id, db, upserted=None, now=None, candidates=None,
+                              known_links=None, orgs_by_siret=None, pending_links=None,
+                              buyer_locks=None):
+            calls.append(tender.external_id)
+            if tender.external_id == "c":
+                raise RuntimeError("boom")
+            return TenderIngestionResult(
+                tender_id=uuid4(), created_tender=True, message=tender.external_id
+            )
+
+        with patch("services.shark_boamp_service.ingest_tender_as_project", side_effect=fake_ingest), \
+                patch("services.shark_boamp_service._upsert_tenders_bulk", AsyncMock(return_value={})):
+            summary = await ingest_tenders_bulk(tenders, uuid4(), mock_db)
+
+        assert [r.message for r in summary.results] == ["a", "b", "d"]
+        assert summary.new_tenders == 3
+        assert summary.failed == 1
+        assert calls.index("a") < calls.index("d")
+        assert calls[-1] == "b"
+
+
+    @pytest.mark.asyncio
+    async def test_skips_tenders_already_linked(self, mock_db):
+        """Known tenders with a project link should only be upserted."""
+        seen_id, unlinked_id = uuid4(), uuid4()
+        upserted = {"a": (seen_id, False), "b": (unlinked_id, False)}
+        mock_db.table.return_value.select.return_value.in_.return_value.execute.return_value = \
+            MagicMock(data=[{"tender_id": str(seen_id)}])
+        ingest = AsyncMock(side_effect=lambda tender, *args: TenderIngestionResult(tender_id=args[2][0]))
+
+        with patch("services.shark_boamp_service._upsert_tenders_bulk", AsyncMock(return_value=upserted)), \
+                patch("services.shark_boamp_service.ingest_tender_as_project", ingest):
+            summary = await ingest_tenders_bulk([_tender("a", "Corse"), _tender("b", "Corse")], uuid4(), mock_db)
+
+        assert [call.args[0].external_id for call in ingest.await_args_list] == ["b"]
+        assert [r.tender_id for r in summary.results] == [seen_id, unlinked_id]
+        assert summary.results[0].message == "tender_already_ingested"
+
+    @pytest.mark.asyncio
+    async def test_region_candidates_fetched_once(self, mock_db):
+        """A region's candidates are fetched once and include projects created in the batch."""
+        tenders = [
+            BoampTender(external_id=external_id, title="Renovation de la piscine municipale",
+                        cpv_codes=["45210000"], location_region="Bretagne")
+            for external_id in ("a", "b")
+        ]
+        module = "services.shark_boamp_service"
+
+        with patch(f"{module}._upsert_tenders_bulk", AsyncMock(return_value={})), \
+                patch(f"{module}._upsert_tender", AsyncMock(side_effect=lambda *a: (uuid4(), True))), \
+                patch(f"{module}._fetch_match_candidates", AsyncMock(return_value=[])) as fetch, \
+                patch(f"{module}._create_project_from_tender", AsyncMock(return_value=uuid4())), \
+                patch(f"{module}._link_tender_to_project", AsyncMock()), \
+                patch(f"{module}._create_buyer_organization", AsyncMock(return_value=False)), \
+                patch(f"{module}._update_project_score_for_tender", AsyncMock()):
+            summary = await ingest_tenders_bulk(tenders, uuid4(), mock_db)
+
+        assert fetch.await_count == 1
+        assert summary.new_projects == 1
+        assert summary.reused_projects == 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_bulk_flags_new_tenders(self, mock_db):
+        """Should upsert all tenders at once and flag only unseen ones as created."""
+        table = mock_db.table.return_value
+        table.select.return_value.eq.return_value.in_.return_value.execute.return_value = \
+            MagicMock(data=[{"external_id": "a"}])
+        ids = {"a": str(uuid4()), "b": str(uuid4())}
+        table.upsert.return_value.execute.return_value = MagicMock(
+            data=[{"id": ids["a"], "external_id": "a"}, {"id": ids["b"], "external_id": "b"}]
+        )
+
+        upserted = await _upsert_tenders_bulk([_tender("a"), _tender("b"), _tender("a")], uuid4(), mock_db)
+
+        assert upserted == {"a": (UUID(ids["a"]), False), "b": (UUID(ids["b"]), True)}
+        rows = table.upsert.call_args.args[0]
+        assert [row["external_id"] for row in rows] == ["a", "b"]
+        assert table.upsert.call_args.kwargs["on_conflict"] == "tenant_id,external_id"
+
+
+    @pytest.mark.asyncio
+    async def test_score_update_uses_batch_timestamp(self, mock_db):
+        """Urgency and updated_at should come from the timestamp passed in."""
+        now = datetime(2024, 11, 1, tzinfo=timezone.utc)
+        tender = BoampTender(external_id="a", deadline_at=now + timedelta(days=5))
+        table = mock_db.table.return_value
+        table.select.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{"shark_score": 50}]
+        )
+
+        await _update_project_score_for_tender(uuid4(), tender, mock_db, now)
+
+        update = table.update.call_args.args[0]
+        assert update["shark_score"] == 50 + 15 + 20
+        assert update["updated_at"] == now.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_score_update_from_candidate_row(self, mock_db):
+        """A candidate row's score should be used and updated without a SELECT."""
+        now = datetime(2024, 11, 1, tzinfo=timezone.utc)
+        project = {"id": str(uuid4()), "shark_score": 60}
+
+        await _update_project_score_for_tender(UUID(project["id"]), _tender("a"), mock_db, now, project)
+
+        mock_db.table.return_value.select.assert_not_called()
+        assert project["shark_score"] == 60 + 15
+
+    @pytest.mark.asyncio
+    async def test_prefetched_siret_skips_org_lookup(self, mock_db):
+        """Buyers found in orgs_by_siret should be reused, new ones recorded."""
+        table = mock_db.table.return_value
+        table.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+        table.insert.return_value.execute.return_value = MagicMock(data=[{"id": "org-2"}])
+        orgs_by_siret = {"111": "org-1"}
+        known = BoampTender(external_id="a", buyer_name="Ville A", buyer_siret="111")
+        unknown = BoampTender(external_id="b", buyer_name="Ville B", buyer_siret="222")
+
+        assert await _create_buyer_organization(known, uuid4(), uuid4(), mock_db, None, orgs_by_siret) is False
+        assert await _create_buyer_organization(unknown, uuid4(), uuid4(), mock_db, None, orgs_by_siret) is True
+
+        assert orgs_by_siret == {"111": "org-1", "222": "org-2"}
+        assert [c.args[0] for c in mock_db.table.call_args_list].count("shark_organizations") == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tenders_create_buyer_once(self, mock_db):
+        """Tenders of the same buyer ingested concurrently should insert it once."""
+        table = mock_db.table.return_value
+        table.insert.return_value.execute.return_value = MagicMock(data=[{"id": "org-1"}])
+        orgs_by_siret, buyer_locks = {}, {}
+        tenders = [
+            BoampTender(external_id=external_id, buyer_name="Ville A", buyer_siret="111", location_region=region)
+            for external_id, region in (("a", "Bretagne"), ("b", "Corse"))
+        ]
+
+        created = await asyncio.gather(*[
+            _create_buyer_organization(
+                tender, uuid4(), uuid4(), mock_db, None, orgs_by_siret, _PendingLinks(), buyer_locks
+            )
+            for tender in tenders
+        ])
+
+        assert sorted(created) == [False, True]
+        org_inserts = [c for c in table.insert.call_args_list if c.args[0].get("name") == "Ville A"]
+        assert len(org_inserts) == 1
+
+    @pytest.mark.asyncio
+    async def test_known_links_skip_existence_query(self, mock_db):
+        """With known_links, a link is inserted once and never probed."""
+        known_links = set()
+        tender_id, project_id = uuid4(), uuid4()
+
+        for _ in range(2):
+            await _link_tender_to_project(
+                tender_id, project_id, "source", [], None, None, mock_db, known_links
+            )
+
+        mock_db.table.return_value.select.assert_not_called()
+        assert mock_db.table.return_value.insert.call_count == 1
+        assert known_links == {(str(project_id), str(tender_id), "source")}
+
+    @pytest.mark.asyncio
+    async def test_pending_links_flush_once_per_table(self, mock_db):
+        """Queued links should be deduplicated and written in one upsert per table."""
+        pending_links = _PendingLinks()
+        for _ in range(2):
+            pending_links.add("shark_project_tenders", {"project_id": "p", "tender_id": "t", "role": "source"})
+        pending_links.add("shark_project_tenders", {"project_id": "p", "tender_id": "u", "role": "source"})
+
+        await pending_links.flush(mock_db)
+
+        upsert = mock_db.table.return_value.upsert
+        assert upsert.call_count == 1
+        assert len(upsert.call_args.args[0]) == 2
+        assert upsert.call_args.kwargs == {"on_conflict": "project_id,tender_id,role", "ignore_duplicates": True}
+        mock_db.table.assert_called_once_with("shark_project_tenders")
+
+
 # ============================================================
 # RUN TESTS
 # ============================================================
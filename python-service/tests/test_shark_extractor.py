@@ -182,6 +182,116 @@ class TestProjectExtractorEdgeCases:
         print(f"\n✓ Short article handled: project={'found' if result.project else 'not found'}")
 
 
+class TestExtractionCache:
+    """Tests for the LLM response cache (LLM call mocked)."""
+
+    RAW = '{"project": {"name": "Piscine de Lyon"}, "organizations": []}'
+
+    def _llm(self, monkeypatch):
+        from unittest.mock import AsyncMock, MagicMock
+        from agents import project_extractor
+
+        llm = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content=self.RAW))]
+        ))
+        monkeypatch.setattr(project_extractor.openai_client.chat.completions, "create", llm)
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_llm(self, monkeypatch):
+        """A cached response should be parsed without calling the LLM."""
+        from unittest.mock import AsyncMock, MagicMock
+        from agents.project_extractor import ProjectExtractor
+
+        llm = self._llm(monkeypatch)
+        cache = MagicMock(get=AsyncMock(return_value=self.RAW), put=AsyncMock())
+
+        result = await ProjectExtractor(cache=cache).extract("Article", "https://example.com/a")
+
+        assert result.project.name == "Piscine de Lyon"
+        llm.assert_not_called()
+        cache.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_stores_response(self, monkeypatch):
+        """A successful extraction should be written back under the same key."""
+        from unittest.mock import AsyncMock, MagicMock
+        from agents.project_extractor import ProjectExtractor
+
+        llm = self._llm(monkeypatch)
+        cache = MagicMock(get=AsyncMock(return_value=None), put=AsyncMock())
+
+        await ProjectExtractor(cache=cache).extract("Article", "https://example.com/a")
+
+        llm.assert_awaited_once()
+        key = cache.get.call_args.args[0]
+        cache.put.assert_awaited_once_with(key, "gpt-4o", self.RAW)
+
+    @pytest.mark.asyncio
+    async def test_unparsable_hit_is_evicted(self, monkeypatch):
+        """A cached response that no longer validates should be re-extracted."""
+        from unittest.mock import AsyncMock, MagicMock
+        from agents.project_extractor import ProjectExtractor
+
+        llm = self._llm(monkeypatch)
+        stale = '{"project": {"name": "Piscine", "budget_amount": "beaucoup"}}'
+        cache = MagicMock(get=AsyncMock(return_value=stale), put=AsyncMock(), evict=AsyncMock())
+
+        result = await ProjectExtractor(cache=cache).extract("Article", "https://example.com/a")
+
+        assert result.project.name == "Piscine de Lyon"
+        key = cache.get.call_args.args[0]
+        cache.evict.assert_awaited_once_with(key)
+        llm.assert_awaited_once()
+        cache.put.assert_awaited_once_with(key, "gpt-4o", self.RAW)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_deletes_version(self):
+        """invalidate should delete the entries of one prompt version."""
+        from unittest.mock import MagicMock
+        from agents.project_extractor import ExtractionCache
+
+        db = MagicMock()
+        delete = db.table.return_value.delete.return_value
+        delete.eq.return_value.execute.return_value = MagicMock(data=[{}, {}])
+
+        removed = await ExtractionCache(db).invalidate("v0")
+
+        assert removed == 2
+        delete.eq.assert_called_once_with("prompt_version", "v0")
+
+    @pytest.mark.asyncio
+    async def test_tracking_parameters_share_entry(self, monkeypatch):
+        """URLs differing only in utm_* parameters should use one cache entry."""
+        from unittest.mock import AsyncMock, MagicMock
+        from agents.project_extractor import ProjectExtractor
+
+        self._llm(monkeypatch)
+        cache = MagicMock(get=AsyncMock(return_value=None), put=AsyncMock())
+        extractor = ProjectExtractor(cache=cache)
+
+        await extractor.extract("Article", "https://example.com/a?utm_source=newsletter")
+        await extractor.extract("Article", "https://example.com/a?utm_medium=social")
+
+        first, second = [c.args[0] for c in cache.get.call_args_list]
+        assert first == second
+
+    def test_key_depends_on_prompt(self):
+        """Keys should change with the prompt text and the model."""
+        from agents.project_extractor import extraction_cache_key
+
+        prompts = {"system": "s", "user": "article A"}
+        key = extraction_cache_key("gpt-4o", 0.1, 2000, prompts)
+
+        assert key == extraction_cache_key("gpt-4o", 0.1, 2000, dict(prompts))
+        assert key != extraction_cache_key("gpt-4o", 0.1, 2000, {"system": "s", "user": "article B"})
+        assert key != extraction_cache_key("gpt-4o-mini", 0.1, 2000, prompts)
+        assert key != extraction_cache_key("gpt-4o", 0.1, 2000, prompts, prompt_version="v0")
+        # Fields are length-framed: moving text across a boundary changes the key
+        assert extraction_cache_key("gpt-4o", 0.1, 2000, {"system": "ab", "user": "c"}) != \
+            extraction_cache_key("gpt-4o", 0.1, 2000, {"system": "a", "user": "bc"})
+
+
 # Quick test runner
 if __name__ == "__main__":
     print("🧪 Running Shark Extractor Tests\n")
@@ -0,0 +1,401 @@
+"""
+Unit tests for Shark Graph Service.
+
+Tests:
+- Read cache of list_projects / get_tenant_stats
+- Tenant invalidation
+- Batched project organizations
+- Organization people lookup
+- Shared HTTP connection pool
+
+Uses a mocked Supabase client (no database calls).
+
+Run with: pytest tests/test_shark_graph_service.py -v
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from services import shark_graph_service
+from services.shark_graph_service import (
+    ProjectFilters,
+    PROJECT_FILTERS,
+    SharkGraphService,
+    _apply_filters,
+    _decode_cursor,
+    _encode_cursor,
+    _keyset_filter,
+    _page_counts,
+    invalidate_tenant_cache,
+)
+
+
+# ============================================================
+# FIXTURES
+# ============================================================
+
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    """Empty the module-level read cache around each test."""
+    shark_graph_service._read_cache.clear()
+    yield
+    shark_graph_service._read_cache.clear()
+
+
+@pytest.fixture
+def mock_db():
+    """Supabase client answering list and stats queries."""
+    db = MagicMock()
+    query = db.table.return_value.select.return_value.eq.return_value
+    page = MagicMock(
+        data=[{"id": "p1", "tenant_id": "t1", "name": "Piscine", "created_at": "2024-01-01"}],
+        count=1,
+    )
+    ordered = query.order.return_value.order.return_value
+    ordered.range.return_value.execute.return_value = page
+    ordered.or_.return_value.limit.return_value.execute.return_value = page
+    db.rpc.return_value.execute.return_value = MagicMock(
+        data={"total_projects": 3, "projects_by_phase": {"etude": 3}}
+    )
+    return db
+
+
+# ============================================================
+# TEST: Read Cache
+# ============================================================
+
+class TestReadCache:
+    """Tests for the short-lived read cache."""
+
+    @pytest.mark.asyncio
+    async def test_same_filters_hit_cache(self, mock_db):
+        """Identical list requests should query the database once."""
+        service = SharkGraphService(mock_db)
+
+        first = await service.list_projects("t1", ProjectFilters(page=1))
+        second = await service.list_projects("t1", ProjectFilters(page=1))
+        await service.list_projects("t1", ProjectFilters(page=2))
+
+        assert second is first
+        assert mock_db.table.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, mock_db, monkeypatch):
+        """Entries older than READ_CACHE_TTL should not be served."""
+        service = SharkGraphService(mock_db)
+        monkeypatch.setattr(shark_graph_service, "READ_CACHE_TTL", -1.0)
+
+        await service.get_tenant_stats("t1")
+        stats = await service.get_tenant_stats("t1")
+
+        assert stats["projects_by_phase"] == {"etude": 3}
+        assert mock_db.rpc.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tenant(self, mock_db):
+        """Invalidation should only drop the given tenant's entries."""
+        service = SharkGraphService(mock_db)
+        await service.get_tenant_stats("t1")
+        await service.get_tenant_stats("t2")
+
+        invalidate_tenant_cache("t1")
+        await service.get_tenant_stats("t1")
+        await service.get_tenant_stats("t2")
+
+        assert mock_db.rpc.call_count == 3
+
+
+# ============================================================
+# TEST: Project Detail
+# ============================================================
+
+class TestGetProjectFull:
+    """Tests for get_project_full."""
+
+    @pytest.mark.asyncio
+    async def test_reads_through_function(self, mock_db):
+        """The project should come from the shark_get_project_full RPC."""
+        mock_db.rpc.return_value.execute.return_value = MagicMock(data={
+            "id": "p1", "tenant_id": "t1", "name": "Piscine",
+            "created_at": "2024-01-01", "updated_at": "2024-01-02",
+            "organizations": [{"organization_id": "o1"}], "org_count": 1,
+        })
+        service = SharkGraphService(mock_db)
+
+        project = await service.get_project_full("t1", "p1")
+
+        mock_db.rpc.assert_called_once_with(
+            "shark_get_project_full", {"p_tenant_id": "t1", "p_project_id": "p1"}
+        )
+        assert project.name == "Piscine"
+        assert project.org_count == 1
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, mock_db):
+        """A NULL function result should give None, and not be cached."""
+        mock_db.rpc.return_value.execute.return_value = MagicMock(data=None)
+        service = SharkGraphService(mock_db)
+
+        assert await service.get_project_full("t1", "p9") is None
+        assert await service.get_project_full("t1", "p9") is None
+        assert mock_db.rpc.call_count == 2
+
+
+class TestGetProjectHeader:
+    """Tests for get_project_header."""
+
+    @pytest.mark.asyncio
+    async def test_selects_summary_columns(self):
+        """Only the summary columns of shark_projects should be read."""
+        db = MagicMock()
+        select = db.table.return_value.select
+        select.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{"id": "p1", "tenant_id": "t1", "name": "Piscine", "created_at": "2024-01-01"}]
+        )
+        service = SharkGraphService(db)
+
+        header = await service.get_project_header("t1", "p1")
+
+        db.table.assert_called_once_with("shark_projects")
+        assert select.call_args.args[0] == shark_graph_service.PROJECT_SUMMARY_COLUMNS
+        assert header.name == "Piscine"
+        assert header.phase == "detection"
+
+
+# ============================================================
+# TEST: Project Listing
+# ============================================================
+
+class TestListProjects:
+    """Tests for list_projects argument checks."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_unindexed_order_by(self, mock_db):
+        """Sorting on a column outside PROJECT_ORDER_COLUMNS should be refused."""
+        service = SharkGraphService(mock_db)
+
+        with pytest.raises(ValueError):
+            await service.list_projects("t1", ProjectFilters(order_by="description_short"))
+
+        mock_db.table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_projects_table(self, mock_db):
+        """Lists should read stored counts from shark_projects, not the view."""
+        service = SharkGraphService(mock_db)
+
+        result = await service.list_projects("t1", ProjectFilters())
+
+        mock_db.table.assert_called_once_with("shark_projects")
+        assert result.items[0].org_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_uses_keyset(self, mock_db):
+        """A cursor should replace OFFSET with a keyset filter and LIMIT."""
+        service = SharkGraphService(mock_db)
+        cursor = _encode_cursor("2024-02-01T00:00:00+00:00", "p9")
+
+        result = await service.list_projects("t1", ProjectFilters(cursor=cursor, page_size=1))
+
+        ordered = mock_db.table.return_value.select.return_value.eq.return_value \
+            .order.return_value.order.return_value
+        ordered.range.assert_not_called()
+        ordered.or_.return_value.limit.assert_called_once_with(1)
+        assert result.has_more
+        assert _decode_cursor(result.next_cursor) == ("2024-01-01", "p1")
+
+
+# ============================================================
+# TEST: Filters
+# ============================================================
+
+class TestApplyFilters:
+    """Tests for the filter tables."""
+
+    def test_set_filters_only(self):
+        """None and empty values are skipped, a zero score is kept."""
+        query = MagicMock()
+        query.eq.return_value = query
+        query.gte.return_value = query
+        query.ilike.return_value = query
+        filters = ProjectFilters(phase="travaux", search="", min_shark_score=0)
+
+        assert _apply_filters(query, filters, PROJECT_FILTERS) is query
+
+        query.eq.assert_called_once_with("phase", "travaux")
+        query.gte.assert_called_once_with("shark_score", 0)
+        query.ilike.assert_not_called()
+
+    def test_search_pattern(self):
+        """Search should be a substring ILIKE on name."""
+        query = MagicMock()
+
+        _apply_filters(query, ProjectFilters(search="piscine"), PROJECT_FILTERS)
+
+        query.ilike.assert_called_once_with("name", "%piscine%")
+
+
+# ============================================================
+# TEST: Project Organizations
+# ============================================================
+
+class TestProjectOrganizations:
+    """Tests for the batched organizations lookup."""
+
+    @pytest.mark.asyncio
+    async def test_batch_keyed_by_project(self, mock_db):
+        """One RPC call should return each project's organizations."""
+        org = {"organization_id": "o1", "organization_name": "Mairie", "role_in_project": "MOA"}
+        mock_db.rpc.return_value.execute.return_value = MagicMock(data=[
+            {"project_id": "p1", "organizations": [org]},
+            {"project_id": "p2", "organizations": []},
+        ])
+        service = SharkGraphService(mock_db)
+
+        batch = await service.get_projects_organizations_batch("t1", ["p1", "p2", "p3"])
+
+        mock_db.rpc.assert_called_once_with(
+            "shark_project_orgs_batch",
+            {"p_tenant_id": "t1", "p_project_ids": ["p1", "p2", "p3"]}
+        )
+        assert batch == {"p1": [org], "p2": []}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_query(self, mock_db):
+        """No project ids should mean no database call."""
+        service = SharkGraphService(mock_db)
+
+        assert await service.get_projects_organizations_batch("t1", []) == {}
+        mock_db.rpc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_single_project_not_found(self, mock_db):
+        """A project outside the tenant should yield no organizations."""
+        mock_db.rpc.return_value.execute.return_value = MagicMock(data=[])
+        service = SharkGraphService(mock_db)
+
+        assert await service.get_project_organizations("t1", "p9") == []
+
+
+class TestOrganizationPeople:
+    """Tests for get_organization_people."""
+
+    @pytest.mark.asyncio
+    async def test_single_embedded_query(self):
+        """The tenant check and the people join should be one request."""
+        db = MagicMock()
+        query = db.table.return_value.select.return_value.eq.return_value.eq.return_value
+        query.order.return_value.execute.return_value = MagicMock(data=[{
+            "id": "o1",
+            "shark_organization_people": [{
+                "role_in_org": "Directeur",
+                "is_current": True,
+                "shark_people": {"id": "pe1", "full_name": "Jean Dupont"},
+            }],
+        }])
+        service = SharkGraphService(db)
+
+        people = await service.get_organization_people("t1", "o1")
+
+        db.table.assert_called_once_with("shark_organizations")
+        assert people[0]["person_id"] == "pe1"
+        assert people[0]["role_in_org"] == "Directeur"
+
+    @pytest.mark.asyncio
+    async def test_other_tenant_organization(self):
+        """An organization outside the tenant should yield no people."""
+        db = MagicMock()
+        query = db.table.return_value.select.return_value.eq.return_value.eq.return_value
+        query.order.return_value.execute.return_value = MagicMock(data=[])
+
+        assert await SharkGraphService(db).get_organization_people("t2", "o1") == []
+
+
+# ============================================================
+# TEST: Supabase Client
+# ============================================================
+
+class TestSupabaseClient:
+    """Tests for the shared Supabase client and its connection pool."""
+
+    @pytest.fixture(autouse=True)
+    def reset_client(self, monkeypatch):
+        monkeypatch.setattr(shark_graph_service, "_supabase", None)
+        monkeypatch.setattr(shark_graph_service, "_default_service", None)
+        monkeypatch.setattr(shark_graph_service, "supabase_url", "https://example.supabase.co")
+        monkeypatch.setattr(shark_graph_service, "supabase_key", "service-key")
+
+    def test_client_uses_pooled_http_client(self):
+        """The PostgREST session should be the keep-alive pooled client."""
+        client = shark_graph_service.get_supabase()
+        session = client.postgrest.session
+
+        assert session.timeout.connect == 5.0
+        assert session is shark_graph_service.get_supabase().postgrest.session
+        session.close()
+
+    def test_default_service_is_reused(self, monkeypatch):
+        """Convenience functions should share one service instance."""
+        monkeypatch.setattr(shark_graph_service, "_supabase", MagicMock())
+
+        first = shark_graph_service._get_default_service()
+
+        assert shark_graph_service._get_default_service() is first
+
+
+# ============================================================
+# TEST: Keyset Pagination
+# ============================================================
+
+class TestKeysetFilter:
+    """Tests for cursor encoding and the PostgREST keyset filter."""
+
+    def test_cursor_roundtrip(self):
+        """Cursors should decode to the (value, id) they were made from."""
+        assert _decode_cursor(_encode_cursor(42, "p1")) == (42, "p1")
+        assert _decode_cursor(_encode_cursor(None, "p1")) == (None, "p1")
+
+    def test_invalid_cursor(self):
+        """Garbage cursors should raise ValueError."""
+        with pytest.raises(ValueError):
+            _decode_cursor("not-a-cursor")
+
+    def test_descending_filter(self):
+        """DESC pages continue below the value, ties broken by id."""
+        assert _keyset_filter("shark_score", True, 80, "p1") == \
+            'shark_score.lt.80,and(shark_score.eq.80,id.lt."p1")'
+
+    def test_ascending_filter_includes_nulls(self):
+        """ASC pages end with the NULL values, and quote text values."""
+        assert _keyset_filter("name", False, 'Lot "A", Lyon', "p1") == \
+            'name.gt."Lot \\"A\\", Lyon",and(name.eq."Lot \\"A\\", Lyon",id.gt."p1"),name.is.null'
+
+    def test_null_cursor_value(self):
+        """After a NULL in DESC order, the remaining NULLs then every value follow."""
+        assert _keyset_filter("budget_amount", True, None, "p1") == \
+            'and(budget_amount.is.null,id.lt."p1"),budget_amount.not.is.null'
+
+
+# ============================================================
+# TEST: Pagination
+# ============================================================
+
+class TestPageCounts:
+    """Tests for _page_counts with estimated row counts."""
+
+    def test_full_page_has_more(self):
+        """A full page should report more rows, whatever the count."""
+        assert _page_counts(20, 0, 20, 20) == (20, True)
+
+    def test_partial_page_gives_exact_total(self):
+        """A partial page is the last one, so its end is the total."""
+        assert _page_counts(1000, 40, 5, 20) == (45, False)
+
+    def test_page_past_the_end_keeps_count(self):
+        """An empty page beyond the end should not invent a total."""
+        assert _page_counts(45, 80, 0, 20) == (45, False)
+
+    def test_low_estimate_raised_to_rows_seen(self):
+        """The total should never be below the rows already returned."""
+        assert _page_counts(30, 40, 20, 20) == (60, True)
+        assert _page_counts(None, 0, 3, 20) == (3, False)
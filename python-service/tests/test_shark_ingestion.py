@@ -0,0 +1,774 @@
+"""
+Unit tests for Shark Ingestion (services/shark_ingestion.py).
+
+Tests:
+- Duplicate article gate (canonical URL, SimHash)
+- Batched writes of ingest_articles (news items, project links)
+- Bounded concurrent extraction
+- Link row deduplication
+
+Uses a mocked Supabase client and extractor (no LLM or database calls).
+
+Run with: pytest tests/test_shark_ingestion.py -v
+"""
+
+import asyncio
+import pytest
+from postgrest.exceptions import APIError
+from unittest.mock import AsyncMock, MagicMock
+
+
+# ============================================================
+# FIXTURES
+# ============================================================
+
+def _org(name, city=None, org_type=None):
+    """Extracted organization stand-in (carries raw_role_label)."""
+    org = MagicMock(
+        city=city, org_type=org_type, region=None, country="FR",
+        role_in_project="MOA", raw_role_label="Maître d'ouvrage",
+    )
+    org.name = name
+    return org
+
+
+def _project(name, city=None, type=None):
+    """Extracted project stand-in."""
+    project = MagicMock(location_city=city, type=type)
+    project.name = name
+    return project
+
+
+def _extraction(project_name=None, org_names=()):
+    """Extraction result stand-in."""
+    project = _project(project_name) if project_name else None
+    orgs = [_org(name) for name in org_names]
+    return MagicMock(
+        extraction_success=True,
+        project=project,
+        organizations=orgs,
+        news=MagicMock(title="Titre", published_at=None, role_of_news="annonce_projet"),
+    )
+
+
+@pytest.fixture
+def shark_ingestion():
+    """The module under test (imported lazily: agents need API keys at import)."""
+    from services import shark_ingestion
+    return shark_ingestion
+
+
+@pytest.fixture
+def mock_db(monkeypatch, shark_ingestion):
+    """Module-level Supabase client answering upserts, inserts and org lookups."""
+    db = MagicMock()
+
+    def upsert(rows, **kwargs):
+        rows = rows if isinstance(rows, list) else [rows]
+        builder = MagicMock()
+        builder.execute.return_value = MagicMock(data=[
+            {"id": row.get("id") or f"news-{row.get('source_url')}", **row} for row in rows
+        ])
+        return builder
+
+    def insert(rows):
+        rows = rows if isinstance(rows, list) else [rows]
+        builder = MagicMock()
+        builder.execute.return_value = MagicMock(data=[
+            {"id": f"o-{row['name']}-{row['city']}", **row} for row in rows
+        ])
+        return builder
+
+    table = db.table.return_value
+    table.upsert.side_effect = upsert
+    table.insert.side_effect = insert
+    table.select.return_value.eq.return_value.in_.return_value.execute.return_value = \
+        MagicMock(data=[])
+    # shark_find_duplicate_news: no duplicate
+    db.rpc.return_value.execute.return_value = MagicMock(data=None)
+    monkeypatch.setattr(shark_ingestion, "supabase", db)
+    return db
+
+
+@pytest.fixture
+def service(mock_db, shark_ingestion):
+    """Ingestion service with stubbed extraction and project/org lookups."""
+    service = shark_ingestion.SharkIngestionService(tenant_id="t1")
+    service.extractor = MagicMock()
+    service.find_or_create_project = AsyncMock(return_value=("p1", False))
+    service._update_project = AsyncMock()
+    service._upsert_organization = AsyncMock(side_effect=lambda org, now_iso=None: f"o-{org.name}")
+    return service
+
+
+def _tables(db):
+    return [c.args[0] for c in db.table.call_args_list]
+
+
+# ============================================================
+# TEST: Helpers
+# ============================================================
+
+class TestNormalizeName:
+    """Tests for normalize_name."""
+
+    def test_accents_articles_and_spaces(self, shark_ingestion):
+        """Accents and French articles should be removed, spaces collapsed."""
+        normalize = shark_ingestion.normalize_name
+        assert normalize("  Le Centre Aquatique de l'Île  ") == "centre aquatique ile"
+        assert normalize("Théâtre DU Ñandú") == "theatre nandu"
+        assert normalize("") == ""
+
+
+class TestClusterProjects:
+    """Tests for cluster_projects."""
+
+    def test_paraphrased_names_are_merged(self, shark_ingestion):
+        """Name variants in the same city should form one cluster."""
+        projects = [
+            _project("Centre aquatique de Borderouge", "Toulouse"),
+            _project("Rénovation du lycée Victor Hugo", "Toulouse"),
+            _project("Le centre aquatique Borderouge", "toulouse"),
+            _project("Centre Aquatique de Borderouge", "Lyon"),
+        ]
+
+        assert shark_ingestion.cluster_projects(projects) == [[0, 2], [1], [3]]
+
+    def test_different_types_are_kept_apart(self, shark_ingestion):
+        """Known, different project types should not be merged."""
+        projects = [
+            _project("Piscine municipale", type="construction_neuve"),
+            _project("Piscine municipale", type="renovation"),
+            _project("Piscine municipale"),
+        ]
+
+        # The untyped project joins the first one only
+        assert shark_ingestion.cluster_projects(projects) == [[0, 2], [1]]
+
+
+# ============================================================
+# TEST: Duplicate Gate
+# ============================================================
+
+class TestUrlCanonicalize:
+    """Tests for url_canonicalize."""
+
+    def test_tracking_variants_are_equal(self, shark_ingestion):
+        """Tracking parameters, case, order and trailing slash should not matter."""
+        canonical = shark_ingestion.url_canonicalize
+        base = canonical("https://www.lemoniteur.fr/article/piscine?id=3&page=2")
+
+        assert canonical(
+            "https://WWW.LeMoniteur.fr/article/piscine/?page=2&utm_source=x&id=3&fbclid=abc#top"
+        ) == base
+        assert base == "https://www.lemoniteur.fr/article/piscine?id=3&page=2"
+
+    def test_path_case_is_kept(self, shark_ingestion):
+        """Paths are case sensitive."""
+        canonical = shark_ingestion.url_canonicalize
+        assert canonical("https://site.fr/Article") != canonical("https://site.fr/article")
+
+
+class TestSimhash64:
+    """Tests for simhash64."""
+
+    TEXT = (
+        "La mairie de Toulouse lance la construction d'un nouveau centre aquatique "
+        "de 5000 m2 dans le quartier Borderouge. Les travaux débuteront en 2025 "
+        "pour une livraison prévue fin 2027, pour un budget de 25 millions d'euros."
+    )
+
+    def test_near_duplicates_are_close(self, shark_ingestion):
+        """A lightly edited copy should be a few bits away, another text far away."""
+        simhash = shark_ingestion.simhash64
+        edited = self.TEXT.replace("débuteront", "commenceront") + " Crédit photo : AFP."
+        other = "Le conseil régional attribue le marché de rénovation du lycée Victor Hugo."
+
+        def distance(a, b):
+            return bin((simhash(a) ^ simhash(b)) & (1 << 64) - 1).count("1")
+
+        assert simhash(self.TEXT.upper()) == simhash(self.TEXT)
+        assert distance(self.TEXT, edited) <= 20
+        assert distance(self.TEXT, edited) < distance(self.TEXT, other)
+
+    def test_fits_bigint(self, shark_ingestion):
+        """Hashes should be signed 64-bit integers, None without words."""
+        value = shark_ingestion.simhash64(self.TEXT)
+        assert -(1 << 63) <= value < 1 << 63
+        assert shark_ingestion.simhash64("  ") is None
+
+
+class TestDuplicateGate:
+    """Tests for the pre-extraction duplicate lookup."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_skips_extraction(self, service, mock_db):
+        """An article already ingested should not be extracted again."""
+        mock_db.rpc.return_value.execute.return_value = MagicMock(
+            data=[{"news_id": "n1", "project_id": "p1"}]
+        )
+        service.extractor.extract = AsyncMock()
+
+        result = await service.ingest_article(
+            article_text="texte", source_url="https://site.fr/a/?utm_source=x"
+        )
+
+        assert result.success and result.is_duplicate and result.already_ingested
+        assert (result.news_id, result.project_id) == ("n1", "p1")
+        service.extractor.extract.assert_not_called()
+
+        name, params = mock_db.rpc.call_args.args
+        assert name == "shark_find_duplicate_news"
+        assert params["p_canonical_url"] == "https://site.fr/a"
+        assert params["p_source_url"] == "https://site.fr/a/?utm_source=x"
+
+    @pytest.mark.asyncio
+    async def test_only_recent_news_items_match(self, service, mock_db, shark_ingestion):
+        """The lookup should be limited to news items updated within NEWS_REFRESH_AFTER."""
+        from datetime import datetime, timezone
+        service.extractor.extract = AsyncMock(return_value=_extraction(None))
+
+        await service.ingest_article(article_text="texte", source_url="u1")
+
+        since = datetime.fromisoformat(mock_db.rpc.call_args.args[1]["p_fresh_since"])
+        age = datetime.now(timezone.utc) - since
+        assert abs(age - shark_ingestion.NEWS_REFRESH_AFTER).total_seconds() < 60
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_skips_lookup(self, service, mock_db):
+        """force_refresh should extract the article without looking it up."""
+        service.extractor.extract = AsyncMock(return_value=_extraction(None))
+
+        result = await service.ingest_article(
+            article_text="texte", source_url="u1", force_refresh=True
+        )
+
+        assert not result.already_ingested
+        mock_db.rpc.assert_not_called()
+        service.extractor.extract.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_extracts(self, service, mock_db):
+        """If the lookup fails, the article should be extracted as before."""
+        mock_db.rpc.side_effect = RuntimeError("boom")
+        service.extractor.extract = AsyncMock(return_value=_extraction(None))
+
+        result = await service.ingest_article(article_text="texte", source_url="u1")
+
+        assert result.success and not result.is_duplicate
+        service.extractor.extract.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_news_without_project_is_ingested_again(self, service, mock_db):
+        """A news item left without project by a failed ingestion should not be a duplicate."""
+        service.extractor.extract = AsyncMock(return_value=_extraction("Piscine"))
+        service.find_or_create_project = AsyncMock(side_effect=[RuntimeError("boom"), ("p1", False)])
+        news_upsert = mock_db.table.return_value.upsert
+
+        def rpc(name, params):
+            builder = MagicMock()
+            if name == "shark_find_duplicate_news":
+                stored = [{"news_id": "news-u1", "project_id": None}] if news_upsert.called else None
+                builder.execute.return_value = MagicMock(data=stored)
+            else:
+                builder.execute.side_effect = Exception("function ingest_article_bundle does not exist")
+            return builder
+        mock_db.rpc.side_effect = rpc
+
+        first = await service.ingest_article(article_text="texte", source_url="u1")
+        second = await service.ingest_article(article_text="texte", source_url="u1")
+
+        assert not first.success and news_upsert.called
+        assert second.success and not second.already_ingested
+        assert second.project_id == "p1"
+        assert service.extractor.extract.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_long_text_is_truncated_once(self, service, mock_db, shark_ingestion):
+        """The lookup, the extraction and the stored row should see the same text."""
+        service.extractor.extract = AsyncMock(return_value=_extraction("Piscine"))
+        text = "mot " * shark_ingestion.MAX_ARTICLE_CHARS
+        kept = text[:shark_ingestion.MAX_ARTICLE_CHARS]
+
+        await service.ingest_articles([{"article_text": text, "source_url": "u1"}])
+
+        assert service.extractor.extract.call_args.kwargs["article_text"] == kept
+        params = mock_db.rpc.call_args.args[1]
+        assert params["p_simhash"] == shark_ingestion.simhash64(kept)
+        row = mock_db.table.return_value.upsert.call_args_list[0].args[0][0]
+        assert row["full_text"] == kept
+
+    @pytest.mark.asyncio
+    async def test_news_rows_carry_fingerprints(self, service, mock_db, shark_ingestion):
+        """Stored news items should get their canonical URL and SimHash."""
+        service.extractor.extract = AsyncMock(return_value=_extraction("Piscine"))
+
+        await service.ingest_articles([
+            {"article_text": "un article", "source_url": "https://site.fr/a/"},
+        ])
+
+        row = mock_db.table.return_value.upsert.call_args_list[0].args[0][0]
+        assert row["canonical_url"] == "https://site.fr/a"
+        assert row["simhash"] == shark_ingestion.simhash64("un article")
+
+
+# ============================================================
+# TEST: Batched Ingestion
+# ============================================================
+
+class TestIngestArticles:
+    """Tests for SharkIngestionService.ingest_articles."""
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched(self, service, mock_db, shark_ingestion):
+        """News items and links should be written with one upsert per table."""
+        service.extractor.extract = AsyncMock(side_effect=[
+            _extraction("Piscine", ["Mairie"]),
+            _extraction(None),
+            _extraction("Piscine", ["Mairie", "Région"]),
+        ])
+        articles = [
+            {"article_text": "a", "source_url": "u1"},
+            {"article_text": "b", "source_url": "u2"},
+            {"article_text": "c", "source_url": "u3"},
+        ]
+
+        results = await service.ingest_articles(articles)
+
+        assert [r.project_id for r in results] == ["p1", None, "p1"]
+        assert [r.is_duplicate for r in results] == [False, False, True]
+        assert results[2].news_id == "news-u3"
+
+        # Same project in both articles: one lookup, the second updates it
+        service.find_or_create_project.assert_awaited_once()
+        service._update_project.assert_awaited_once()
+
+        assert _tables(mock_db) == [
+            "shark_news_items",
+            "shark_organizations", "shark_organizations",
+            "shark_project_organizations", "shark_project_news",
+        ]
+        service._upsert_organization.assert_not_called()
+
+        # Mairie appears in two articles: created once
+        created = mock_db.table.return_value.insert.call_args.args[0]
+        assert [row["name"] for row in created] == ["Mairie", "Région"]
+        assert results[0].organization_ids == results[2].organization_ids[:1]
+
+        upserts = mock_db.table.return_value.upsert.call_args_list
+        news_rows, link_org_rows, link_news_rows = (c.args[0] for c in upserts)
+        assert [row["source_url"] for row in news_rows] == ["u1", "u3"]
+        # (p1, Mairie, MOA) seen twice: written once
+        assert len(link_org_rows) == 2
+        assert len(link_news_rows) == 2
+        assert upserts[1].kwargs == {
+            "on_conflict": "project_id,organization_id,role_in_project",
+            "ignore_duplicates": True,
+            "returning": shark_ingestion.ReturnMethod.minimal,
+        }
+
+    @pytest.mark.asyncio
+    async def test_one_timestamp_per_batch(self, service, mock_db):
+        """Every row written for a batch should carry the same timestamp."""
+        service.extractor.extract = AsyncMock(side_effect=[
+            _extraction("Piscine"),
+            _extraction("Gymnase"),
+        ])
+
+        await service.ingest_articles([
+            {"article_text": "a", "source_url": "u1"},
+            {"article_text": "b", "source_url": "u2"},
+        ])
+
+        news_rows = mock_db.table.return_value.upsert.call_args_list[0].args[0]
+        stamps = {row["updated_at"] for row in news_rows}
+        stamps |= {c.args[1] for c in service.find_or_create_project.call_args_list}
+        assert len(stamps) == 1
+        assert stamps.pop().endswith("+00:00")
+
+    @pytest.mark.asyncio
+    async def test_failed_article_does_not_stop_batch(self, service, mock_db):
+        """A storage error should only fail its own article."""
+        service.extractor.extract = AsyncMock(side_effect=[
+            _extraction("Piscine"),
+            _extraction("Gymnase"),
+        ])
+        service.find_or_create_project = AsyncMock(
+            side_effect=[RuntimeError("boom"), ("p2", True)]
+        )
+
+        results = await service.ingest_articles([
+            {"article_text": "a", "source_url": "u1"},
+            {"article_text": "b", "source_url": "u2"},
+        ])
+
+        assert not results[0].success
+        assert results[1].project_id == "p2"
+        assert results[1].is_duplicate
+
+    @pytest.mark.asyncio
+    async def test_bulk_organization_failure_falls_back(self, service, mock_db):
+        """If the bulk organization upsert fails, orgs are upserted per row."""
+        service.extractor.extract = AsyncMock(return_value=_extraction("Piscine", ["Mairie"]))
+        mock_db.table.return_value.select.side_effect = RuntimeError("boom")
+
+        results = await service.ingest_articles([{"article_text": "a", "source_url": "u1"}])
+
+        assert results[0].organization_ids == ["o-Mairie"]
+        service._upsert_organization.assert_awaited_once()
+
+
+def _rpc(bundle=None):
+    """rpc side effect: no duplicate news, ingest_article_bundle answers bundle (or fails)."""
+    def rpc(name, params):
+        builder = MagicMock()
+        if name == "ingest_article_bundle" and bundle is None:
+            builder.execute.side_effect = APIError({
+                "code": "PGRST202", "message": "Could not find the function ingest_article_bundle"
+            })
+        else:
+            builder.execute.return_value = MagicMock(
+                data=bundle if name == "ingest_article_bundle" else None
+            )
+        return builder
+    return rpc
+
+
+class TestIngestArticle:
+    """Tests for SharkIngestionService.ingest_article."""
+
+    @pytest.mark.asyncio
+    async def test_stored_with_one_bundle_call(self, service, mock_db, shark_ingestion):
+        """News, project, organizations and links should be written by one RPC."""
+        service.extractor.extract = AsyncMock(return_value=shark_ingestion.ExtractionResult(
+            project=shark_ingestion.ExtractedProject(name="Piscine"),
+            organizations=[
+                shark_ingestion.ExtractedOrganization(name="Mairie"),
+                shark_ingestion.ExtractedOrganization(name="Région"),
+            ]
+        ))
+        mock_db.rpc.side_effect = _rpc({
+            "project_id": "p9", "news_id": "n1",
+            "organization_ids": ["o1", "o2"], "is_duplicate": True
+        })
+
+        result = await service.ingest_article(article_text="a", source_url="u1")
+
+        assert result.success and result.is_duplicate
+        assert (result.project_id, result.news_id) == ("p9", "n1")
+        assert result.organization_ids == ["o1", "o2"]
+        assert _tables(mock_db) == []
+        name, params = mock_db.rpc.call_args.args
+        assert name == "ingest_article_bundle"
+        assert params["p_news"]["source_url"] == "u1"
+        assert params["p_project"]["name"] == "Piscine"
+        assert [org["name"] for org in params["p_orgs"]] == ["Mairie", "Région"]
+        service.find_or_create_project.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_organizations_and_links_are_batched(self, service, mock_db):
+        """Without the bundle RPC, organizations and links should not cost requests per org."""
+        service.extractor.extract = AsyncMock(
+            return_value=_extraction("Piscine", ["Mairie", "Région", "Mairie"])
+        )
+        mock_db.rpc.side_effect = _rpc()
+
+        result = await service.ingest_article(article_text="a", source_url="u1")
+
+        assert result.success
+        assert result.organization_ids == ["o-Mairie-None", "o-Région-None", "o-Mairie-None"]
+        service._upsert_organization.assert_not_called()
+        assert _tables(mock_db) == [
+            "shark_news_items",
+            "shark_organizations", "shark_organizations",
+            "shark_project_organizations", "shark_project_news",
+        ]
+        news_upsert, link_upsert, _ = mock_db.table.return_value.upsert.call_args_list
+        assert news_upsert.kwargs == {"on_conflict": "tenant_id,source_url"}
+        assert len(link_upsert.args[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_bundle_not_retried(self, service, mock_db):
+        """After ingest_article_bundle failed once, later articles should skip it."""
+        service.extractor.extract = AsyncMock(return_value=_extraction("Piscine", ["Mairie"]))
+        mock_db.rpc.side_effect = _rpc()
+
+        await service.ingest_article(article_text="a", source_url="u1")
+        await service.ingest_article(article_text="b", source_url="u2")
+
+        bundle_calls = [c for c in mock_db.rpc.call_args_list if c.args[0] == "ingest_article_bundle"]
+        assert len(bundle_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_bundle_error_only_affects_its_article(self, service, mock_db):
+        """An error other than a missing function should not disable the bundle."""
+        service.extractor.extract = AsyncMock(return_value=_extraction("Piscine", ["Mairie"]))
+
+        def rpc(name, params):
+            builder = MagicMock()
+            if name == "ingest_article_bundle":
+                builder.execute.side_effect = APIError({
+                    "code": "22007", "message": "invalid input syntax for type date"
+                })
+            else:
+                builder.execute.return_value = MagicMock(data=None)
+            return builder
+        mock_db.rpc.side_effect = rpc
+
+        await service.ingest_article(article_text="a", source_url="u1")
+        await service.ingest_article(article_text="b", source_url="u2")
+
+        bundle_calls = [c for c in mock_db.rpc.call_args_list if c.args[0] == "ingest_article_bundle"]
+        assert len(bundle_calls) == 2
+
+
+class TestExecute:
+    """Tests for _execute."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self, shark_ingestion):
+        """Queries should be executed in a worker thread."""
+        import threading
+        query = MagicMock()
+        query.execute.side_effect = lambda: threading.get_ident()
+
+        thread_id = await shark_ingestion._execute(query)
+
+        assert thread_id != threading.get_ident()
+
+
+class TestFindSimilarProject:
+    """Tests for the pg_trgm project deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_best_match_is_reused(self, mock_db, shark_ingestion):
+        """The find_similar_project match should identify the existing project."""
+        service = shark_ingestion.SharkIngestionService(tenant_id="t1", similarity_threshold=0.7)
+        mock_db.rpc.return_value.execute.return_value = MagicMock(data=[
+            {"project_id": "p1", "project_name": "Ligne B du métro", "similarity_score": 0.82},
+        ])
+        project = MagicMock(location_city="Toulouse", type="infrastructure")
+        project.name = "Ligne B Metro"
+
+        result = await service._find_similar_project(project)
+
+        assert result.found_existing and result.project_id == "p1"
+        mock_db.rpc.assert_called_once_with("find_similar_project", {
+            "p_tenant_id": "t1",
+            "p_name": "Ligne B Metro",
+            "p_location_city": "Toulouse",
+            "p_type": "infrastructure",
+            "p_similarity_threshold": 0.7,
+        })
+
+
+class TestLinkMethods:
+    """Tests for the single-row link writes."""
+
+    @pytest.mark.asyncio
+    async def test_links_are_single_upserts(self, service, mock_db, shark_ingestion):
+        """Links should be written in one request, existing ones left as is."""
+        await service._link_project_organization("p1", "o1", "MOA", "Maître d'ouvrage")
+        await service._link_project_news("p1", "n1")
+
+        minimal = shark_ingestion.ReturnMethod.minimal
+        calls = mock_db.table.return_value.upsert.call_args_list
+        assert [c.kwargs for c in calls] == [
+            {"on_conflict": "project_id,organization_id,role_in_project",
+             "ignore_duplicates": True, "returning": minimal},
+            {"on_conflict": "project_id,news_id", "ignore_duplicates": True, "returning": minimal},
+        ]
+        mock_db.table.return_value.select.assert_not_called()
+
+
+class TestProjectCache:
+    """Tests for the per-instance cache of resolved projects."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_skips_lookup(self, mock_db, shark_ingestion):
+        """A project already resolved should be updated without a new lookup."""
+        service = shark_ingestion.SharkIngestionService(tenant_id="t1")
+        service._find_similar_project = AsyncMock(return_value=shark_ingestion.DedupResult(
+            found_existing=False
+        ))
+        service._create_project = AsyncMock(return_value="p1")
+        service._update_project = AsyncMock()
+
+        first = await service.find_or_create_project(_project("Grand Paris Express"))
+        again = await service.find_or_create_project(_project("Le Grand  Paris Express"))
+
+        assert first == ("p1", False)
+        assert again == ("p1", True)
+        service._find_similar_project.assert_awaited_once()
+        service._update_project.assert_awaited_once()
+
+    def test_least_recently_used_evicted(self, monkeypatch, mock_db, shark_ingestion):
+        """The cache should stay within PROJECT_CACHE_SIZE entries."""
+        monkeypatch.setattr(shark_ingestion, "PROJECT_CACHE_SIZE", 2)
+        service = shark_ingestion.SharkIngestionService(tenant_id="t1")
+
+        for i in range(3):
+            service._remember_project(("t1", f"projet {i}", None, None), f"p{i}")
+
+        assert list(service._project_cache.values()) == ["p1", "p2"]
+
+
+class TestUpsertOrganization:
+    """Tests for the single-row organization upsert."""
+
+    @pytest.mark.asyncio
+    async def test_single_rpc(self, mock_db, shark_ingestion):
+        """Lookup and write should be one shark_upsert_organization call."""
+        service = shark_ingestion.SharkIngestionService(tenant_id="t1")
+        mock_db.rpc.return_value.execute.return_value = MagicMock(data="o1")
+
+        org_id = await service._upsert_organization(_org("Mairie", city="Lyon"), "2025-01-01T00:00:00")
+
+        assert org_id == "o1"
+        mock_db.rpc.assert_called_once_with("shark_upsert_organization", {
+            "p_tenant_id": "t1",
+            "p_name": "Mairie",
+            "p_org_type": None,
+            "p_city": "Lyon",
+            "p_region": None,
+            "p_country": "FR",
+            "p_now": "2025-01-01T00:00:00",
+        })
+        mock_db.table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_lookup(self, mock_db, shark_ingestion):
+        """Without the RPC, the organization should be looked up then inserted."""
+        service = shark_ingestion.SharkIngestionService(tenant_id="t1")
+        mock_db.rpc.return_value.execute.side_effect = Exception("function does not exist")
+        mock_db.table.return_value.select.return_value.eq.return_value.eq.return_value \
+            .execute.return_value = MagicMock(data=[])
+
+        org_id = await service._upsert_organization(_org("Mairie"))
+
+        assert org_id == "o-Mairie-None"
+        assert _tables(mock_db) == ["shark_organizations", "shark_organizations"]
+
+
+class TestIterIngestArticles:
+    """Tests for iter_ingest_articles."""
+
+    @pytest.mark.asyncio
+    async def test_yields_chunk_by_chunk(self, monkeypatch, mock_db, shark_ingestion):
+        """Articles should be read and ingested one chunk at a time, in order."""
+        chunks = []
+
+        async def ingest_articles(self, articles, max_concurrency, force_refresh):
+            chunks.append([a["source_url"] for a in articles])
+            return [shark_ingestion.IngestionResult(success=True, news_id=a["source_url"])
+                    for a in articles]
+
+        monkeypatch.setattr(shark_ingestion.SharkIngestionService, "ingest_articles", ingest_articles)
+        invalidate = MagicMock()
+        monkeypatch.setattr(shark_ingestion, "invalidate_tenant_cache", invalidate)
+        articles = ({"source_url": f"u{i}"} for i in range(5))
+
+        seen = []
+        async for result in shark_ingestion.iter_ingest_articles("t1", articles, chunk_size=2):
+            seen.append(result.news_id)
+            # The next chunk is not ingested before this one is consumed
+            assert len(chunks) == (len(seen) + 1) // 2
+
+        assert seen == ["u0", "u1", "u2", "u3", "u4"]
+        assert chunks == [["u0", "u1"], ["u2", "u3"], ["u4"]]
+        invalidate.assert_called_once_with("t1")
+
+
+# ============================================================
+# TEST: Bulk Organizations
+# ============================================================
+
+class TestUpsertOrganizationsBulk:
+    """Tests for _upsert_organizations_bulk matching."""
+
+    @pytest.mark.asyncio
+    async def test_matches_like_per_row_upserts(self, service, mock_db, shark_ingestion):
+        """Existing and batch-created organizations should be reused in order."""
+        mock_db.table.return_value.select.return_value.eq.return_value.in_.return_value \
+            .execute.return_value = MagicMock(data=[
+                {"id": "o1", "name": "Mairie", "city": "Lyon", "org_type": "Public"},
+            ])
+        orgs = [
+            _org("Mairie"),                  # any city / type: existing o1
+            _org("Mairie", city="Paris"),    # other city: new
+            _org("Région", city="Lyon"),     # new
+            _org("Région"),                  # reuses the Région created above
+        ]
+
+        ids = await service._upsert_organizations_bulk(orgs)
+
+        key = shark_ingestion._org_key
+        assert ids[key(orgs[0])] == "o1"
+        assert ids[key(orgs[1])] == "o-Mairie-Paris"
+        assert ids[key(orgs[2])] == ids[key(orgs[3])]
+
+        updated = mock_db.table.return_value.upsert.call_args
+        assert [row["id"] for row in updated.args[0]] == ["o1"]
+        assert updated.kwargs == {
+            "on_conflict": "id", "returning": shark_ingestion.ReturnMethod.minimal
+        }
+        assert len(mock_db.table.return_value.insert.call_args.args[0]) == 2
+
+
+    @pytest.mark.asyncio
+    async def test_extractions_run_concurrently(self, service):
+        """Extractions should overlap, up to max_concurrency at a time."""
+        in_flight = 0
+        peak = 0
+
+        async def extract(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _extraction(None)
+
+        service.extractor.extract = extract
+        articles = [{"article_text": "x", "source_url": f"u{i}"} for i in range(6)]
+
+        results = await service.ingest_articles(articles, max_concurrency=3)
+
+        assert peak == 3
+        assert all(r.success and r.project_id is None for r in results)
+
+
+# ============================================================
+# TEST: Pending Links
+# ============================================================
+
+class TestPendingLinks:
+    """Tests for _PendingLinks."""
+
+    @pytest.mark.asyncio
+    async def test_first_row_of_a_key_wins(self, shark_ingestion):
+        """Rows sharing the unique key should be written once."""
+        links = shark_ingestion._PendingLinks()
+        db = MagicMock()
+        links.add("shark_project_news", {"project_id": "p1", "news_id": "n1", "role_of_news": "a"})
+        links.add("shark_project_news", {"project_id": "p1", "news_id": "n1", "role_of_news": "b"})
+
+        await links.flush(db)
+
+        rows = db.table.return_value.upsert.call_args.args[0]
+        assert rows == [{"project_id": "p1", "news_id": "n1", "role_of_news": "a"}]
+        db.table.assert_called_once_with("shark_project_news")
+
+    @pytest.mark.asyncio
+    async def test_large_tables_are_chunked(self, monkeypatch, shark_ingestion):
+        """Rows beyond LINK_UPSERT_CHUNK_SIZE should go in several requests."""
+        monkeypatch.setattr(shark_ingestion, "LINK_UPSERT_CHUNK_SIZE", 2)
+        links = shark_ingestion._PendingLinks()
+        db = MagicMock()
+        for i in range(5):
+            links.add("shark_project_news", {"project_id": "p1", "news_id": f"n{i}"})
+
+        await links.flush(db)
+
+        sizes = [len(c.args[0]) for c in db.table.return_value.upsert.call_args_list]
+        assert sizes == [2, 2, 1]
@@ -199,6 +199,244 @@ class TestHelperFunctions:
         print("\n✓ extract_title_from_text OK")
 
 
+# ============================================================
+# EXTRACTION CACHE TESTS (LLM and cache mocked)
+# ============================================================
+
+class TestExtractWithCache:
+    """Tests for extract_with_cache."""
+
+    def _input(self, test_tenant_id):
+        from services.shark_ingestion_service import ArticleIngestionInput
+        return ArticleIngestionInput(
+            tenant_id=test_tenant_id,
+            source_url="https://example.com/a",
+            source_name="Test",
+            published_at=datetime(2025, 1, 15),
+            full_text=ARTICLE_BTP_TOULOUSE
+        )
+
+    def _result(self):
+        from services.shark_project_extractor import (
+            ProjectExtractionResult, ProjectPayload, NewsPayload
+        )
+        return ProjectExtractionResult(
+            project=ProjectPayload(name="Rénovation Izards"),
+            news=NewsPayload(title="Titre", source_url="https://example.com/a", published_at="2025-01-15")
+        )
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_llm(self, monkeypatch, test_tenant_id):
+        """A cached extraction should be returned without calling the extractor."""
+        from unittest.mock import AsyncMock, MagicMock
+        from services import shark_ingestion_service
+
+        extract = AsyncMock()
+        monkeypatch.setattr(shark_ingestion_service, "extract_project_from_article", extract)
+        cache = MagicMock(get=AsyncMock(return_value=self._result().model_dump_json()), put=AsyncMock())
+
+        result = await shark_ingestion_service.extract_with_cache(self._input(test_tenant_id), cache)
+
+        assert result.project.name == "Rénovation Izards"
+        extract.assert_not_called()
+        cache.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_stores_result(self, monkeypatch, test_tenant_id):
+        """An extraction should be stored under its key, tagged with the cache version."""
+        from unittest.mock import AsyncMock, MagicMock
+        from services import shark_ingestion_service
+
+        monkeypatch.setattr(
+            shark_ingestion_service, "extract_project_from_article",
+            AsyncMock(return_value=self._result())
+        )
+        cache = MagicMock(get=AsyncMock(return_value=None), put=AsyncMock())
+
+        await shark_ingestion_service.extract_with_cache(self._input(test_tenant_id), cache)
+
+        key, model, payload, version = cache.put.call_args.args
+        assert key == cache.get.call_args.args[0]
+        assert version == shark_ingestion_service.EXTRACTION_CACHE_VERSION
+        assert "Rénovation Izards" in payload
+
+    def test_key_ignores_tracking_parameters(self, test_tenant_id):
+        """URLs differing only in utm_* parameters should share one cache entry."""
+        from services import shark_ingestion_service
+
+        article = self._input(test_tenant_id)
+        tracked = article.model_copy(update={"source_url": "https://example.com/a?utm_source=x"})
+
+        assert shark_ingestion_service._extraction_cache_key(tracked) == \
+            shark_ingestion_service._extraction_cache_key(article)
+
+    def test_key_follows_extractor_parameters(self, monkeypatch, test_tenant_id):
+        """Changing the extractor's model should change the cache key."""
+        from services import shark_ingestion_service
+
+        before = shark_ingestion_service._extraction_cache_key(self._input(test_tenant_id))
+        monkeypatch.setattr(shark_ingestion_service, "EXTRACTION_MODEL", "gpt-4o-mini")
+
+        assert shark_ingestion_service._extraction_cache_key(self._input(test_tenant_id)) != before
+
+
+# ============================================================
+# PROJECT ENRICHMENT TESTS (database mocked)
+# ============================================================
+
+class TestEnrichExistingProject:
+    """Tests for _enrich_existing_project."""
+
+    @pytest.mark.asyncio
+    async def test_single_rpc(self):
+        """Enrichment should be one enrich_project call (article timestamp), without reading the project."""
+        from unittest.mock import MagicMock
+        from services.shark_ingestion_service import _enrich_existing_project
+        from services.shark_project_extractor import ProjectPayload
+
+        db = MagicMock()
+        project_id = uuid4()
+
+        await _enrich_existing_project(
+            project_id, ProjectPayload(name="Piscine", budget_amount=2e6, sector_tags=["sport"]), db,
+            now_iso="2025-01-15T10:00:00+00:00"
+        )
+
+        db.rpc.assert_called_once_with("enrich_project", {
+            "p_project_id": str(project_id),
+            "p_budget_amount": 2e6,
+            "p_start_date_est": None,
+            "p_end_date_est": None,
+            "p_estimated_scale": None,
+            "p_sector_tags": ["sport"],
+            "p_now": "2025-01-15T10:00:00+00:00",
+        })
+        db.table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_read_then_update(self):
+        """Without the RPC, null fields should still be filled."""
+        from unittest.mock import MagicMock
+        from services.shark_ingestion_service import _enrich_existing_project
+        from services.shark_project_extractor import ProjectPayload
+
+        db = MagicMock()
+        db.rpc.return_value.execute.side_effect = Exception("function does not exist")
+        db.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{"budget_amount": None, "sector_tags": ["sport", "public"]}]
+        )
+
+        await _enrich_existing_project(
+            uuid4(), ProjectPayload(name="Piscine", budget_amount=2e6, sector_tags=["public"]), db
+        )
+
+        update = db.table.return_value.update.call_args.args[0]
+        assert update["budget_amount"] == 2e6
+        # No new tag: sector_tags left as is
+        assert "sector_tags" not in update
+
+
+# ============================================================
+# ORGANIZATION TESTS (database mocked)
+# ============================================================
+
+class TestFindOrCreateOrganizations:
+    """Tests for the bulk organization lookup and links."""
+
+    @pytest.mark.asyncio
+    async def test_one_lookup_and_one_insert(self, test_tenant_id):
+        """Existing orgs should be reused and new ones inserted together, in order."""
+        from unittest.mock import MagicMock
+        from services.shark_ingestion_service import find_or_create_organizations
+        from services.shark_project_extractor import OrganizationPayload
+
+        db = MagicMock()
+        lookup = db.table.return_value.select.return_value.eq.return_value.ilike_any_of
+        lookup.return_value.execute.return_value = MagicMock(data=[
+            {"id": str(uuid4()), "name": "MAIRIE DE LYON", "city": None},
+        ])
+        new_id = uuid4()
+        db.table.return_value.insert.return_value.execute.return_value = MagicMock(
+            data=[{"id": str(new_id)}]
+        )
+
+        resolved = await find_or_create_organizations(test_tenant_id, [
+            OrganizationPayload(name="Mairie de Lyon", city="Lyon"),
+            OrganizationPayload(name="Eiffage, Construction"),
+            OrganizationPayload(name="Eiffage, Construction"),
+        ], db)
+
+        assert [created for _, created in resolved] == [False, True, False]
+        assert resolved[1][0] == resolved[2][0] == new_id
+        assert '"Eiffage, Construction"' in lookup.call_args.args[1]
+        inserted = db.table.return_value.insert.call_args.args[0]
+        assert [row["name"] for row in inserted] == ["Eiffage, Construction"]
+
+    @pytest.mark.asyncio
+    async def test_links_in_one_upsert(self):
+        """Links should be written by one upsert, once per organization and role."""
+        from unittest.mock import MagicMock
+        from services.shark_ingestion_service import link_project_organizations
+        from services.shark_project_extractor import OrganizationPayload
+
+        db = MagicMock()
+        org_id = uuid4()
+        moa = OrganizationPayload(name="Mairie", role_in_project="MOA")
+
+        await link_project_organizations(uuid4(), [(org_id, moa), (org_id, moa)], db)
+
+        upsert = db.table.return_value.upsert
+        upsert.assert_called_once()
+        assert len(upsert.call_args.args[0]) == 1
+        assert upsert.call_args.kwargs["ignore_duplicates"] is True
+
+
+# ============================================================
+# BATCH TESTS (ingestion mocked)
+# ============================================================
+
+class TestIngestArticlesBatch:
+    """Tests for ingest_articles_batch concurrency and error mapping."""
+
+    @pytest.mark.asyncio
+    async def test_articles_run_concurrently_in_order(self, monkeypatch, test_tenant_id):
+        """Articles should overlap up to the limit, results kept in input order."""
+        from services import shark_ingestion_service
+        from services.shark_ingestion_service import (
+            ArticleIngestionInput, IngestionResult, SharkIngestionError
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def ingest(article, use_cache=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if article.source_url.endswith("3"):
+                raise SharkIngestionError("boom", source_url=article.source_url)
+            return IngestionResult(tenant_id=test_tenant_id, news_id=uuid4(), message="OK")
+
+        monkeypatch.setattr(shark_ingestion_service, "ingest_article_as_project", ingest)
+        articles = [
+            ArticleIngestionInput(
+                tenant_id=test_tenant_id,
+                source_url=f"https://example.com/{i}",
+                source_name="Test",
+                published_at=datetime(2025, 1, 15),
+                full_text="Texte de l'article"
+            )
+            for i in range(6)
+        ]
+
+        results = await shark_ingestion_service.ingest_articles_batch(articles, concurrency=3)
+
+        assert peak == 3
+        assert [r.message for r in results] == ["OK"] * 3 + ["Error: boom"] + ["OK"] * 2
+
+
 # ============================================================
 # INTEGRATION TESTS (Require API keys and DB)
 # ============================================================
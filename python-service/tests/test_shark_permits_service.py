@@ -629,6 +629,21 @@ class TestAsyncFunctions:
             # Expected with incomplete mock
             pass
 
+    @pytest.mark.asyncio
+    async def test_ingest_permit_invalidates_graph_cache(self):
+        """Should drop the tenant's cached graph reads, even when a step fails."""
+        from services.shark_permits_service import ingest_permit_as_project
+
+        tenant_id = uuid4()
+        permit = PermitPayload(external_id="PC-TEST-001", city="Paris")
+
+        with patch("services.shark_permits_service._upsert_permit", AsyncMock(side_effect=RuntimeError("boom"))), \
+                patch("services.shark_permits_service.invalidate_tenant_cache") as invalidate:
+            result = await ingest_permit_as_project(permit, tenant_id, MagicMock())
+
+        assert result.message == "error: boom"
+        invalidate.assert_called_once_with(tenant_id)
+
     @pytest.mark.asyncio
     async def test_ingest_permits_bulk(self):
         """Test ingest_permits_bulk returns correct summary."""
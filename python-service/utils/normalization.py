@@ -0,0 +1,62 @@
+"""
+Normalization helpers shared by the Shark ingestion pipelines and agents.
+"""
+
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters dropped by url_canonicalize (prefixes end with "_")
+TRACKING_QUERY_PARAMS = (
+    "utm_", "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid",
+    "xtor", "at_",
+)
+
+
+def url_canonicalize(url: str) -> str:
+    """
+    Canonical form of an article URL, for duplicate detection and caching.
+
+    - Lowercase scheme and host, no fragment
+    - Tracking parameters (utm_*, fbclid, ...) removed, the others sorted
+    - No trailing slash
+    """
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_QUERY_PARAMS)
+    )
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        ""
+    ))
+
+
+# Unicode blocks of the combining marks left by NFD on Latin text (accents,
+# cedillas...). Scanning them only keeps the table small and cheap to build
+COMBINING_MARK_RANGES = (
+    (0x0300, 0x036F),  # Combining Diacritical Marks
+    (0x1AB0, 0x1AFF),  # Combining Diacritical Marks Extended
+    (0x1DC0, 0x1DFF),  # Combining Diacritical Marks Supplement
+    (0x20D0, 0x20FF),  # Combining Diacritical Marks for Symbols
+    (0xFE20, 0xFE2F),  # Combining Half Marks
+)
+
+# str.translate table deleting those combining marks
+STRIP_MARKS = dict.fromkeys(
+    c
+    for start, end in COMBINING_MARK_RANGES
+    for c in range(start, end + 1)
+    if unicodedata.category(chr(c)) == 'Mn'
+)
+
+
+def strip_accents(text: str) -> str:
+    """Text without its accents (NFD-decomposed, combining marks removed)."""
+    return unicodedata.normalize('NFD', text).translate(STRIP_MARKS)
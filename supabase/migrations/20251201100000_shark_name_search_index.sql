@@ -0,0 +1,35 @@
+-- ============================================================
+-- SHARK HUNTER - Indexed name search
+-- ============================================================
+--
+-- list_projects / list_organizations filter on `name ILIKE '%term%'`.
+-- A B-tree index cannot serve a leading-wildcard pattern, so every
+-- search was a sequential scan of the tenant's rows.
+--
+-- Trigram GIN indexes (pg_trgm) serve ILIKE '%term%' directly:
+-- - same substring, case-insensitive semantics as today (partial words
+--   such as "renov" still match "Rénovation")
+-- - no query change needed; the filter through shark_project_full is
+--   pushed down to shark_projects.name
+-- - also used by the BOAMP buyer lookup (`name ILIKE buyer_name`)
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+-- ============================================================
+-- 1. ENABLE pg_trgm
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+
+-- ============================================================
+-- 2. CREATE TRIGRAM INDEXES
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_name_trgm
+    ON shark_projects USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_shark_organizations_name_trgm
+    ON shark_organizations USING gin (name gin_trgm_ops);
@@ -0,0 +1,31 @@
+-- ============================================================
+-- SHARK HUNTER - Indexed location / person name search
+-- ============================================================
+--
+-- Extends the trigram indexes of 20251201100000_shark_name_search_index
+-- to the other columns filtered with ILIKE:
+-- - shark_projects.location_region / location_city: radar and city
+--   filters (`%term%`), BOAMP and permit project matching
+-- - shark_building_permits.city: permit list city filter (`%term%`)
+-- - shark_people.full_name: person reuse lookup (`full_name ILIKE name`)
+--
+-- gin_trgm_ops serves ILIKE as is, so no lower(...) expression index is
+-- needed and the existing filters stay unchanged.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_region_trgm
+    ON shark_projects USING gin (location_region gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_city_trgm
+    ON shark_projects USING gin (location_city gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_shark_permits_city_trgm
+    ON shark_building_permits USING gin (city gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_shark_people_full_name_trgm
+    ON shark_people USING gin (full_name gin_trgm_ops);
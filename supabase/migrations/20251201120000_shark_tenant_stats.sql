@@ -0,0 +1,45 @@
+-- ============================================================
+-- SHARK HUNTER - Tenant stats function
+-- ============================================================
+--
+-- SharkGraphService.get_tenant_stats used four PostgREST requests and
+-- downloaded every project row to count phases in Python. This
+-- function returns all the dashboard counts in one call, with the phase
+-- breakdown done by GROUP BY.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE OR REPLACE FUNCTION shark_tenant_stats(
+    p_tenant_id UUID
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'total_projects',
+        (SELECT COUNT(*) FROM shark_projects WHERE tenant_id = p_tenant_id),
+        'total_organizations',
+        (SELECT COUNT(*) FROM shark_organizations WHERE tenant_id = p_tenant_id),
+        'total_people',
+        (SELECT COUNT(*) FROM shark_people WHERE tenant_id = p_tenant_id),
+        'total_news_items',
+        (SELECT COUNT(*) FROM shark_news_items WHERE tenant_id = p_tenant_id),
+        'projects_by_phase',
+        COALESCE(
+            (SELECT jsonb_object_agg(phase, phase_count)
+             FROM (
+                 SELECT COALESCE(phase, 'detection') AS phase, COUNT(*) AS phase_count
+                 FROM shark_projects
+                 WHERE tenant_id = p_tenant_id
+                 GROUP BY 1
+             ) phases),
+            '{}'::jsonb
+        )
+    );
+$$;
+
+COMMENT ON FUNCTION shark_tenant_stats(UUID)
+IS 'Dashboard counts for a tenant: projects (total and by phase), organizations, people, news items';
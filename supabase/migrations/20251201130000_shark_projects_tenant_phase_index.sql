@@ -0,0 +1,15 @@
+-- ============================================================
+-- SHARK HUNTER - Tenant / phase index for stats
+-- ============================================================
+--
+-- shark_tenant_stats counts a tenant's projects and groups them by
+-- phase. With an index on (tenant_id, phase) both aggregates are
+-- answered by an index-only scan instead of reading the project rows,
+-- so the counts stay live without a materialized view to refresh.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_tenant_phase
+    ON shark_projects(tenant_id, phase);
@@ -0,0 +1,31 @@
+-- ============================================================
+-- SHARK HUNTER - Indexes for project list ordering
+-- ============================================================
+--
+-- list_projects only sorts on created_at, shark_score, budget_amount or
+-- name (PROJECT_ORDER_COLUMNS), always within one tenant. A
+-- (tenant_id, column) index per sort key lets a page be read in index
+-- order with LIMIT, without sorting the tenant's projects. DESC matches
+-- PostgREST's `col.desc` (NULLS FIRST); ascending sorts scan backwards.
+--
+-- Phase-filtered lists in the default order (newest first) get a
+-- (tenant_id, phase, created_at) index.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_tenant_created
+    ON shark_projects(tenant_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_tenant_score
+    ON shark_projects(tenant_id, shark_score DESC);
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_tenant_budget
+    ON shark_projects(tenant_id, budget_amount DESC);
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_tenant_name
+    ON shark_projects(tenant_id, name);
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_tenant_phase_created
+    ON shark_projects(tenant_id, phase, created_at DESC);
@@ -0,0 +1,55 @@
+-- ============================================================
+-- SHARK HUNTER - Batched project organizations
+-- ============================================================
+--
+-- SharkGraphService.get_project_organizations fetched one project's
+-- organizations through a nested PostgREST embed and reshaped every row
+-- in Python. Listing the organizations of N projects meant N requests.
+--
+-- This function returns, for a set of a tenant's projects, one row per
+-- project with its organizations already shaped like the API DTO:
+-- - one round-trip for any number of projects
+-- - projects without organizations come back with '[]'
+-- - projects of another tenant (or unknown ids) are not returned
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE OR REPLACE FUNCTION shark_project_orgs_batch(
+    p_tenant_id UUID,
+    p_project_ids UUID[]
+)
+RETURNS TABLE (project_id UUID, organizations JSONB)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        p.id,
+        COALESCE(
+            jsonb_agg(
+                jsonb_build_object(
+                    'organization_id', o.id,
+                    'organization_name', o.name,
+                    'org_type', o.org_type,
+                    'role_in_project', po.role_in_project,
+                    'raw_role_label', po.raw_role_label,
+                    'lot_name', po.lot_name,
+                    'city', o.city,
+                    'region', o.region,
+                    'website', o.website,
+                    'size_bucket', o.size_bucket
+                )
+            ) FILTER (WHERE po.project_id IS NOT NULL),
+            '[]'::jsonb
+        )
+    FROM shark_projects p
+    LEFT JOIN shark_project_organizations po ON po.project_id = p.id
+    LEFT JOIN shark_organizations o ON o.id = po.organization_id
+    WHERE p.tenant_id = p_tenant_id
+      AND p.id = ANY(p_project_ids)
+    GROUP BY p.id;
+$$;
+
+COMMENT ON FUNCTION shark_project_orgs_batch(UUID, UUID[])
+IS 'Organizations (with role info) of a tenant''s projects, one JSONB array per project';
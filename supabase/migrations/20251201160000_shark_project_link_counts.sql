@@ -0,0 +1,123 @@
+-- ============================================================
+-- SHARK HUNTER - Denormalized organization / news counts
+-- ============================================================
+--
+-- list_projects reads org_count and news_count for every row of a page
+-- through shark_project_full, which re-aggregated the link tables on
+-- each call.
+--
+-- A materialized view would make those reads cheap but:
+-- - materialized views bypass RLS, and shark_project_full exposes
+--   tenant_id precisely so that RLS applies
+-- - REFRESH ... CONCURRENTLY rebuilds every tenant's projects after each
+--   ingestion, and reads in between are stale
+--
+-- Instead the counts live on shark_projects, kept exact by triggers on
+-- the link tables (per-row maintenance, no refresh), and the view reads
+-- them as plain columns. The view stays a regular view under RLS.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+-- ============================================================
+-- 1. COUNT COLUMNS
+-- ============================================================
+
+ALTER TABLE shark_projects
+    ADD COLUMN IF NOT EXISTS org_count INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE shark_projects
+    ADD COLUMN IF NOT EXISTS news_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill (also resyncs the counts when the migration is re-run)
+UPDATE shark_projects p
+SET org_count = (SELECT COUNT(*) FROM shark_project_organizations po WHERE po.project_id = p.id),
+    news_count = (SELECT COUNT(*) FROM shark_project_news pn WHERE pn.project_id = p.id);
+
+
+-- ============================================================
+-- 2. TRIGGERS ON LINK TABLES
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION shark_project_link_count()
+RETURNS TRIGGER AS $$
+DECLARE
+    count_column TEXT := TG_ARGV[0];
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        EXECUTE format('UPDATE shark_projects SET %I = %I + 1 WHERE id = $1',
+                       count_column, count_column)
+        USING NEW.project_id;
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        EXECUTE format('UPDATE shark_projects SET %I = GREATEST(%I - 1, 0) WHERE id = $1',
+                       count_column, count_column)
+        USING OLD.project_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_shark_po_count ON shark_project_organizations;
+CREATE TRIGGER trigger_shark_po_count
+    AFTER INSERT OR DELETE OR UPDATE OF project_id ON shark_project_organizations
+    FOR EACH ROW
+    EXECUTE FUNCTION shark_project_link_count('org_count');
+
+DROP TRIGGER IF EXISTS trigger_shark_pn_count ON shark_project_news;
+CREATE TRIGGER trigger_shark_pn_count
+    AFTER INSERT OR DELETE OR UPDATE OF project_id ON shark_project_news
+    FOR EACH ROW
+    EXECUTE FUNCTION shark_project_link_count('news_count');
+
+
+-- ============================================================
+-- 3. RECREATE shark_project_full
+-- ============================================================
+
+-- p.* now carries org_count / news_count
+DROP VIEW IF EXISTS shark_project_full;
+
+CREATE VIEW shark_project_full AS
+SELECT
+    p.*,
+    -- Organisations liées au projet
+    COALESCE(
+        (SELECT json_agg(
+            json_build_object(
+                'organization_id', o.id,
+                'organization_name', o.name,
+                'org_type', o.org_type,
+                'role_in_project', po.role_in_project,
+                'lot_name', po.lot_name,
+                'city', o.city,
+                'website', o.website
+            )
+        )
+        FROM shark_project_organizations po
+        JOIN shark_organizations o ON o.id = po.organization_id
+        WHERE po.project_id = p.id),
+        '[]'::json
+    ) as organizations,
+    -- News liées au projet
+    COALESCE(
+        (SELECT json_agg(
+            json_build_object(
+                'news_id', n.id,
+                'title', n.title,
+                'source_name', n.source_name,
+                'source_url', n.source_url,
+                'published_at', n.published_at,
+                'role_of_news', pn.role_of_news
+            )
+        )
+        FROM shark_project_news pn
+        JOIN shark_news_items n ON n.id = pn.news_id
+        WHERE pn.project_id = p.id),
+        '[]'::json
+    ) as news_items
+FROM shark_projects p;
+
+COMMENT ON VIEW shark_project_full IS
+    'Vue enrichie d''un projet Shark avec ses organisations et news associées. Expose tenant_id pour le RLS.';
@@ -0,0 +1,39 @@
+-- ============================================================
+-- SHARK HUNTER - Project detail function
+-- ============================================================
+--
+-- SharkGraphService.get_project_full read shark_project_full through a
+-- PostgREST table query, planned again on every call: the view expands
+-- into the project row plus two JSON aggregates.
+--
+-- PL/pgSQL caches the plan of the statements it runs for the life of
+-- the connection, so the detail page only pays for execution.
+-- - plpgsql rather than sql: a plain SQL function would be inlined into
+--   the caller's query and planned each time again
+-- - returns JSONB (the view row, or NULL) instead of the view's row
+--   type, so the view can still be dropped and recreated on its own
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE OR REPLACE FUNCTION shark_get_project_full(
+    p_tenant_id UUID,
+    p_project_id UUID
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN (
+        SELECT to_jsonb(v)
+        FROM shark_project_full v
+        WHERE v.tenant_id = p_tenant_id
+          AND v.id = p_project_id
+    );
+END;
+$$;
+
+COMMENT ON FUNCTION shark_get_project_full(UUID, UUID)
+IS 'A tenant''s project as a shark_project_full row (JSONB), NULL when not found';
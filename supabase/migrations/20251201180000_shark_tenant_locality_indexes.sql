@@ -0,0 +1,37 @@
+-- ============================================================
+-- SHARK HUNTER - Tenant-leading indexes (instead of partitioning)
+-- ============================================================
+--
+-- Every Shark query filters on tenant_id. Hash-partitioning the tables
+-- by tenant_id was considered and rejected:
+-- - a partitioned table's primary key must include the partition key,
+--   so shark_projects / shark_organizations / shark_people /
+--   shark_news_items would need (id, tenant_id) keys and every foreign
+--   key pointing at them (project links, tenders, permits, people)
+--   would have to be rebuilt
+-- - hash partitions spread a tenant over no fewer rows than a
+--   tenant-leading B-tree index range already does
+--
+-- The tenant's rows are instead reached through composite indexes
+-- whose first column is tenant_id, so a query reads one contiguous
+-- index range in the order it needs:
+-- - shark_projects: see 20251201140000_shark_projects_order_indexes
+-- - shark_organizations (tenant_id, name): organization list ordered by
+--   name, organization reuse lookup on (tenant_id, name)
+-- - shark_news_items (tenant_id, crawled_at DESC): ingestion stats
+--   (articles in period, last ingestion, daily breakdown)
+-- - shark_people (tenant_id, linkedin_url): person reuse lookup by
+--   LinkedIn URL (Sherlock enrichment)
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE INDEX IF NOT EXISTS idx_shark_organizations_tenant_name
+    ON shark_organizations(tenant_id, name);
+
+CREATE INDEX IF NOT EXISTS idx_shark_news_tenant_crawled
+    ON shark_news_items(tenant_id, crawled_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_shark_people_tenant_linkedin
+    ON shark_people(tenant_id, linkedin_url);
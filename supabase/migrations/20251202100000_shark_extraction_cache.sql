@@ -0,0 +1,40 @@
+-- ============================================================
+-- SHARK HUNTER - LLM extraction cache
+-- ============================================================
+--
+-- ProjectExtractor calls the LLM for every ingested article, including
+-- articles already extracted (crawler re-fetches, re-runs of a batch).
+--
+-- shark_extraction_cache keeps the raw LLM response of each call under
+-- a content address: SHA-256 of the model parameters and the rendered
+-- prompts (article text included). A re-ingested article with the same
+-- prompt is parsed from the cached response instead of calling the LLM.
+-- Entries expire after 7 days (EXTRACTION_CACHE_TTL).
+--
+-- The responses hold no tenant data of their own (same article, same
+-- extraction), so the table is shared and only the service role uses it.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE TABLE IF NOT EXISTS shark_extraction_cache (
+    cache_key TEXT PRIMARY KEY,  -- SHA-256 hex of model parameters + prompts
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,      -- Raw LLM response (JSON text)
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+-- Purge of expired entries
+CREATE INDEX IF NOT EXISTS idx_shark_extraction_cache_expires
+    ON shark_extraction_cache(expires_at);
+
+ALTER TABLE shark_extraction_cache ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "shark_extraction_cache_service_role" ON shark_extraction_cache;
+CREATE POLICY "shark_extraction_cache_service_role" ON shark_extraction_cache
+    FOR ALL USING (auth.jwt()->>'role' = 'service_role');
+
+COMMENT ON TABLE shark_extraction_cache IS
+    'Raw ProjectExtractor LLM responses by content address (model parameters + prompts), with expiry';
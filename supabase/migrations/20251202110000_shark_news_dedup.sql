@@ -0,0 +1,104 @@
+-- ============================================================
+-- SHARK HUNTER - Duplicate article gate
+-- ============================================================
+--
+-- SharkIngestionService ran the LLM extraction before looking for the
+-- article's news item, so an article already ingested under another
+-- URL (tracking parameters, trailing slash, reordered query string) or
+-- republished by another source was extracted and paid for again.
+--
+-- Each news item now stores:
+-- - canonical_url: source_url without tracking parameters, with a
+--   lowercase host, sorted query parameters and no trailing slash
+-- - simhash: 64-bit SimHash of the article text (signed BIGINT)
+--
+-- shark_find_duplicate_news is called before the extraction and returns
+-- the news item of a matching article, if any:
+-- 1. same canonical_url (or same source_url, for rows ingested before
+--    this migration, which have no canonical_url)
+-- 2. otherwise a SimHash within p_max_distance bits (Hamming distance
+--    through XOR + bit_count)
+--
+-- A Hamming distance search cannot use a btree (or BRIN / GIN) index:
+-- step 2 scans the tenant's fingerprints, which the covering index
+-- below serves as an index-only scan.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+-- ============================================================
+-- 1. FINGERPRINT COLUMNS
+-- ============================================================
+
+ALTER TABLE shark_news_items
+    ADD COLUMN IF NOT EXISTS canonical_url TEXT;
+
+ALTER TABLE shark_news_items
+    ADD COLUMN IF NOT EXISTS simhash BIGINT;
+
+COMMENT ON COLUMN shark_news_items.canonical_url IS
+    'source_url sans paramètres de tracking (utm_*, fbclid...), host en minuscules, paramètres triés';
+COMMENT ON COLUMN shark_news_items.simhash IS
+    'SimHash 64 bits du texte de l''article (détection de quasi-doublons)';
+
+
+-- ============================================================
+-- 2. INDEXES
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_shark_news_tenant_canonical_url
+    ON shark_news_items(tenant_id, canonical_url);
+
+CREATE INDEX IF NOT EXISTS idx_shark_news_tenant_simhash
+    ON shark_news_items(tenant_id) INCLUDE (simhash)
+    WHERE simhash IS NOT NULL;
+
+
+-- ============================================================
+-- 3. LOOKUP FUNCTION
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION shark_find_duplicate_news(
+    p_tenant_id UUID,
+    p_source_url TEXT,
+    p_canonical_url TEXT,
+    p_simhash BIGINT,
+    p_max_distance INTEGER DEFAULT 5
+)
+RETURNS UUID
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_news_id UUID;
+BEGIN
+    SELECT id INTO v_news_id
+    FROM shark_news_items
+    WHERE tenant_id = p_tenant_id
+      AND canonical_url = p_canonical_url
+    LIMIT 1;
+
+    IF v_news_id IS NULL THEN
+        SELECT id INTO v_news_id
+        FROM shark_news_items
+        WHERE tenant_id = p_tenant_id
+          AND source_url = p_source_url
+        LIMIT 1;
+    END IF;
+
+    IF v_news_id IS NULL AND p_simhash IS NOT NULL THEN
+        SELECT id INTO v_news_id
+        FROM shark_news_items
+        WHERE tenant_id = p_tenant_id
+          AND simhash IS NOT NULL
+          AND bit_count((simhash # p_simhash)::BIT(64)) <= p_max_distance
+        LIMIT 1;
+    END IF;
+
+    RETURN v_news_id;
+END;
+$$;
+
+COMMENT ON FUNCTION shark_find_duplicate_news(UUID, TEXT, TEXT, BIGINT, INTEGER)
+IS 'News item of a tenant matching an article by canonical URL or SimHash, NULL when none';
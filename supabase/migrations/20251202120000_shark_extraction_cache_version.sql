@@ -0,0 +1,27 @@
+-- ============================================================
+-- SHARK HUNTER - Prompt version of cached extractions
+-- ============================================================
+--
+-- shark_extraction_cache entries were keyed on the rendered prompts only.
+-- A change to the output models (ExtractedProject...) or to the parsing
+-- of the response leaves the prompts as they were, so stale responses
+-- kept being reused.
+--
+-- ProjectExtractor now has a PROMPT_VERSION, hashed into the cache key
+-- and stored with each entry, so that the entries of a version can be
+-- purged at once (ExtractionCache.invalidate). Entries written before
+-- this migration are labelled 'v0': their keys do not include a version
+-- and are never hit again.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+ALTER TABLE shark_extraction_cache
+    ADD COLUMN IF NOT EXISTS prompt_version TEXT NOT NULL DEFAULT 'v0';
+
+CREATE INDEX IF NOT EXISTS idx_shark_extraction_cache_prompt_version
+    ON shark_extraction_cache(prompt_version);
+
+COMMENT ON COLUMN shark_extraction_cache.prompt_version IS
+    'PROMPT_VERSION de ProjectExtractor ayant produit la réponse';
@@ -0,0 +1,122 @@
+-- ============================================================
+-- SHARK HUNTER - Fuzzy project deduplication
+-- ============================================================
+--
+-- Both ingestion services deduplicate projects through
+-- supabase.rpc("find_similar_project"), but the function was never
+-- created by a migration: every call failed and fell back to an exact
+-- name match, so variants such as "Ligne B du métro" / "Ligne B Metro"
+-- became separate projects.
+--
+-- This migration adds what docs/SHARK_ARCHITECTURE.md describes:
+-- - shark_normalize_name(): lowercase, no accents (unaccent), no French
+--   articles, collapsed whitespace (same steps as normalize_name in
+--   services/shark_ingestion.py)
+-- - shark_projects.normalized_name, kept in sync with name by a trigger,
+--   with a trigram GIN index
+-- - find_similar_project(): the tenant's best match above the threshold,
+--   in the shape the services already read
+--   (project_id, project_name, similarity_score)
+--
+-- The candidate name is normalized in SQL as well, so both sides of the
+-- comparison go through the same function. The `%` operator lets the
+-- index pre-filter on the requested threshold (pg_trgm's own default is
+-- 0.3), which is set for the current transaction only.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+-- ============================================================
+-- 1. NORMALIZATION FUNCTION
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- IMMUTABLE (unaccent() itself is only STABLE) so that it can back an
+-- index; the dictionary is named explicitly for that reason.
+CREATE OR REPLACE FUNCTION shark_normalize_name(p_name TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+SET search_path = public, extensions
+AS $$
+    SELECT btrim(regexp_replace(
+        regexp_replace(
+            unaccent('unaccent'::regdictionary, lower(p_name)),
+            '\y(le|la|les|l''|un|une|des|du|de|d''|au|aux)\y', ' ', 'g'
+        ),
+        '\s+', ' ', 'g'
+    ));
+$$;
+
+COMMENT ON FUNCTION shark_normalize_name(TEXT)
+IS 'Nom normalisé pour la déduplication (minuscules, sans accents ni articles)';
+
+
+-- ============================================================
+-- 2. NORMALIZED NAME COLUMN
+-- ============================================================
+
+ALTER TABLE shark_projects
+    ADD COLUMN IF NOT EXISTS normalized_name TEXT;
+
+CREATE OR REPLACE FUNCTION shark_projects_normalize_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.normalized_name := shark_normalize_name(NEW.name);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_shark_projects_normalized_name ON shark_projects;
+CREATE TRIGGER trigger_shark_projects_normalized_name
+    BEFORE INSERT OR UPDATE OF name, normalized_name ON shark_projects
+    FOR EACH ROW
+    EXECUTE FUNCTION shark_projects_normalize_name();
+
+-- Backfill (also resyncs the column when the migration is re-run)
+UPDATE shark_projects
+SET normalized_name = shark_normalize_name(name)
+WHERE normalized_name IS DISTINCT FROM shark_normalize_name(name);
+
+CREATE INDEX IF NOT EXISTS idx_shark_projects_normalized_name_trgm
+    ON shark_projects USING gin (normalized_name gin_trgm_ops);
+
+
+-- ============================================================
+-- 3. SIMILARITY LOOKUP
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION find_similar_project(
+    p_tenant_id UUID,
+    p_name TEXT,
+    p_location_city TEXT DEFAULT NULL,
+    p_type TEXT DEFAULT NULL,
+    p_similarity_threshold REAL DEFAULT 0.6
+)
+RETURNS TABLE (project_id UUID, project_name TEXT, similarity_score REAL)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_name TEXT := shark_normalize_name(p_name);
+BEGIN
+    -- Threshold of the % operator, for this transaction only
+    PERFORM set_config('pg_trgm.similarity_threshold', p_similarity_threshold::TEXT, true);
+
+    RETURN QUERY
+    SELECT p.id, p.name, similarity(p.normalized_name, v_name)
+    FROM shark_projects p
+    WHERE p.tenant_id = p_tenant_id
+      AND p.normalized_name % v_name
+      AND (p_location_city IS NULL OR p.location_city = p_location_city)
+      AND (p_type IS NULL OR p.type = p_type)
+    ORDER BY 3 DESC
+    LIMIT 1;
+END;
+$$;
+
+COMMENT ON FUNCTION find_similar_project(UUID, TEXT, TEXT, TEXT, REAL)
+IS 'Projet du tenant au nom normalisé le plus proche (pg_trgm), au-dessus du seuil';
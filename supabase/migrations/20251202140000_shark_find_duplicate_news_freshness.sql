@@ -0,0 +1,78 @@
+-- ============================================================
+-- SHARK HUNTER - Duplicate article gate: freshness and project
+-- ============================================================
+--
+-- shark_find_duplicate_news (20251202110000) returned the matching news
+-- item whatever its age, and ingestion answered without the project the
+-- article had been linked to.
+--
+-- It now:
+-- - only matches news items updated since p_fresh_since (NULL: any age),
+--   so an article ingested long ago is extracted again and refreshed
+-- - returns the project linked to the news item along with it
+--
+-- The return type changes, so the function is dropped and recreated.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+DROP FUNCTION IF EXISTS shark_find_duplicate_news(UUID, TEXT, TEXT, BIGINT, INTEGER);
+DROP FUNCTION IF EXISTS shark_find_duplicate_news(UUID, TEXT, TEXT, BIGINT, INTEGER, TIMESTAMPTZ);
+
+CREATE FUNCTION shark_find_duplicate_news(
+    p_tenant_id UUID,
+    p_source_url TEXT,
+    p_canonical_url TEXT,
+    p_simhash BIGINT,
+    p_max_distance INTEGER DEFAULT 5,
+    p_fresh_since TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS TABLE (news_id UUID, project_id UUID)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_news_id UUID;
+    v_since TIMESTAMPTZ := COALESCE(p_fresh_since, '-infinity'::TIMESTAMPTZ);
+BEGIN
+    SELECT n.id INTO v_news_id
+    FROM shark_news_items n
+    WHERE n.tenant_id = p_tenant_id
+      AND n.canonical_url = p_canonical_url
+      AND n.updated_at >= v_since
+    LIMIT 1;
+
+    IF v_news_id IS NULL THEN
+        SELECT n.id INTO v_news_id
+        FROM shark_news_items n
+        WHERE n.tenant_id = p_tenant_id
+          AND n.source_url = p_source_url
+          AND n.updated_at >= v_since
+        LIMIT 1;
+    END IF;
+
+    IF v_news_id IS NULL AND p_simhash IS NOT NULL THEN
+        SELECT n.id INTO v_news_id
+        FROM shark_news_items n
+        WHERE n.tenant_id = p_tenant_id
+          AND n.simhash IS NOT NULL
+          AND bit_count((n.simhash # p_simhash)::BIT(64)) <= p_max_distance
+          AND n.updated_at >= v_since
+        LIMIT 1;
+    END IF;
+
+    IF v_news_id IS NOT NULL THEN
+        RETURN QUERY
+        SELECT v_news_id, (
+            SELECT pn.project_id
+            FROM shark_project_news pn
+            WHERE pn.news_id = v_news_id
+            LIMIT 1
+        );
+    END IF;
+END;
+$$;
+
+COMMENT ON FUNCTION shark_find_duplicate_news(UUID, TEXT, TEXT, BIGINT, INTEGER, TIMESTAMPTZ)
+IS 'News item (and linked project) of a tenant matching an article by canonical URL or SimHash, updated since p_fresh_since';
@@ -0,0 +1,209 @@
+-- ============================================================
+-- SHARK HUNTER - Single-call article ingestion
+-- ============================================================
+--
+-- SharkIngestionService.ingest_article stored an extraction with a chain
+-- of PostgREST requests, each waiting for the previous one:
+-- news item upsert, find_similar_project, project insert or update (plus
+-- a SELECT of sector_tags to merge them), organization lookups and
+-- writes, then the link rows. Every step is a network round-trip.
+--
+-- ingest_article_bundle does the same writes server-side, in one call
+-- and one transaction:
+-- 1. news item: INSERT ... ON CONFLICT (tenant_id, source_url) DO UPDATE
+-- 2. project: best find_similar_project match above the threshold is
+--    updated (non-empty fields only, phase only past 'detection',
+--    sector_tags merged), otherwise a project is created
+-- 3. organizations, in order: same name (and same city / org_type when
+--    given) is updated, otherwise inserted; shark_organizations has no
+--    unique key to upsert on, so this keeps the lookup of the Python code,
+--    under the (tenant, name) advisory lock shark_upsert_organization
+--    takes, so concurrent ingestions cannot insert the same one twice
+-- 4. project-organization and project-news links: ON CONFLICT DO NOTHING
+--
+-- Returns jsonb {project_id, news_id, organization_ids, is_duplicate}.
+-- The payloads are the dicts the service already builds (_news_fields,
+-- ExtractedProject, ExtractedOrganization); missing keys read as NULL.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE OR REPLACE FUNCTION ingest_article_bundle(
+    p_tenant_id UUID,
+    p_news JSONB,
+    p_project JSONB,
+    p_orgs JSONB DEFAULT '[]'::jsonb,
+    p_role_of_news TEXT DEFAULT 'annonce_projet',
+    p_similarity_threshold REAL DEFAULT 0.6,
+    p_now TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_news_id UUID;
+    v_project_id UUID;
+    v_is_duplicate BOOLEAN := FALSE;
+    v_tags JSONB := CASE
+        WHEN jsonb_typeof(p_project->'sector_tags') = 'array' THEN p_project->'sector_tags'
+        ELSE '[]'::jsonb
+    END;
+    v_phase TEXT := NULLIF(p_project->>'phase', '');
+    v_org JSONB;
+    v_org_id UUID;
+    v_org_ids UUID[] := '{}';
+BEGIN
+    -- --------------------------------------------------------
+    -- 1. News item (crawled_at keeps its default: set on insert only)
+    -- --------------------------------------------------------
+    INSERT INTO shark_news_items AS n (
+        tenant_id, source_url, canonical_url, simhash, source_name, title,
+        published_at, region_hint, full_text, updated_at
+    )
+    VALUES (
+        p_tenant_id,
+        p_news->>'source_url',
+        p_news->>'canonical_url',
+        (p_news->>'simhash')::BIGINT,
+        p_news->>'source_name',
+        p_news->>'title',
+        (p_news->>'published_at')::TIMESTAMPTZ,
+        p_news->>'region_hint',
+        p_news->>'full_text',
+        p_now
+    )
+    ON CONFLICT (tenant_id, source_url) DO UPDATE SET
+        canonical_url = EXCLUDED.canonical_url,
+        simhash = EXCLUDED.simhash,
+        source_name = EXCLUDED.source_name,
+        title = EXCLUDED.title,
+        published_at = EXCLUDED.published_at,
+        region_hint = EXCLUDED.region_hint,
+        full_text = EXCLUDED.full_text,
+        updated_at = EXCLUDED.updated_at
+    RETURNING n.id INTO v_news_id;
+
+    -- --------------------------------------------------------
+    -- 2. Project: reuse the closest one, or create it
+    -- --------------------------------------------------------
+    SELECT f.project_id INTO v_project_id
+    FROM find_similar_project(
+        p_tenant_id,
+        p_project->>'name',
+        p_project->>'location_city',
+        p_project->>'type',
+        p_similarity_threshold
+    ) f;
+
+    IF v_project_id IS NOT NULL THEN
+        v_is_duplicate := TRUE;
+
+        UPDATE shark_projects p SET
+            description_short = COALESCE(NULLIF(p_project->>'description_short', ''), p.description_short),
+            budget_amount = COALESCE(NULLIF((p_project->>'budget_amount')::NUMERIC, 0), p.budget_amount),
+            start_date_est = COALESCE(NULLIF(p_project->>'start_date_est', '')::DATE, p.start_date_est),
+            end_date_est = COALESCE(NULLIF(p_project->>'end_date_est', '')::DATE, p.end_date_est),
+            phase = CASE WHEN v_phase <> 'detection' THEN v_phase ELSE p.phase END,
+            estimated_scale = COALESCE(NULLIF(p_project->>'estimated_scale', ''), p.estimated_scale),
+            sector_tags = CASE
+                WHEN v_tags = '[]'::jsonb THEN p.sector_tags
+                ELSE (
+                    SELECT jsonb_agg(DISTINCT t.tag)
+                    FROM jsonb_array_elements(COALESCE(p.sector_tags, '[]'::jsonb) || v_tags) t(tag)
+                )
+            END,
+            updated_at = p_now
+        WHERE p.id = v_project_id;
+    ELSE
+        INSERT INTO shark_projects (
+            tenant_id, name, type, description_short, location_city,
+            location_region, country, budget_amount, budget_currency,
+            start_date_est, end_date_est, phase, sector_tags,
+            estimated_scale, ai_extracted_at
+        )
+        VALUES (
+            p_tenant_id,
+            p_project->>'name',
+            p_project->>'type',
+            p_project->>'description_short',
+            p_project->>'location_city',
+            p_project->>'location_region',
+            COALESCE(NULLIF(p_project->>'country', ''), 'France'),
+            (p_project->>'budget_amount')::NUMERIC,
+            COALESCE(NULLIF(p_project->>'budget_currency', ''), 'EUR'),
+            (p_project->>'start_date_est')::DATE,
+            (p_project->>'end_date_est')::DATE,
+            COALESCE(v_phase, 'detection'),
+            v_tags,
+            COALESCE(NULLIF(p_project->>'estimated_scale', ''), 'Medium'),
+            p_now
+        )
+        RETURNING id INTO v_project_id;
+    END IF;
+
+    -- --------------------------------------------------------
+    -- 3. Organizations and their project links, in order
+    -- --------------------------------------------------------
+    FOR v_org IN SELECT value FROM jsonb_array_elements(COALESCE(p_orgs, '[]'::jsonb)) LOOP
+        PERFORM pg_advisory_xact_lock(hashtextextended(p_tenant_id::TEXT || '/' || (v_org->>'name'), 0));
+
+        SELECT o.id INTO v_org_id
+        FROM shark_organizations o
+        WHERE o.tenant_id = p_tenant_id
+          AND o.name = v_org->>'name'
+          AND (NULLIF(v_org->>'city', '') IS NULL OR o.city = v_org->>'city')
+          AND (NULLIF(v_org->>'org_type', '') IS NULL OR o.org_type = v_org->>'org_type')
+        LIMIT 1;
+
+        IF v_org_id IS NOT NULL THEN
+            UPDATE shark_organizations SET
+                name = v_org->>'name',
+                org_type = COALESCE(NULLIF(v_org->>'org_type', ''), 'Other'),
+                city = v_org->>'city',
+                region = v_org->>'region',
+                country = COALESCE(NULLIF(v_org->>'country', ''), 'France'),
+                updated_at = p_now
+            WHERE id = v_org_id;
+        ELSE
+            INSERT INTO shark_organizations (tenant_id, name, org_type, city, region, country)
+            VALUES (
+                p_tenant_id,
+                v_org->>'name',
+                COALESCE(NULLIF(v_org->>'org_type', ''), 'Other'),
+                v_org->>'city',
+                v_org->>'region',
+                COALESCE(NULLIF(v_org->>'country', ''), 'France')
+            )
+            RETURNING id INTO v_org_id;
+        END IF;
+
+        v_org_ids := v_org_ids || v_org_id;
+
+        INSERT INTO shark_project_organizations (
+            project_id, organization_id, role_in_project, raw_role_label
+        )
+        VALUES (
+            v_project_id, v_org_id, v_org->>'role_in_project', v_org->>'raw_role_label'
+        )
+        ON CONFLICT (project_id, organization_id, role_in_project) DO NOTHING;
+    END LOOP;
+
+    -- --------------------------------------------------------
+    -- 4. Project-news link
+    -- --------------------------------------------------------
+    INSERT INTO shark_project_news (project_id, news_id, role_of_news)
+    VALUES (v_project_id, v_news_id, COALESCE(p_role_of_news, 'annonce_projet'))
+    ON CONFLICT (project_id, news_id) DO NOTHING;
+
+    RETURN jsonb_build_object(
+        'project_id', v_project_id,
+        'news_id', v_news_id,
+        'organization_ids', to_jsonb(v_org_ids),
+        'is_duplicate', v_is_duplicate
+    );
+END;
+$$;
+
+COMMENT ON FUNCTION ingest_article_bundle(UUID, JSONB, JSONB, JSONB, TEXT, REAL, TIMESTAMPTZ)
+IS 'Stocke en un appel la news, le projet (dédupliqué), les organisations et les liens d''un article';
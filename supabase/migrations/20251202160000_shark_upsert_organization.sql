@@ -0,0 +1,79 @@
+-- ============================================================
+-- SHARK HUNTER - Single-call organization upsert
+-- ============================================================
+--
+-- SharkIngestionService._upsert_organization looked the organization up
+-- (same name, and same city / org_type when the extraction has one),
+-- then sent an UPDATE or an INSERT: two round-trips, and two concurrent
+-- ingestions of the same organization could both miss the lookup and
+-- insert it twice.
+--
+-- News items and link tables already have the unique keys their upserts
+-- conflict on. shark_organizations cannot get one on
+-- (tenant_id, name, city, org_type): BOAMP buyers are identified by
+-- SIRET, and distinct buyers may share a name, city and type. A city or
+-- type missing from the extraction also matches any value, which
+-- ON CONFLICT cannot express.
+--
+-- shark_upsert_organization runs the same lookup and write server-side
+-- in one call. A transaction-scoped advisory lock on (tenant, name)
+-- serializes concurrent upserts of the same name, so the lookup of one
+-- sees the row inserted by the other.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE OR REPLACE FUNCTION shark_upsert_organization(
+    p_tenant_id UUID,
+    p_name TEXT,
+    p_org_type TEXT DEFAULT NULL,
+    p_city TEXT DEFAULT NULL,
+    p_region TEXT DEFAULT NULL,
+    p_country TEXT DEFAULT NULL,
+    p_now TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_org_id UUID;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtextextended(p_tenant_id::TEXT || '/' || p_name, 0));
+
+    SELECT o.id INTO v_org_id
+    FROM shark_organizations o
+    WHERE o.tenant_id = p_tenant_id
+      AND o.name = p_name
+      AND (p_city IS NULL OR o.city = p_city)
+      AND (p_org_type IS NULL OR o.org_type = p_org_type)
+    LIMIT 1;
+
+    IF v_org_id IS NOT NULL THEN
+        UPDATE shark_organizations SET
+            name = p_name,
+            org_type = COALESCE(p_org_type, 'Other'),
+            city = p_city,
+            region = p_region,
+            country = COALESCE(p_country, 'France'),
+            updated_at = p_now
+        WHERE id = v_org_id;
+    ELSE
+        INSERT INTO shark_organizations (tenant_id, name, org_type, city, region, country)
+        VALUES (
+            p_tenant_id,
+            p_name,
+            COALESCE(p_org_type, 'Other'),
+            p_city,
+            p_region,
+            COALESCE(p_country, 'France')
+        )
+        RETURNING id INTO v_org_id;
+    END IF;
+
+    RETURN v_org_id;
+END;
+$$;
+
+COMMENT ON FUNCTION shark_upsert_organization(UUID, TEXT, TEXT, TEXT, TEXT, TEXT, TIMESTAMPTZ)
+IS 'Met à jour ou crée une organisation du tenant (même nom, ville / type si fournis), en un appel';
@@ -0,0 +1,62 @@
+-- ============================================================
+-- SHARK HUNTER - Single-statement project enrichment
+-- ============================================================
+--
+-- When an ingested article matches an existing project,
+-- services/shark_ingestion_service.py fills the project's empty fields
+-- from the extraction. It read the current row first, decided in Python
+-- what to change, then sent an UPDATE: two round-trips, and sector_tags
+-- merged into the row by a concurrent ingestion in between were lost.
+--
+-- enrich_project does the same in one UPDATE:
+-- - budget_amount, start_date_est, end_date_est, estimated_scale are
+--   only set when NULL (COALESCE(current, new))
+-- - new sector_tags are appended to the existing ones, without duplicates
+-- - the row (and updated_at) is only touched when something changes
+--
+-- Returns TRUE when the project was enriched.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE OR REPLACE FUNCTION enrich_project(
+    p_project_id UUID,
+    p_budget_amount NUMERIC DEFAULT NULL,
+    p_start_date_est DATE DEFAULT NULL,
+    p_end_date_est DATE DEFAULT NULL,
+    p_estimated_scale TEXT DEFAULT NULL,
+    p_sector_tags JSONB DEFAULT '[]'::jsonb
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_tags JSONB := COALESCE(p_sector_tags, '[]'::jsonb);
+BEGIN
+    UPDATE shark_projects p SET
+        budget_amount = COALESCE(p.budget_amount, p_budget_amount),
+        start_date_est = COALESCE(p.start_date_est, p_start_date_est),
+        end_date_est = COALESCE(p.end_date_est, p_end_date_est),
+        estimated_scale = COALESCE(p.estimated_scale, p_estimated_scale),
+        sector_tags = COALESCE(p.sector_tags, '[]'::jsonb) || COALESCE((
+            SELECT jsonb_agg(DISTINCT t.tag)
+            FROM jsonb_array_elements(v_tags) t(tag)
+            WHERE NOT COALESCE(p.sector_tags, '[]'::jsonb) @> jsonb_build_array(t.tag)
+        ), '[]'::jsonb),
+        updated_at = NOW()
+    WHERE p.id = p_project_id
+      AND (
+          (p.budget_amount IS NULL AND p_budget_amount IS NOT NULL)
+          OR (p.start_date_est IS NULL AND p_start_date_est IS NOT NULL)
+          OR (p.end_date_est IS NULL AND p_end_date_est IS NOT NULL)
+          OR (p.estimated_scale IS NULL AND p_estimated_scale IS NOT NULL)
+          OR NOT COALESCE(p.sector_tags, '[]'::jsonb) @> v_tags
+      );
+
+    RETURN FOUND;
+END;
+$$;
+
+COMMENT ON FUNCTION enrich_project(UUID, NUMERIC, DATE, DATE, TEXT, JSONB)
+IS 'Complète les champs vides d''un projet et fusionne ses sector_tags, en une requête';
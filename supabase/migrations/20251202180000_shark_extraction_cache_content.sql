@@ -0,0 +1,24 @@
+-- ============================================================
+-- SHARK HUNTER - Content of shark_extraction_cache
+-- ============================================================
+--
+-- shark_extraction_cache was described as holding raw ProjectExtractor
+-- LLM responses. services/shark_ingestion_service.py also stores its
+-- parsed ProjectExtractionResult JSON there.
+--
+-- The two kinds of entries are told apart by prompt_version:
+-- - ProjectExtractor's PROMPT_VERSION (e.g. 'v1'): raw LLM response
+-- - 'ingestion-...' (EXTRACTION_CACHE_VERSION): parsed extraction
+-- The version is hashed into cache_key, so they never share an entry.
+--
+-- Only the comments change.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+COMMENT ON TABLE shark_extraction_cache IS
+    'Extractions d''articles par adresse de contenu (paramètres du modèle + prompts), avec expiration : réponses LLM brutes de ProjectExtractor, ou résultats analysés du pipeline d''ingestion (prompt_version ''ingestion-...'')';
+
+COMMENT ON COLUMN shark_extraction_cache.prompt_version IS
+    'Version ayant produit l''entrée : PROMPT_VERSION de ProjectExtractor (réponse brute) ou EXTRACTION_CACHE_VERSION du pipeline d''ingestion (''ingestion-...'', résultat analysé)';
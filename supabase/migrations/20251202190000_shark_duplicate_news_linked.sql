@@ -0,0 +1,76 @@
+-- ============================================================
+-- SHARK HUNTER - Duplicate article gate: linked news items only
+-- ============================================================
+--
+-- shark_find_duplicate_news (20251202140000) matched any recent news
+-- item. News items are written before the project step, and a failed
+-- project or link write leaves the news item without a project: the
+-- article was then reported as already ingested, with no project, and
+-- not extracted again until NEWS_REFRESH_AFTER.
+--
+-- It now only matches news items linked to a project
+-- (shark_project_news), so such an article is extracted and stored again.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+CREATE OR REPLACE FUNCTION shark_find_duplicate_news(
+    p_tenant_id UUID,
+    p_source_url TEXT,
+    p_canonical_url TEXT,
+    p_simhash BIGINT,
+    p_max_distance INTEGER DEFAULT 5,
+    p_fresh_since TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS TABLE (news_id UUID, project_id UUID)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_news_id UUID;
+    v_since TIMESTAMPTZ := COALESCE(p_fresh_since, '-infinity'::TIMESTAMPTZ);
+BEGIN
+    SELECT n.id INTO v_news_id
+    FROM shark_news_items n
+    WHERE n.tenant_id = p_tenant_id
+      AND n.canonical_url = p_canonical_url
+      AND n.updated_at >= v_since
+      AND EXISTS (SELECT 1 FROM shark_project_news pn WHERE pn.news_id = n.id)
+    LIMIT 1;
+
+    IF v_news_id IS NULL THEN
+        SELECT n.id INTO v_news_id
+        FROM shark_news_items n
+        WHERE n.tenant_id = p_tenant_id
+          AND n.source_url = p_source_url
+          AND n.updated_at >= v_since
+          AND EXISTS (SELECT 1 FROM shark_project_news pn WHERE pn.news_id = n.id)
+        LIMIT 1;
+    END IF;
+
+    IF v_news_id IS NULL AND p_simhash IS NOT NULL THEN
+        SELECT n.id INTO v_news_id
+        FROM shark_news_items n
+        WHERE n.tenant_id = p_tenant_id
+          AND n.simhash IS NOT NULL
+          AND bit_count((n.simhash # p_simhash)::BIT(64)) <= p_max_distance
+          AND n.updated_at >= v_since
+          AND EXISTS (SELECT 1 FROM shark_project_news pn WHERE pn.news_id = n.id)
+        LIMIT 1;
+    END IF;
+
+    IF v_news_id IS NOT NULL THEN
+        RETURN QUERY
+        SELECT v_news_id, (
+            SELECT pn.project_id
+            FROM shark_project_news pn
+            WHERE pn.news_id = v_news_id
+            LIMIT 1
+        );
+    END IF;
+END;
+$$;
+
+COMMENT ON FUNCTION shark_find_duplicate_news(UUID, TEXT, TEXT, BIGINT, INTEGER, TIMESTAMPTZ)
+IS 'News item (et projet lié) d''un tenant correspondant à un article par URL canonique ou SimHash, mis à jour depuis p_fresh_since et lié à un projet';
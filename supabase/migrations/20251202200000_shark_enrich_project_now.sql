@@ -0,0 +1,59 @@
+-- ============================================================
+-- SHARK HUNTER - Project enrichment: caller's timestamp
+-- ============================================================
+--
+-- enrich_project (20251202170000) set updated_at = NOW(), while the rest
+-- of an article's rows (news item, organizations, links) are written
+-- with the one timestamp the ingestion service takes per article.
+--
+-- It now takes p_now, like ingest_article_bundle and
+-- shark_upsert_organization. The signature changes, so the previous
+-- function is dropped and recreated.
+--
+-- This is an IDEMPOTENT migration - safe to run multiple times.
+-- ============================================================
+
+
+DROP FUNCTION IF EXISTS enrich_project(UUID, NUMERIC, DATE, DATE, TEXT, JSONB);
+
+CREATE OR REPLACE FUNCTION enrich_project(
+    p_project_id UUID,
+    p_budget_amount NUMERIC DEFAULT NULL,
+    p_start_date_est DATE DEFAULT NULL,
+    p_end_date_est DATE DEFAULT NULL,
+    p_estimated_scale TEXT DEFAULT NULL,
+    p_sector_tags JSONB DEFAULT '[]'::jsonb,
+    p_now TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_tags JSONB := COALESCE(p_sector_tags, '[]'::jsonb);
+BEGIN
+    UPDATE shark_projects p SET
+        budget_amount = COALESCE(p.budget_amount, p_budget_amount),
+        start_date_est = COALESCE(p.start_date_est, p_start_date_est),
+        end_date_est = COALESCE(p.end_date_est, p_end_date_est),
+        estimated_scale = COALESCE(p.estimated_scale, p_estimated_scale),
+        sector_tags = COALESCE(p.sector_tags, '[]'::jsonb) || COALESCE((
+            SELECT jsonb_agg(DISTINCT t.tag)
+            FROM jsonb_array_elements(v_tags) t(tag)
+            WHERE NOT COALESCE(p.sector_tags, '[]'::jsonb) @> jsonb_build_array(t.tag)
+        ), '[]'::jsonb),
+        updated_at = COALESCE(p_now, NOW())
+    WHERE p.id = p_project_id
+      AND (
+          (p.budget_amount IS NULL AND p_budget_amount IS NOT NULL)
+          OR (p.start_date_est IS NULL AND p_start_date_est IS NOT NULL)
+          OR (p.end_date_est IS NULL AND p_end_date_est IS NOT NULL)
+          OR (p.estimated_scale IS NULL AND p_estimated_scale IS NOT NULL)
+          OR NOT COALESCE(p.sector_tags, '[]'::jsonb) @> v_tags
+      );
+
+    RETURN FOUND;
+END;
+$$;
+
+COMMENT ON FUNCTION enrich_project(UUID, NUMERIC, DATE, DATE, TEXT, JSONB, TIMESTAMPTZ)
+IS 'Complète les champs vides d''un projet et fusionne ses sector_tags, en une requête (updated_at = p_now)';